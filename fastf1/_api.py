@@ -1,7 +1,17 @@
 import base64
+import codecs
+import concurrent.futures
 import datetime
+import itertools
 import json
+import multiprocessing
+import re
 import zlib
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Sequence
+)
 
 import numpy as np
 import pandas as pd
@@ -10,7 +20,9 @@ from fastf1.internals.pandas_extensions import create_df_fast
 from fastf1.internals.parsing_helpers import (
     recursive_dict_get,
     to_datetime,
-    to_timedelta
+    to_datetime_array,
+    to_timedelta,
+    to_timedelta_array
 )
 from fastf1.logger import (
     get_logger,
@@ -194,7 +206,7 @@ def _extended_timing_data(path, response=None, livedata=None):
         response = livedata.get("TimingData")
     elif response is None:  # no previous response provided
         _logger.info("Fetching timing data...")
-        response = fetch_page(path, "timing_data")
+        response = fetch_page(path, "timing_data", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -220,9 +232,8 @@ def _extended_timing_data(path, response=None, livedata=None):
     session_split_times = [datetime.timedelta(days=1), ] * 3
 
     for drv in resp_per_driver:
-        drv_laps_data, drv_session_split_times \
-            = _laps_data_driver(resp_per_driver[drv], EMPTY_LAPS, drv)
-        drv_stream_data = _stream_data_driver(resp_per_driver[drv], EMPTY_STREAM, drv)
+        drv_laps_data, drv_session_split_times, drv_stream_data \
+            = _timing_data_driver(resp_per_driver[drv], drv)
 
         if (drv_laps_data is None) or (drv_stream_data is None):
             continue
@@ -260,28 +271,44 @@ def _align_laps(laps_data, stream_data):
     delta = {}
     n_laps = laps_data["NumberOfLaps"].max()
 
+    # group all data by driver once; a driver's laps are accessed by their
+    # position and the stream data is sorted by time for fast lookups
+    drv_lap_times = {
+        drv: times.to_numpy()
+        for drv, times in laps_data.groupby("Driver", sort=False)["Time"]
+    }
+    drv_stream_data = {
+        drv: _sorted_gap_data(drv_data)
+        for drv, drv_data in stream_data.groupby("Driver", sort=False)
+    }
+
+    # drivers that are still running on each lap and drivers that pit in/out
+    # on each lap and need to be skipped
+    active_drivers_per_lap = {}
+    skip_drivers_per_lap = {}
+    is_pit_lap = (~pd.isna(laps_data["PitInTime"])
+                  | ~pd.isna(laps_data["PitOutTime"]))
+    for lap_n, drv, is_pit in zip(laps_data["NumberOfLaps"],
+                                  laps_data["Driver"],
+                                  is_pit_lap,
+                                  strict=True):
+        active_drivers_per_lap.setdefault(lap_n, {})[drv] = None
+        if is_pit:
+            skip_drivers_per_lap.setdefault(lap_n, set()).add(drv)
+
     for offset in range(n_laps):
         leader = None
 
-        # drivers still running on this lap
-        active_drivers = laps_data.loc[
-            laps_data["NumberOfLaps"] == (offset + 1), "Driver"
-        ].unique()
-
-        # drivers that pit in/out on this lap need to be skipped
-        skip_drivers = laps_data.loc[
-            (
-                (laps_data["NumberOfLaps"] == (offset + 1)) &
-                ((~pd.isna(laps_data["PitInTime"])) |
-                 (~pd.isna(laps_data["PitOutTime"])))
-            ), "Driver"
-        ].to_list()
+        active_drivers = list(active_drivers_per_lap.get(offset + 1, ()))
+        skip_drivers = skip_drivers_per_lap.get(offset + 1, set())
 
         for drv in active_drivers:
             if drv in skip_drivers:
                 continue
 
-            gap_str = _get_gap_str_for_drv(drv, offset, laps_data, stream_data)
+            gap_str = _get_gap_str_for_drv(
+                drv_lap_times[drv][offset], drv_stream_data.get(drv)
+            )
             if "LAP" in gap_str:
                 leader = drv
             elif drv not in delta:
@@ -293,8 +320,7 @@ def _align_laps(laps_data, stream_data):
         if leader is None:
             continue
 
-        leader_time \
-            = laps_data[laps_data["Driver"] == leader].iloc[offset]["Time"]
+        leader_time = pd.Timedelta(drv_lap_times[leader][offset])
 
         # if first alignment pass, set current leader as zero point
         # else get already calculated offset of current leader as zero point
@@ -306,8 +332,7 @@ def _align_laps(laps_data, stream_data):
             if drv in delta:
                 continue  # driver already has a delta, skip
 
-            other_time \
-                = laps_data[laps_data["Driver"] == drv].iloc[offset]["Time"]
+            other_time = pd.Timedelta(drv_lap_times[drv][offset])
             is_gap = other_time - leader_time
             # expected_gap is taken from "gap to leader" values
             # is_gap is calculated from difference between when laps where set
@@ -350,49 +375,128 @@ def _align_laps(laps_data, stream_data):
                         f"{unaligned_drivers}")
 
 
-def _get_gap_str_for_drv(drv, idx, laps_data, stream_data):
-    first_time = laps_data[laps_data["Driver"] == drv].iloc[idx]["Time"]
-    ref_idx = (stream_data[stream_data["Driver"] == drv]["Time"]
-               - first_time).abs().idxmin()
-    return stream_data.loc[ref_idx]["GapToLeader"]
+def _sorted_gap_data(drv_stream_data):
+    # stream data timestamps (as integer) with missing values removed and
+    # sorted by time, the original positions of these samples and the
+    # corresponding "gap to leader" values
+    times = drv_stream_data["Time"].to_numpy(dtype="timedelta64[ns]")
+    positions = np.flatnonzero(~np.isnat(times))
+    order = np.argsort(times[positions], kind="stable")
+    positions = positions[order]
+    return (times[positions].view("int64"),
+            positions,
+            drv_stream_data["GapToLeader"].to_numpy()[positions])
+
+
+def _get_gap_str_for_drv(lap_time, sorted_gap_data):
+    # "gap to leader" value of the stream data sample that is closest to
+    # the lap time; if multiple samples are equally close, the first one is
+    # used
+    if (sorted_gap_data is None) or pd.isna(lap_time) \
+            or (len(sorted_gap_data[0]) == 0):
+        raise ValueError("No stream data to align the lap with")
+    times, positions, gaps = sorted_gap_data
+    lap_time = pd.Timedelta(lap_time).value
+
+    # candidates are the first sample at or after the lap time and the first
+    # sample of those with the same time that is directly before it
+    idx = np.searchsorted(times, lap_time)
+    best = None
+    if idx > 0:
+        best = np.searchsorted(times, times[idx - 1])
+    if idx < len(times):
+        if best is None:
+            best = idx
+        else:
+            dist_before = lap_time - times[best]
+            dist_after = times[idx] - lap_time
+            if (dist_after < dist_before) or (
+                    dist_after == dist_before
+                    and positions[idx] < positions[best]):
+                best = idx
+    return gaps[best]
 
 
-def _laps_data_driver(driver_raw, empty_vals, drv):
+def _timing_data_driver(driver_raw, drv):
     """
     .. warning::
         :mod:`fastf1.api` will be considered private in future releases and
         potentially be removed or changed.
 
-    Data is on a per-lap basis.
+    Parse laps data and timing stream data for a single driver in one pass
+    over the raw data.
+
+    Laps data is on a per-lap basis, stream data is on a timestamp basis.
+    Each timestamp is only converted once. Pit out times are held back until
+    the start time of the next lap is known, because a pit out time shortly
+    before the start of a lap belongs to that lap.
 
     Boolean flag 'PitOut' is not evaluated. Meaning is unknown and flag is only sometimes present when a car leaves
     the pits.
 
     Params:
         driver_raw (list): raw api response for this driver only [(Timestamp, data), (...), ...]
-        empty_vals (dict): dictionary of column names and empty column values
         drv (str): driver identifier
 
     Returns:
-         dictionary of laps data for this driver
+         laps data (dictionary), session split times (list) and stream data
+         (dictionary) for this driver; laps data and session split times are
+         None if there is no laps data at all
     """
-
-    integrity_errors = []
-
-    # do a quick first pass over the data to find out when laps start and end
-    # this is needed so we can work with a more efficient "look ahead" on the main pass
-    # example: we can have 'PitOut' 0.01s before a new lap starts, but 'PitOut' belongs to the new lap, not the old one
-
     lapcnt = 0  # we're keeping two separate lap counts because sometimes the api has a non existent lap too much...
     api_lapcnt = 0  # ...at the beginning; we can correct that though;
     # api_lapcnt does not count backwards even if the source data does
     in_past = False  # flag for when the data went back in time
-    out_of_pit = False  # flag set to true when driver drives out FOR THE FIRST TIME; stays true from then on
+
+    personal_best_lap_times = []
+
+    session_split_times = [datetime.timedelta(0)]
+    # start times of (sub)sessions (Q1, Q2, Q3)
+
+    pitstops = -1  # start with -1 because first is out lap, needs to be zero after that
 
     # entries are prefilled with empty values and only overwritten if they exist in the response line
-    drv_data = {key: [val, ] for key, val in empty_vals.items()}
+    drv_data = {key: [val, ] for key, val in EMPTY_LAPS.items()}
+
+    def _ensure_rows(n):
+        # append new empty rows until the data has n rows
+        while len(drv_data["Time"]) < n:
+            for key, val in EMPTY_LAPS.items():
+                drv_data[key].append(val)
+
+    five_seconds = datetime.timedelta(seconds=5)
+
+    # pit out times that belong either to the current lap or to the next lap,
+    # depending on whether the next lap starts less than five seconds later;
+    # list of (time, lap index at that time)
+    pending_pit_out = []
+
+    # timing stream data, each row contains the last known values
+    stream_data = {key: [] for key in EMPTY_STREAM}
+    stream_values = dict(EMPTY_STREAM)
 
     for time, resp in driver_raw:
+        time = to_timedelta(time)
+
+        # stream data: timestamp + any of the values triggers new row
+        new_entry = False
+        if val := recursive_dict_get(resp, "Position"):
+            stream_values["Position"] = int(val)
+            new_entry = True
+        if val := recursive_dict_get(resp, "GapToLeader"):
+            stream_values["GapToLeader"] = val
+            new_entry = True
+        if val := recursive_dict_get(resp, "IntervalToPositionAhead", "Value"):
+            stream_values["IntervalToPositionAhead"] = val
+            new_entry = True
+
+        if new_entry:
+            stream_values["Time"] = time
+            stream_values["Driver"] = drv
+            for key, val in stream_values.items():
+                stream_data[key].append(val)
+
+        # laps data
         # the first three ifs are just edge case handling for the rare sessions were the data goes back in time
         if in_past and "NumberOfLaps" in resp and resp["NumberOfLaps"] == api_lapcnt:
             in_past = False  # we're back in the present
@@ -408,47 +512,24 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
         if in_past:  # still in the past, just continue and ignore everything
             continue
 
-        if ("InPit" in resp) and (resp["InPit"] is False):
-            out_of_pit = True  # drove out of the pits for the first time
+        is_new_lap = "NumberOfLaps" in resp and resp["NumberOfLaps"] > api_lapcnt
 
-        # new lap; create next row
-        if "NumberOfLaps" in resp and resp["NumberOfLaps"] > api_lapcnt:
-            api_lapcnt += 1
-            # make sure the car actually drove out of the pits already; it can't be a new lap if it didn't
-            if out_of_pit:
-                drv_data["Time"][lapcnt] = to_timedelta(time)
-                lapcnt += 1
-                # append a new empty row; last row may not be populated (depending on session) and may be removed later
-                for key, val in empty_vals.items():
-                    drv_data[key].append(val)
-
-    # now, do the main pass where all the other data is actually filled in
-    # same counters and flags as before, reset them
-    lapcnt = 0  # we're keeping two separate lap counts because sometimes the api has a non existent lap too much...
-    api_lapcnt = 0  # ...at the beginning; we can correct that though;
-    # api_lapcnt does not count backwards even if the source data does
-    in_past = False  # flag for when the data went back in time
-
-    personal_best_lap_times = []
-
-    session_split_times = [datetime.timedelta(0)]
-    # start times of (sub)sessions (Q1, Q2, Q3)
-
-    pitstops = -1  # start with -1 because first is out lap, needs to be zero after that
-
-    # iterate through the data; new lap triggers next row in data
-    for time, resp in driver_raw:
-        # the first three ifs are just edge case handling for the rare sessions were the data goes back in time
-        if in_past and "NumberOfLaps" in resp and resp["NumberOfLaps"] == api_lapcnt:
-            in_past = False  # we're back in the present
-        if in_past or ("NumberOfLaps" in resp and resp["NumberOfLaps"] < api_lapcnt):
-            in_past = True
-            continue
+        if is_new_lap and pending_pit_out:
+            # the next lap starts now (pending pit out times imply that the
+            # car already drove out of the pits); pit out times less than five
+            # seconds before the start of the next lap belong to the next lap
+            _ensure_rows(lapcnt + 2)
+            for pit_out_time, lap_idx in pending_pit_out:
+                if time - pit_out_time < five_seconds:
+                    drv_data["PitOutTime"][lap_idx + 1] = pit_out_time
+                else:
+                    drv_data["PitOutTime"][lap_idx] = pit_out_time
+            pending_pit_out.clear()
 
         # values which are up to five seconds late are still counted towards the previous lap
         # (sector times, speed traps and lap times)
         lap_offset = 0
-        if (lapcnt > 0) and (to_timedelta(time) - drv_data["Time"][lapcnt - 1] < pd.Timedelta(5, "s")):
+        if (lapcnt > 0) and (time - drv_data["Time"][lapcnt - 1] < five_seconds):
             lap_offset = 1
 
         if "Sectors" in resp and isinstance(resp["Sectors"], dict):
@@ -458,7 +539,7 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
                                       ("2", "Sector3Time", "Sector3SessionTime")):
                 if val := recursive_dict_get(resp, "Sectors", sn, "Value"):
                     drv_data[sector][lapcnt - lap_offset] = to_timedelta(val)
-                    drv_data[sesst][lapcnt - lap_offset] = to_timedelta(time)
+                    drv_data[sesst][lapcnt - lap_offset] = time
 
         if ((last_lap_time := resp.get("LastLapTime"))
                 and (val := last_lap_time.get("Value")) is not None):
@@ -491,16 +572,16 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
             # 'InPit': True is received once when entering pits, False is received once when leaving
             if resp["InPit"] is True:
                 if pitstops >= 0:
-                    drv_data["PitInTime"][lapcnt] = to_timedelta(time)
-            elif ((("NumberOfLaps" in resp) and resp["NumberOfLaps"] > api_lapcnt)
-                  or (drv_data["Time"][lapcnt] - to_timedelta(time))
-                  < pd.Timedelta(5, "s")):
+                    drv_data["PitInTime"][lapcnt] = time
+            elif is_new_lap:
                 # same response line as beginning of next lap
-                # or beginning of next lap less than 5 seconds away
-                drv_data["PitOutTime"][lapcnt + 1] = to_timedelta(time)  # add to next lap
+                _ensure_rows(lapcnt + 2)
+                drv_data["PitOutTime"][lapcnt + 1] = time  # add to next lap
                 pitstops += 1
             else:
-                drv_data["PitOutTime"][lapcnt] = to_timedelta(time)  # add to current lap
+                # added to the current or the next lap once it is known when
+                # the next lap begins
+                pending_pit_out.append((time, lapcnt))
                 pitstops += 1
 
         # Get save information about personal best lap times at the timestamp
@@ -510,9 +591,7 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
         # logic at then end that correctly marks personal best laps based on
         # the data that is saved here.
         if val := recursive_dict_get(resp, "BestLapTime", "Value"):
-            personal_best_lap_times.append(
-                (to_timedelta(time), to_timedelta(val))
-            )
+            personal_best_lap_times.append((time, to_timedelta(val)))
 
         # Create approximate (sub)session (i.e. quali) split times by
         # (mis)using the session number counter from 'BestLapTimes'. codespell:ignore
@@ -522,22 +601,43 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
         if (val := resp.get("BestLapTimes")) and isinstance(val, dict):
             session_n = int(list(val.keys())[0])
             if (session_n + 1) > len(session_split_times):
-                session_split_times.append(to_timedelta(time))
+                session_split_times.append(time)
 
         # new lap; create next row
-        if "NumberOfLaps" in resp and resp["NumberOfLaps"] > api_lapcnt:
+        if is_new_lap:
             api_lapcnt += 1
             # make sure the car actually drove out of the pits already; it can't be a new lap if it didn't
             if pitstops >= 0:
-                drv_data["Time"][lapcnt] = to_timedelta(time)
+                drv_data["Time"][lapcnt] = time
                 drv_data["NumberOfLaps"][lapcnt] = lapcnt + 1  # don't use F1's lap count; ours is better
                 drv_data["NumberOfPitStops"][lapcnt] = pitstops
                 drv_data["Driver"][lapcnt] = drv
                 lapcnt += 1
+                # append a new empty row; last row may not be populated (depending on session) and may be removed later
+                _ensure_rows(lapcnt + 1)
+
+    # the next lap never started, remaining pit out times belong to the
+    # current lap
+    for pit_out_time, lap_idx in pending_pit_out:
+        drv_data["PitOutTime"][lap_idx] = pit_out_time
 
+    drv_laps_data, session_split_times = _finalize_laps_data_driver(
+        drv_data, lapcnt, pitstops, personal_best_lap_times,
+        session_split_times, drv
+    )
+    return drv_laps_data, session_split_times, stream_data
+
+
+def _finalize_laps_data_driver(drv_data, lapcnt, pitstops,
+                               personal_best_lap_times, session_split_times,
+                               drv):
+    # postprocessing of the laps data of a single driver after all data has
+    # been read; returns the final laps data and session split times
     if lapcnt == 0:  # no data at all for this driver
         return None, None
 
+    integrity_errors = []
+
     # done reading the data, do postprocessing
 
     def data_in_lap(lap_n):
@@ -771,57 +871,6 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
     return drv_data, session_split_times
 
 
-def _stream_data_driver(driver_raw, empty_vals, drv):
-    """
-    .. warning::
-        :mod:`fastf1.api` will be considered private in future releases and
-        potentially be removed or changed.
-
-    Data is on a timestamp basis.
-
-    Params:
-        driver_raw (list): raw api response for this driver only [(Timestamp, data), (...), ...]
-        empty_vals (dict): dictionary of column names and empty column values
-        drv (str): driver identifier
-
-    Returns:
-         dictionary of timing stream data for this driver
-    """
-    # entries are prefilled with empty or previous values and only overwritten if they exist in the response line
-    # basically interpolation by filling up with last known value because not every value is in every response
-    drv_data = {key: [val, ] for key, val in empty_vals.items()}
-    i = 0
-
-    # iterate through the data; timestamp + any of the values triggers new row in data
-    for time, resp in driver_raw:
-        new_entry = False
-        if val := recursive_dict_get(resp, "Position"):
-            drv_data["Position"][i] = int(val)
-            new_entry = True
-        if val := recursive_dict_get(resp, "GapToLeader"):
-            drv_data["GapToLeader"][i] = val
-            new_entry = True
-        if val := recursive_dict_get(resp, "IntervalToPositionAhead", "Value"):
-            drv_data["IntervalToPositionAhead"][i] = val
-            new_entry = True
-
-        # at least one value was present, create next row
-        if new_entry:
-            drv_data["Time"][i] = to_timedelta(time)
-            drv_data["Driver"][i] = drv
-            i += 1
-
-            # create next row of data from the last values; there will always be one row too much at the end which is
-            # removed again
-            for key in empty_vals:
-                drv_data[key].append(drv_data[key][-1])
-
-    for key in drv_data:
-        drv_data[key] = drv_data[key][:-1]  # remove very last row again
-
-    return drv_data
-
-
 @Cache.api_request_wrapper
 def timing_app_data(path, response=None, livedata=None):
     """
@@ -866,7 +915,7 @@ def timing_app_data(path, response=None, livedata=None):
         response = livedata.get("TimingAppData")
     elif response is None:  # no previous response provided
         _logger.info("Fetching timing app data...")
-        response = fetch_page(path, "timing_app_data")
+        response = fetch_page(path, "timing_app_data", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -918,8 +967,425 @@ def timing_app_data(path, response=None, livedata=None):
     return pd.DataFrame(data)
 
 
+class _SampleBuffer:
+    """Growable column-major buffer for decoded telemetry samples.
+
+    Rows of integer values are collected in a flat staging list and are
+    periodically converted in blocks into a preallocated two-dimensional
+    int64 array with one row per column. The capacity of this array is
+    doubled whenever it is exhausted. This avoids keeping a Python tuple per
+    sample and the large intermediate object array that is otherwise
+    required for converting the samples into typed columns.
+
+    Rows that contain values which cannot be converted to integers are
+    dropped when the staging list is flushed. The number of dropped rows is
+    available as :attr:`n_invalid`.
+    """
+    _BLOCK_ROWS = 4096
+
+    def __init__(self, n_columns: int):
+        self._n_columns = n_columns
+        self._values = np.empty((n_columns, self._BLOCK_ROWS), dtype="int64")
+        self._length = 0
+        self._staged = []
+        self._staged_limit = self._BLOCK_ROWS * n_columns
+        self.n_invalid = 0
+
+    @property
+    def n_columns(self) -> int:
+        return self._n_columns
+
+    def append(self, row: tuple):
+        self._staged.extend(row)
+        if len(self._staged) >= self._staged_limit:
+            self._flush()
+
+    def _flush(self):
+        if not self._staged:
+            return
+
+        try:
+            block = np.array(self._staged, dtype="int64")
+        except (TypeError, ValueError, OverflowError):
+            block = self._convert_valid_rows()
+        block = block.reshape(-1, self._n_columns).T
+        self._staged = []
+
+        n_rows = block.shape[1]
+        end = self._length + n_rows
+        if end > self._values.shape[1]:
+            capacity = max(end, 2 * self._values.shape[1])
+            values = np.empty((self._n_columns, capacity), dtype="int64")
+            values[:, :self._length] = self._values[:, :self._length]
+            self._values = values
+
+        self._values[:, self._length:end] = block
+        self._length = end
+
+    def _convert_valid_rows(self) -> np.ndarray:
+        # slow path, only used if a block contains invalid values
+        n = self._n_columns
+        rows = []
+        for i in range(0, len(self._staged), n):
+            try:
+                rows.append(np.array(self._staged[i:i+n], dtype="int64"))
+            except (TypeError, ValueError, OverflowError):
+                self.n_invalid += 1
+        if not rows:
+            return np.empty(0, dtype="int64")
+        return np.concatenate(rows)
+
+    def columns(self) -> np.ndarray:
+        """Return a ``(n_columns, n_samples)`` array of all samples."""
+        self._flush()
+        return self._values[:, :self._length]
+
+
+#: Maximum number of raw telemetry records outside a time window that are
+#: decompressed to determine :attr:`fastf1.core.Session.t0_date`
+_DATE_OFFSET_SAMPLE_SIZE = 1000
+
+
+def _format_session_time(td) -> str:
+    # formats a session time like the timestamps of the raw records
+    # ('00:00:00.000'), negative values are clipped to zero
+    ms = max(pd.Timedelta(td) // pd.Timedelta(1, "ms"), 0)
+    seconds, ms = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
+
+
+def _records_in_time_window(records, is_livedata: bool, time_window) \
+        -> tuple[Sequence, np.ndarray]:
+    """Split the raw records into those with a session timestamp within
+    ``time_window`` and all others.
+
+    The timestamps of records from the API are compared as strings, so that
+    records outside the time window are skipped before they are decoded.
+    Returns the records within the time window and the indices of all other
+    records in ``records``.
+    """
+    if is_livedata:
+        # timestamps were already converted when loading the data
+        low, high = (pd.Timedelta(td) for td in time_window)
+        is_inside = np.fromiter((low <= rec[0] <= high for rec in records),
+                                dtype=bool, count=len(records))
+    else:
+        low, high = (_format_session_time(td) for td in time_window)
+        if isinstance(records, _RecordLines):
+            is_inside = records.prefix_range_mask(low, high)
+        else:
+            is_inside = np.fromiter(
+                (low <= rec[:12] <= high for rec in records),
+                dtype=bool, count=len(records)
+            )
+
+    inside_indices = np.flatnonzero(is_inside)
+    if isinstance(records, _RecordLines):
+        inside = records.take(inside_indices)
+    else:
+        inside = [records[i] for i in inside_indices.tolist()]
+    return inside, np.flatnonzero(~is_inside)
+
+
+def _max_date_offset(records, indices: np.ndarray, is_livedata: bool,
+                     date_key: str) -> pd.Timestamp | None:
+    """Calculate the latest ``Date - Time`` of the samples in some of the
+    raw records.
+
+    This is the value from which :attr:`fastf1.core.Session.t0_date` is
+    calculated. If there are more than :data:`_DATE_OFFSET_SAMPLE_SIZE`
+    records, only an evenly spaced sample of that many records is used. The
+    records are only decompressed and the dates of the samples are extracted
+    from the text, which is much faster than decoding the records. None is
+    returned if the records contain no samples.
+
+    Args:
+        records: raw records of car data or position data
+        indices: indices of the records in ``records`` that are used
+        is_livedata: whether the records are from live timing data
+        date_key: name of the date of a sample in the records ('Utc' for
+            car data, 'Timestamp' for position data)
+    """
+    if len(indices) > _DATE_OFFSET_SAMPLE_SIZE:
+        indices = indices[np.linspace(0, len(indices) - 1,
+                                      _DATE_OFFSET_SAMPLE_SIZE).round()
+                          .astype(int)]
+
+    pattern = re.compile(rf'"{date_key}":\s*"([^"]+)"')
+    times, dates = [], []
+    for i in indices.tolist():
+        record = records[i]
+        if is_livedata:
+            time, text = record[0], record[1]
+        else:
+            time, text = record[:12], record[12:]
+        try:
+            text = zlib.decompress(base64.b64decode(text.strip('"')),
+                                   -zlib.MAX_WBITS).decode("utf-8-sig")
+        except Exception:
+            # invalid records are skipped when decoding as well
+            continue
+        record_dates = pattern.findall(text)
+        times.extend([time] * len(record_dates))
+        dates.extend(record_dates)
+
+    return _latest_date_offset(to_datetime_array(dates),
+                               to_timedelta_array(times))
+
+
+def _latest_date_offset(dates: np.ndarray, times: np.ndarray) \
+        -> pd.Timestamp | None:
+    # latest 'Date - Time' of the given samples; None if there are no valid
+    # samples
+    offsets = dates - times
+    offsets = offsets[~np.isnat(offsets)]
+    if not len(offsets):
+        return None
+    return pd.Timestamp(offsets.max())
+
+
+class _TelemetryData(dict):
+    """Telemetry data of all or of some drivers.
+
+    Additionally holds the latest ``Date - Time`` of all samples of all
+    drivers (``None`` if there are none). This includes samples that are not
+    part of the data, because their driver was not selected or because they
+    are outside of the requested time window. This way,
+    :attr:`fastf1.core.Session.t0_date` is the same as if all data was
+    loaded.
+    """
+    def __init__(self, data: dict, date_offset: pd.Timestamp | None):
+        super().__init__(data)
+        self.date_offset = date_offset
+
+    def select(self, keys: Iterable[str]) -> "_TelemetryData":
+        """Return new data that only contains the given keys.
+
+        Keys that do not exist are ignored. The date offset is kept.
+        """
+        keys = set(keys)
+        return _TelemetryData(
+            {key: value for key, value in self.items() if key in keys},
+            self.date_offset
+        )
+
+
+def _split_record(record, is_livedata: bool):
+    # returns the raw session timestamp and the decoded message
+    ts_length = 12  # length of timestamp: len('00:00:00:000')
+    if is_livedata:
+        return record[0], parse(record[1], zipped=True)
+    return record[:ts_length], parse(record[ts_length:], zipped=True)
+
+
+def _decode_car_data(records, is_livedata: bool,
+                     drivers: frozenset[str] | None = None) \
+        -> tuple[dict[str, list[np.ndarray]], int]:
+    """Decode raw car data records into typed columns per driver.
+
+    Returns a dictionary with one list of arrays per driver (Time, Date, RPM,
+    Speed, nGear, Throttle, Brake, DRS) and the number of records that
+    could not be decoded. If a selection of ``drivers`` is given, only the
+    Time and Date arrays are returned for all other drivers.
+    """
+    buffers: dict[str, _SampleBuffer] = {}
+    # timestamps are shared by all drivers; each sample of a driver only
+    # stores the index of its entry in this timeline
+    timeline_times = []
+    timeline_dates = []
+    decode_error_count = 0
+
+    for record in records:
+        try:
+            time, jrecord = _split_record(record, is_livedata)
+
+            for entry in jrecord["Entries"]:
+                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
+                # number of millisecond decimal points
+                date = entry["Utc"]
+                index = len(timeline_dates)
+                timeline_times.append(time)
+                timeline_dates.append(date)
+
+                for drv, car in entry["Cars"].items():
+                    if (buffer := buffers.get(drv)) is None:
+                        selected = (drivers is None) or (drv in drivers)
+                        buffer = buffers[drv] = _SampleBuffer(7 if selected
+                                                              else 1)
+
+                    try:
+                        channels = car["Channels"]
+                        rpm = channels["0"]
+                        speed = channels["2"]
+                        ngear = channels["3"]
+                        throttle = channels["4"]
+                        brake = channels["5"]
+                        drs = channels.get("45", 0)
+                        # drs is no longer included in 2026
+
+                    except KeyError:
+                        continue
+
+                    if buffer.n_columns == 1:
+                        # not selected, only the timestamps are required
+                        buffer.append((index, ))
+                        continue
+
+                    buffer.append((index, rpm, speed, ngear, throttle,
+                                   brake, drs))
+
+        except Exception:
+            # too risky to specify an exception: unexpected invalid data!
+            decode_error_count += 1
+            continue
+
+    times = to_timedelta_array(timeline_times)
+    dates = to_datetime_array(timeline_dates)
+
+    arrays = {}
+    for drv, buffer in buffers.items():
+        values = buffer.columns()
+        decode_error_count += buffer.n_invalid
+        arrays[drv] = [times[values[0]], dates[values[0]], *values[1:]]
+
+    return arrays, decode_error_count
+
+
+def _decode_position_data(records, is_livedata: bool,
+                          drivers: frozenset[str] | None = None) \
+        -> tuple[dict[str, list[np.ndarray]], int]:
+    """Decode raw position data records into typed columns per driver.
+
+    Returns a dictionary with one list of arrays per driver (Time, Date,
+    Status, X, Y, Z) and the number of records that could not be decoded.
+    If a selection of ``drivers`` is given, only the Time and Date arrays are
+    returned for all other drivers.
+    """
+    buffers: dict[str, _SampleBuffer] = {}
+    # timestamps are shared by all drivers; each sample of a driver only
+    # stores the index of its entry in this timeline
+    timeline_times = []
+    timeline_dates = []
+    status_codes = {}  # status value -> integer code
+    decode_error_count = 0
+
+    for record in records:
+        try:
+            time, jrecord = _split_record(record, is_livedata)
+
+            for sample in jrecord["Position"]:
+                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
+                # number of millisecond decimal points
+                date = sample["Timestamp"]
+                index = len(timeline_dates)
+                timeline_times.append(time)
+                timeline_dates.append(date)
+
+                for drv, entry in sample["Entries"].items():
+                    if (buffer := buffers.get(drv)) is None:
+                        selected = (drivers is None) or (drv in drivers)
+                        buffer = buffers[drv] = _SampleBuffer(5 if selected
+                                                              else 1)
+
+                    try:
+                        x = entry["X"]
+                        y = entry["Y"]
+                        z = entry["Z"]
+                    except KeyError:
+                        continue
+
+                    if buffer.n_columns == 1:
+                        # not selected, only the timestamps are required
+                        buffer.append((index, ))
+                        continue
+
+                    status = entry.get("Status")
+                    if str(status).isdigit():
+                        # Fallback on older api status mapping and convert
+                        status = "OffTrack" if int(status) else "OnTrack"
+
+                    if (code := status_codes.get(status)) is None:
+                        code = status_codes[status] = len(status_codes)
+
+                    buffer.append((index, code, x, y, z))
+
+        except Exception:
+            # too risky to specify an exception: unexpected invalid data!
+            decode_error_count += 1
+            continue
+
+    times = to_timedelta_array(timeline_times)
+    dates = to_datetime_array(timeline_dates)
+
+    categories = np.empty(len(status_codes), dtype=object)
+    for status, code in status_codes.items():
+        categories[code] = status
+
+    arrays = {}
+    for drv, buffer in buffers.items():
+        values = buffer.columns()
+        decode_error_count += buffer.n_invalid
+        if buffer.n_columns == 1:
+            arrays[drv] = [times[values[0]], dates[values[0]]]
+            continue
+        arrays[drv] = [times[values[0]], dates[values[0]],
+                       categories[values[1]], *values[2:]]
+
+    return arrays, decode_error_count
+
+
+def _decode_records(decode_func, records, is_livedata: bool,
+                    workers: int | None,
+                    drivers: frozenset[str] | None = None) \
+        -> tuple[dict[str, list[np.ndarray]], int]:
+    """Decode raw telemetry records, optionally using a pool of worker
+    processes.
+
+    If more than one worker is requested, the records are split into
+    consecutive chunks which are decoded in parallel. The per-driver columns
+    of all chunks are concatenated afterwards, in the original order of the
+    records.
+    """
+    if (workers is None) or (workers <= 1) or (len(records) < 2):
+        return decode_func(records, is_livedata, drivers)
+
+    n_chunks = min(len(records), 4 * workers)
+    chunk_size = -(-len(records) // n_chunks)  # ceil division
+    chunks = [records[i:i+chunk_size]
+              for i in range(0, len(records), chunk_size)]
+
+    # the workers are always spawned, forking a process that has already
+    # started threads (e.g. for prefetching pages) may deadlock
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        results = list(executor.map(decode_func, chunks,
+                                    itertools.repeat(is_livedata),
+                                    itertools.repeat(drivers)))
+
+    # drivers are ordered by their first occurrence, same as when decoding
+    # serially
+    chunk_arrays = {}
+    decode_error_count = 0
+    for arrays, error_count in results:
+        decode_error_count += error_count
+        for drv, drv_arrays in arrays.items():
+            chunk_arrays.setdefault(drv, []).append(drv_arrays)
+
+    arrays = {}
+    for drv, drv_chunks in chunk_arrays.items():
+        arrays[drv] = [np.concatenate(columns)
+                       for columns in zip(*drv_chunks, strict=True)]
+
+    return arrays, decode_error_count
+
+
 @Cache.api_request_wrapper
-def car_data(path, response=None, livedata=None):
+def car_data(path, response=None, livedata=None, workers=None,
+             drivers=None, time_window=None):
     """
     .. warning::
         :mod:`fastf1.api` will be considered private in future releases and
@@ -956,11 +1422,24 @@ def car_data(path, response=None, livedata=None):
         path (str): api path base string (usually ``Session.api_path``)
         response: Response as returned by :func:`fetch_page` can be passed if it was downloaded already.
         livedata: An instance of :class:`fastf1.livetiming.data.LiveTimingData` to use as a source instead of the api
+        workers: Number of worker processes that are used for decompressing and decoding the raw data. By default,
+            the data is decoded in the current process. Using multiple processes has a startup overhead and is only
+            beneficial for large amounts of data, like the data of a full race.
+        drivers: Driver numbers (as string) of the drivers for which data is returned. The samples of all other
+            drivers are skipped while decoding the raw data, only their timestamps are still used to determine
+            :attr:`fastf1.core.Session.t0_date` independently of the selection. By default, data is returned for
+            all drivers.
+        time_window: Tuple ``(start, end)`` of session times (as timedelta). Only the raw records with a timestamp
+            within this window are decoded. Records outside the window are only decompressed to determine
+            :attr:`fastf1.core.Session.t0_date` independently of the window. If there are more than 1000 of them,
+            only an evenly spaced sample of 1000 records is decompressed. By default, all records are decoded. Data
+            for a time window is not saved in the stage 2 cache.
 
     Returns:
         | A dictionary containing one pandas DataFrame per driver. Dictionary keys are the driver's numbers as
           string (e.g. '16'). You should never assume that a number exists!
         | Each dataframe contains one column for each data channel as listed above
+        | The dictionary additionally holds the latest ``Date - Time`` of all samples as attribute ``date_offset``
 
     Raises:
         SessionNotAvailableError: in case the F1 livetiming api returns no data
@@ -980,6 +1459,14 @@ def car_data(path, response=None, livedata=None):
                 "recently, please try again in a few minutes."
             )
 
+    outside_offset = None
+    if time_window is not None:
+        inside, outside = _records_in_time_window(response, is_livedata,
+                                                  time_window)
+        outside_offset = _max_date_offset(response, outside, is_livedata,
+                                          "Utc")
+        response = inside
+
     _logger.info("Parsing car data...")
 
     numeric_channels = ["RPM", "Speed", "nGear", "Throttle", "DRS"]
@@ -987,79 +1474,43 @@ def car_data(path, response=None, livedata=None):
     columns = ["Time", "Date", "RPM", "Speed", "nGear", "Throttle", "Brake",
                "DRS", "Source"]  # correct order required!
 
-    ts_length = 12  # length of timestamp: len('00:00:00:000')
-
-    data = {}
-    decode_error_count = 0
-
-    for record in response:
-        try:
-            if is_livedata:
-                time = to_timedelta(record[0])
-                jrecord: dict = parse(record[1], zipped=True)
-            else:
-                time = to_timedelta(record[:ts_length])
-                jrecord: dict = parse(record[ts_length:], zipped=True)
-
-            for entry in jrecord["Entries"]:
-                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
-                # number of millisecond decimal points
-                # always remove last char ('z'), max len 26, right pad to len
-                # 26 with zeroes if shorter
-                date = to_datetime(entry["Utc"])
-
-                for drv in entry["Cars"]:
-                    if drv not in data:
-                        # initialize dict entry for this driver
-                        data[drv] = []
+    if drivers is not None:
+        drivers = frozenset(drivers)
 
-                    try:
-                        rpm = entry["Cars"][drv]["Channels"]["0"]
-                        speed = entry["Cars"][drv]["Channels"]["2"]
-                        ngear = entry["Cars"][drv]["Channels"]["3"]
-                        throttle = entry["Cars"][drv]["Channels"]["4"]
-                        brake = entry["Cars"][drv]["Channels"]["5"]
-                        drs = entry["Cars"][drv]["Channels"].get("45", 0)
-                        # drs is no longer included in 2026
-
-                    except KeyError:
-                        continue
-
-                    data[drv].append((time, date, rpm, speed, ngear, throttle,
-                                      brake, drs, "car"))
-
-        except Exception:
-            # too risky to specify an exception: unexpected invalid data!
-            decode_error_count += 1
-            continue
+    arrays, decode_error_count = _decode_records(
+        _decode_car_data, response, is_livedata, workers, drivers
+    )
 
     if decode_error_count > 0:
         _logger.warning(f"Car data: failed to decode {decode_error_count} "
                         f"messages ({len(response)} messages total)")
 
-    # create one dataframe per driver and check for the longest dataframe
-    most_complete_ref = None
-    for drv in data:
-        arr_all = np.array(data[drv])
-        time = arr_all[:, 0].astype("timedelta64[ns]")
-        date = arr_all[:, 1].astype("datetime64[ns]")
-        rpm = arr_all[:, 2].astype("int64")
-        speed = arr_all[:, 3].astype("int64")
-        ngear = arr_all[:, 4].astype("int64")
-        throttle = arr_all[:, 5].astype("int64")
-        brake = arr_all[:, 6].astype("int64")  # converted to bool later
-        drs = arr_all[:, 7].astype("int64")
-        source = arr_all[:, 8].astype("object")
+    # the latest 'Date - Time' of all drivers, including the ones that are
+    # not selected, and of the samples outside the time window
+    offsets = [_latest_date_offset(drv_arrays[1], drv_arrays[0])
+               for drv_arrays in arrays.values()]
+    date_offset = max((offset for offset in (*offsets, outside_offset)
+                       if offset is not None), default=None)
 
+    # create one dataframe per driver and check for the longest dataframe;
+    # drivers that are not selected are only considered for the latter
+    data = {}
+    ref_dates = None
+    for drv, drv_arrays in arrays.items():
+        if (ref_dates is None) or (len(drv_arrays[1]) > len(ref_dates)):
+            ref_dates = drv_arrays[1]
+
+        if (drivers is not None) and (drv not in drivers):
+            continue
+
+        source = np.full(len(drv_arrays[0]), "car", dtype=object)
         data[drv] = create_df_fast(
-            arrays=[time, date,
-                    rpm, speed, ngear, throttle, brake, drs, source],
+            arrays=[*drv_arrays, source],  # brake is converted to bool later
             columns=columns
         )
 
-        if (most_complete_ref is None) \
-                or (len(data[drv]["Date"]) > len(most_complete_ref)):
-            most_complete_ref = data[drv]["Date"]
+    if ref_dates is not None:
+        most_complete_ref = pd.Series(ref_dates, name="Date")
 
     for drv in data:
         # if everything is well, all dataframes should have the same length
@@ -1095,11 +1546,12 @@ def car_data(path, response=None, livedata=None):
             .fillna(value=False, inplace=False) \
             .astype("bool")
 
-    return data
+    return _TelemetryData(data, date_offset)
 
 
 @Cache.api_request_wrapper
-def position_data(path, response=None, livedata=None):
+def position_data(path, response=None, livedata=None, workers=None,
+                  drivers=None, time_window=None):
     """
     .. warning::
         :mod:`fastf1.api` will be considered private in future releases and
@@ -1121,11 +1573,24 @@ def position_data(path, response=None, livedata=None):
         path (str): api path base string (usually ``Session.api_path``)
         response: Response as returned by :func:`fetch_page` can be passed if it was downloaded already.
         livedata: An instance of :class:`fastf1.livetiming.data.LiveTimingData` to use as a source instead of the api
+        workers: Number of worker processes that are used for decompressing and decoding the raw data. By default,
+            the data is decoded in the current process. Using multiple processes has a startup overhead and is only
+            beneficial for large amounts of data, like the data of a full race.
+        drivers: Driver numbers (as string) of the drivers for which data is returned. The samples of all other
+            drivers are skipped while decoding the raw data, only their timestamps are still used to determine
+            :attr:`fastf1.core.Session.t0_date` independently of the selection. By default, data is returned for
+            all drivers.
+        time_window: Tuple ``(start, end)`` of session times (as timedelta). Only the raw records with a timestamp
+            within this window are decoded. Records outside the window are only decompressed to determine
+            :attr:`fastf1.core.Session.t0_date` independently of the window. If there are more than 1000 of them,
+            only an evenly spaced sample of 1000 records is decompressed. By default, all records are decoded. Data
+            for a time window is not saved in the stage 2 cache.
 
     Returns:
         | A dictionary containing one pandas DataFrame per driver. Dictionary keys are the driver's numbers as
           string (e.g. '16'). You should never assume that a number exists!
         | Each dataframe contains one column for each data channel as listed above
+        | The dictionary additionally holds the latest ``Date - Time`` of all samples as attribute ``date_offset``
 
     Raises:
         SessionNotAvailableError: in case the F1 livetiming api returns no data
@@ -1145,87 +1610,60 @@ def position_data(path, response=None, livedata=None):
                 "recently, please try again in a few minutes."
             )
 
+    outside_offset = None
+    if time_window is not None:
+        inside, outside = _records_in_time_window(response, is_livedata,
+                                                  time_window)
+        outside_offset = _max_date_offset(response, outside, is_livedata,
+                                          "Timestamp")
+        response = inside
+
     _logger.info("Parsing position data...")
 
     if not response:
-        return {}
+        return _TelemetryData({}, outside_offset)
 
-    ts_length = 12  # length of timestamp: len('00:00:00:000')
     columns = ["Time", "Date", "Status", "X", "Y", "Z",
                "Source"]  # correct order required!
 
-    data = {}
-    decode_error_count = 0
+    if drivers is not None:
+        drivers = frozenset(drivers)
 
-    for record in response:
-        try:
-            if is_livedata:
-                time = record[0]
-                jrecord: dict = parse(record[1], zipped=True)
-            else:
-                time = to_timedelta(record[:ts_length])
-                jrecord: dict = parse(record[ts_length:], zipped=True)
-
-            for sample in jrecord["Position"]:
-                # date format is '2020-08-08T09:45:03.0619797Z' with a varying
-                # number of millisecond decimal points
-                # always remove last char ('z'), max len 26, right pad to len
-                # 26 with zeroes if shorter
-                date = to_datetime(sample["Timestamp"])
-
-                for drv in sample["Entries"]:
-                    if drv not in data:
-                        # initialize dict entry for this driver
-                        data[drv] = []
-
-                    try:
-                        x = sample["Entries"][drv]["X"]
-                        y = sample["Entries"][drv]["Y"]
-                        z = sample["Entries"][drv]["Z"]
-                    except KeyError:
-                        continue
-
-                    try:
-                        status = sample["Entries"][drv]["Status"]
-                    except KeyError:
-                        status = None
-                    if str(status).isdigit():
-                        # Fallback on older api status mapping and convert
-                        status = "OffTrack" if int(status) else "OnTrack"
-
-                    data[drv].append((time, date, status, x, y, z, "pos"))
-
-        except Exception:
-            # too risky to specify an exception: unexpected invalid data!
-            decode_error_count += 1
-            continue
+    arrays, decode_error_count = _decode_records(
+        _decode_position_data, response, is_livedata, workers, drivers
+    )
 
     if decode_error_count > 0:
         _logger.warning(
             f"Position data: failed to decode {decode_error_count} "
             f"messages ({len(response)} messages total)")
 
-    # create one dataframe per driver and check for the longest dataframe
-    most_complete_ref = None
-    for drv in data:
-        arr_all = np.array(data[drv])
-        time = arr_all[:, 0].astype("timedelta64[ns]")
-        date = arr_all[:, 1].astype("datetime64[ns]")
-        status = arr_all[:, 2].astype("object")
-        x = arr_all[:, 3].astype("int64")
-        y = arr_all[:, 4].astype("int64")
-        z = arr_all[:, 5].astype("int64")
-        source = arr_all[:, 6].astype("object")
+    # the latest 'Date - Time' of all drivers, including the ones that are
+    # not selected, and of the samples outside the time window
+    offsets = [_latest_date_offset(drv_arrays[1], drv_arrays[0])
+               for drv_arrays in arrays.values()]
+    date_offset = max((offset for offset in (*offsets, outside_offset)
+                       if offset is not None), default=None)
+
+    # create one dataframe per driver and check for the longest dataframe;
+    # drivers that are not selected are only considered for the latter
+    data = {}
+    ref_dates = None
+    for drv, drv_arrays in arrays.items():
+        if (ref_dates is None) or (len(drv_arrays[1]) > len(ref_dates)):
+            ref_dates = drv_arrays[1]
+
+        if (drivers is not None) and (drv not in drivers):
+            continue
 
+        source = np.full(len(drv_arrays[0]), "pos", dtype=object)
         data[drv] = create_df_fast(
-            arrays=[time, date, status, x, y, z, source],
+            arrays=[*drv_arrays, source],
             columns=columns
         )
 
-        # check length of dataframe; sometimes there can be missing data
-        if (most_complete_ref is None) \
-                or (len(data[drv]["Date"]) > len(most_complete_ref)):
-            most_complete_ref = data[drv]["Date"]
+    if ref_dates is not None:
+        most_complete_ref = pd.Series(ref_dates, name="Date")
 
     # if everything is well, all dataframes should have the same length and no
     # postprocessing is necessary
@@ -1250,7 +1688,7 @@ def position_data(path, response=None, livedata=None):
             _logger.warning(f"Driver {drv: >2}: Position data is "
                             f"incomplete!")
 
-    return data
+    return _TelemetryData(data, date_offset)
 
 
 @Cache.api_request_wrapper
@@ -1301,7 +1739,7 @@ def track_status_data(path, response=None, livedata=None):
         response = livedata.get("TrackStatus")
     elif response is None:
         _logger.info("Fetching track status data...")
-        response = fetch_page(path, "track_status")
+        response = fetch_page(path, "track_status", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -1357,7 +1795,7 @@ def session_status_data(path, response=None, livedata=None):
         response = livedata.get("SessionStatus")
     elif response is None:
         _logger.info("Fetching session status data...")
-        response = fetch_page(path, "session_status")
+        response = fetch_page(path, "session_status", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -1428,7 +1866,7 @@ def race_control_messages(path, response=None, livedata=None):
         response = livedata.get("RaceControlMessages")
     elif response is None:
         _logger.info("Fetching race control messages...")
-        response = fetch_page(path, "race_control_messages")
+        response = fetch_page(path, "race_control_messages", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -1500,7 +1938,7 @@ def lap_count(path, response=None, livedata=None):
         response = livedata.get("LapCount")
     elif response is None:
         _logger.info("Fetching lap count data...")
-        response = fetch_page(path, "lap_count")
+        response = fetch_page(path, "lap_count", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -1559,7 +1997,7 @@ def driver_info(path, response=None, livedata=None):
         response = livedata.get("DriverList")
     elif response is None:
         _logger.info("Fetching driver list...")
-        response = fetch_page(path, "driver_list")
+        response = fetch_page(path, "driver_list", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -1651,7 +2089,7 @@ def weather_data(path, response=None, livedata=None):
         response = livedata.get("WeatherData")
     elif response is None:
         _logger.info("Fetching weather data...")
-        response = fetch_page(path, "weather_data")
+        response = fetch_page(path, "weather_data", stream=True)
         if response is None:  # no response received
             raise SessionNotAvailableError(
                 "No data for this session! If this session only finished "
@@ -1741,7 +2179,109 @@ def session_info(path, response=None, livedata=None):
     return data
 
 
-def fetch_page(path, name):
+class _RecordLines(Sequence):
+    """Lazily decoded records of a jsonStream response.
+
+    The raw response body is kept as bytes, together with the start and end
+    offsets of all records. A record is only decoded to a string when it is
+    accessed. Compared to decoding the whole body and splitting it into a
+    list of strings, this avoids holding the text of the response in memory
+    a second time, which matters for the large telemetry streams.
+
+    Slicing returns a new object that holds a copy of only the raw data of
+    the selected records.
+    """
+    def __init__(self, content: bytes):
+        start = len(codecs.BOM_UTF8) \
+            if content.startswith(codecs.BOM_UTF8) else 0
+        # records are terminated by '\r\n'; trailing data without line
+        # terminator is ignored
+        ends = np.fromiter(self._find_all(content, b"\r\n", start),
+                           dtype="int64")
+        starts = np.empty_like(ends)
+        if len(ends):
+            starts[0] = start
+            starts[1:] = ends[:-1] + 2
+        self._content = content
+        self._starts = starts
+        self._ends = ends
+
+    @staticmethod
+    def _find_all(content: bytes, sub: bytes, start: int) -> Iterator[int]:
+        while (pos := content.find(sub, start)) != -1:
+            yield pos
+            start = pos + len(sub)
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            indices = range(len(self))[item]
+            if (len(indices) == 0) or (indices.step != 1):
+                return _RecordLines(
+                    b"".join(self._raw(i) + b"\r\n" for i in indices)
+                )
+            return _RecordLines(
+                self._content[self._starts[indices.start]
+                              :self._ends[indices[-1]] + 2]
+            )
+        return self._raw(range(len(self))[item]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        content = self._content
+        for start, end in zip(self._starts.tolist(), self._ends.tolist(),
+                              strict=True):
+            yield content[start:end].decode("utf-8")
+
+    def _raw(self, i: int) -> bytes:
+        return self._content[self._starts[i]:self._ends[i]]
+
+    def prefix_range_mask(self, low: str, high: str) -> np.ndarray:
+        """Return a boolean mask of the records that start with a prefix
+        between ``low`` and ``high`` (inclusive), without decoding the
+        records.
+
+        Prefixes are compared as strings, the length of the prefix is that
+        of ``low``.
+        """
+        low, high = low.encode(), high.encode()
+        n = len(low)
+        content = self._content
+        return np.fromiter(
+            (low <= content[start:start + n] <= high
+             for start in self._starts.tolist()),
+            dtype=bool, count=len(self)
+        )
+
+    def take(self, indices: Iterable[int]) -> "_RecordLines":
+        """Return the records at the given indices, without decoding the
+        records.
+        """
+        content = self._content
+        starts, ends = self._starts, self._ends
+        return _RecordLines(b"".join(content[starts[i]:ends[i] + 2]
+                                     for i in indices))
+
+
+def _iter_stream_entries(records: _RecordLines, zipped: bool) \
+        -> Iterator[list]:
+    # parses the records of a jsonStream response into [timestamp, content]
+    decode_error_count = 0
+    tl = 12  # length of timestamp: len('00:00:00:000')
+    for e in records:
+        try:
+            yield [e[:tl], parse(e[tl:], zipped=zipped)]
+        except json.JSONDecodeError:
+            decode_error_count += 1
+            continue
+    if decode_error_count > 0:
+        _logger.warning(f"Failed to decode {decode_error_count}"
+                        f" messages ({len(records)} messages "
+                        f"total)")
+
+
+def fetch_page(path, name, stream=False):
     """
     .. warning::
         :mod:`fastf1.api` will be considered private in future releases and
@@ -1753,11 +2293,17 @@ def fetch_page(path, name):
     Args:
         path (str): api path base string (usually ``Session.api_path``)
         name (str): page name (see ``api.pages`` for all known pages)
+        stream (bool): If True, the entries of a jsonStream are parsed lazily
+            while iterating over the returned generator, instead of being
+            returned as a list. The generator can only be iterated once.
 
     Returns:
         - dictionary if content was json
         - list of entries if jsonStream, where each entry again contains two elements: [timestamp, content]. Content is
           parsed with :func:`parse` and will usually be a dictionary created from json data.
+        - a generator of entries if jsonStream and ``stream=True``
+        - for car data and position data, a sequence of the raw records as strings; the records are only decoded
+          when they are accessed
         - None if request failed
 
     """
@@ -1773,27 +2319,16 @@ def fetch_page(path, name):
                                headers=headers)
 
     if r.status_code == 200:
-        raw = r.content.decode("utf-8-sig")
         if is_stream:
-            records = raw.split("\r\n")[:-1]  # last split is empty
+            records = _RecordLines(r.content)
             if name in ("position", "car_data"):
                 # Special case to improve memory efficiency
                 return records
-            decode_error_count = 0
-            tl = 12  # length of timestamp: len('00:00:00:000')
-            ret = []
-            for e in records:
-                try:
-                    ret.append([e[:tl], parse(e[tl:], zipped=is_z)])
-                except json.JSONDecodeError:
-                    decode_error_count += 1
-                    continue
-            if decode_error_count > 0:
-                _logger.warning(f"Failed to decode {decode_error_count}"
-                                f" messages ({len(records)} messages "
-                                f"total)")
-            return ret
-        return parse(raw, is_z)
+            entries = _iter_stream_entries(records, is_z)
+            if stream:
+                return entries
+            return list(entries)
+        return parse(r.content.decode("utf-8-sig"), is_z)
     return None
 
 
@@ -1,9 +1,14 @@
 import collections
+import concurrent.futures
 import re
 import warnings
+import weakref
 from collections.abc import (
     Callable,
-    Iterable
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping
 )
 from functools import cached_property
 from typing import (
@@ -22,6 +27,10 @@ from fastf1 import (
     ergast,
     exceptions
 )
+from fastf1.internals import (
+    columnar_cache,
+    interpolation
+)
 from fastf1.internals.pandas_base import (
     BaseDataFrame,
     BaseSeries
@@ -36,6 +45,7 @@ from fastf1.mvapi import (
     CircuitInfo,
     get_circuit_info
 )
+from fastf1.req import Cache
 
 
 def __getattr__(name):
@@ -198,6 +208,21 @@ class Telemetry(BaseDataFrame):
         "DistanceToDriverAhead": "float64"
     }
 
+    _COMPACT_COLUMNS = {
+        "X": "float32",
+        "Y": "float32",
+        "Z": "float32",
+        "Status": "category",
+        "Speed": "float32",
+        "RPM": "float32",
+        "Throttle": "float32",
+        "DRS": "int8",
+        "nGear": "int8",
+        "Source": "category",
+    }
+    """Data types that replace the default data types of some channels in
+    compact telemetry (see ``compact_dtypes`` in :meth:`Session.load`)"""
+
     _metadata = ["session", "driver"]
     _internal_names = pd.DataFrame._internal_names + ["base_class_view"]
     _internal_names_set = set(_internal_names)
@@ -207,11 +232,15 @@ class Telemetry(BaseDataFrame):
                  session: "Session" = None,
                  driver: str = None,
                  drop_unknown_channels: bool = False,
+                 _compact_dtypes: bool = False,
                  **kwargs):
         super().__init__(*args, **kwargs)
         self.session: Session | None = session
         self.driver = driver
 
+        if _compact_dtypes:
+            self._cast_columns({**self._COLUMNS, **self._COMPACT_COLUMNS})
+
         if drop_unknown_channels:
             unknown = set(self.columns).difference(self._CHANNELS.keys())
             # `self` cannot be rebound here, so the drop must be inplace
@@ -227,6 +256,24 @@ class Telemetry(BaseDataFrame):
     def _constructor(self):
         return Telemetry
 
+    def _get_sorted_time_index(self) -> np.ndarray | None:
+        # Returns the 'SessionTime' values as integer nanoseconds if they are
+        # sorted and contain no missing values, else None. This is checked
+        # on every call, as the values may have been modified in place. NaT
+        # is the smallest integer value, therefore, sorted values contain no
+        # NaT if the first value is not NaT.
+        if "SessionTime" not in self.columns:
+            return None
+        values = self["SessionTime"].to_numpy()
+        if values.dtype != "timedelta64[ns]":
+            return None
+
+        index = values.view("int64")
+        if len(index) and (np.isnat(values[0])
+                           or np.any(index[1:] < index[:-1])):
+            return None
+        return index
+
     @property
     def base_class_view(self):
         """For a nicer debugging experience; can view DataFrame through this
@@ -374,13 +421,37 @@ class Telemetry(BaseDataFrame):
             d = self.merge_channels(edges, frequency="original")
 
         else:
-            d = self.copy()  # TODO no copy?
+            d = self
+
+        if pd.isna(start_time) or pd.isna(end_time):
+            data_slice = None
+
+        elif (time_index := d._get_sorted_time_index()) is not None:
+            # sorted data, the slice is a contiguous range of rows
+            i_first = np.searchsorted(time_index,
+                                      pd.Timedelta(start_time).value,
+                                      side="left")
+            i_last = np.searchsorted(time_index,
+                                     pd.Timedelta(end_time).value,
+                                     side="right") - 1
+            if i_first <= i_last:
+                if pad and pad_side in ("both", "before"):
+                    i_first = max(0, i_first - pad)
+                if pad and pad_side in ("both", "after"):
+                    i_last = min(len(d), i_last + pad)
+                data_slice = d.iloc[i_first: i_last + 1].copy()
+            else:
+                data_slice = None
 
-        sel = ((d["SessionTime"] <= end_time)
-               & (d["SessionTime"] >= start_time))
-        if np.any(sel):
-            data_slice = d.slice_by_mask(sel, pad, pad_side)
+        else:
+            sel = ((d["SessionTime"] <= end_time)
+                   & (d["SessionTime"] >= start_time))
+            if np.any(sel):
+                data_slice = d.slice_by_mask(sel, pad, pad_side)
+            else:
+                data_slice = None
 
+        if data_slice is not None:
             if "Time" in data_slice.columns:
                 # shift time to 0 so laps can overlap
                 data_slice.loc[:, "Time"] \
@@ -442,6 +513,15 @@ class Telemetry(BaseDataFrame):
                 :attr:`~Telemetry.TELEMETRY_FREQUENCY`.
                 (Either string 'original' or integer for a frequency in Hz)
         """
+        if not frequency:
+            frequency = self.TELEMETRY_FREQUENCY
+
+        merged = self._merge_channels_arrays(other, frequency)
+        if merged is not None:
+            return merged
+
+        # General implementation based on pandas, used for data that is not
+        # supported by _merge_channels_arrays.
         # merge the data and interpolate missing; 'Date' needs to be the index
         data = self.set_index("Date")
         other = other.set_index("Date")
@@ -456,6 +536,20 @@ class Telemetry(BaseDataFrame):
                 if col not in dtype_map:
                     dtype_map[col] = df[col].dtype
 
+        # categorical columns (compact telemetry) are merged as objects,
+        # because the categories of both objects can differ and filling
+        # missing values can add new categories; they are restored without
+        # fixed categories
+        categorical = [col for col, dtype in dtype_map.items()
+                       if isinstance(dtype, pd.CategoricalDtype)]
+        if categorical:
+            for col in categorical:
+                dtype_map[col] = "category"
+            data = data.astype({col: object for col in categorical
+                                if col in data.columns})
+            other = other.astype({col: object for col in categorical
+                                  if col in other.columns})
+
         # Exclude columns existing on both dataframes from one dataframe
         # before merging (cannot merge with duplicates)
         on_both_columns = set(other.columns).intersection(set(data.columns))
@@ -471,9 +565,6 @@ class Telemetry(BaseDataFrame):
         if "Driver" in merged.columns and len(merged["Driver"].unique()) > 1:
             raise ValueError("Cannot merge multiple drivers")
 
-        if not frequency:
-            frequency = data.TELEMETRY_FREQUENCY
-
         i = data.get_first_non_zero_time_index()
         if i is None:
             raise ValueError("No valid 'Time' data. Cannot resample!")
@@ -569,6 +660,240 @@ class Telemetry(BaseDataFrame):
 
         return merged
 
+    def _merge_channels_arrays(
+            self,
+            other: Union["Telemetry", pd.DataFrame],
+            frequency: int | Literal["original"]
+    ) -> Optional["Telemetry"]:
+        # Implements merge_channels directly on the arrays of both objects.
+        # The result is the same as merging with pandas, updating the columns
+        # that exist in both objects and then calling fill_missing or
+        # resampling each channel, but each column is only created once.
+        # Returns None if the data is not supported, in which case the pandas
+        # implementation needs to be used.
+        columns = self._merge_columns(other)
+        if columns is None:
+            return None
+        dates, merged, dtype_map = columns
+
+        if frequency != "original":
+            # resampling drops all columns that are not a known channel,
+            # after which the pandas implementation fails to restore their
+            # data type; leave this case to the pandas implementation
+            resampled = {ch for ch, info in self._CHANNELS.items()
+                         if info["type"] in ("continuous", "discrete")}
+            resampled.update(("Source", "SessionTime", "Time"))
+            if ("Source" not in merged) \
+                    or not resampled.issuperset(dtype_map):
+                return None
+
+        if ("Driver" in merged) and (len(pd.unique(merged["Driver"])) > 1):
+            raise ValueError("Cannot merge multiple drivers")
+
+        i = self.get_first_non_zero_time_index()
+        if i is None:
+            raise ValueError("No valid 'Time' data. Cannot resample!")
+
+        if frequency == "original":
+            # interpolate missing values, same as fill_missing
+            x = dates.view("int64")
+            for ch, info in self._CHANNELS.items():
+                if ch not in merged:
+                    continue
+                if info["type"] == "continuous":
+                    method = info["method"]
+                    merged[ch] = interpolation.interpolate(
+                        x, merged[ch], method,
+                        interpolation.limit_direction(method)
+                    )
+                elif info["type"] == "discrete":
+                    merged[ch] = interpolation.ffill_bfill(merged[ch])
+            session = other.session
+            source = other
+        else:
+            dates, merged = self._resample_merged(dates, merged, dates[i],
+                                                  frequency)
+            session = self.session
+            source = self
+
+        if "Source" in merged:
+            source_values = merged["Source"]
+            is_missing = pd.isna(source_values)
+            if is_missing.any():
+                source_values = source_values.astype(object)
+                source_values[is_missing] = "interpolation"
+                merged["Source"] = source_values
+
+        session_time = dates - session.t0_date.to_datetime64()
+        merged["SessionTime"] = session_time
+        merged["Time"] = session_time - session_time[0]
+
+        self._restore_dtypes(merged, dtype_map)
+
+        return Telemetry({"Date": dates, **merged}).__finalize__(source)
+
+    def _merge_columns(
+            self,
+            other: Union["Telemetry", pd.DataFrame]
+    ) -> tuple[np.ndarray, dict[str, np.ndarray], dict[str, Any]] | None:
+        # Merges all columns of both objects onto the union of their
+        # timelines. Returns the timeline, the merged columns (in the
+        # column order of a pandas merge) and the data types from before
+        # merging, or None if the data is not supported.
+        if ((not isinstance(other, Telemetry))
+                or ("Date" not in self.columns)
+                or ("Date" not in other.columns)):
+            return None
+
+        dates_right = self["Date"].to_numpy()
+        dates_left = other["Date"].to_numpy()
+        if ((dates_right.dtype != "datetime64[ns]")
+                or (dates_left.dtype != "datetime64[ns]")):
+            return None
+
+        # collect the values of all columns; values of self take precedence
+        # over those of other for columns that exist in both, as with
+        # DataFrame.update
+        columns = {}  # name -> (values of other, values of self)
+        dtype_map = {}
+        for df, pos in ((self, 1), (other, 0)):
+            arrays = self._column_arrays(df)
+            if arrays is None:
+                return None
+            for col, (values, dtype) in arrays.items():
+                dtype_map.setdefault(col, dtype)
+                columns.setdefault(col, [None, None])[pos] = values
+
+        timeline = interpolation.union_timeline(dates_left, dates_right)
+        if timeline is None:
+            return None
+        dates, take_left, take_right = timeline
+
+        # column order of the pandas merge: all columns of other, then the
+        # remaining columns of self
+        order = [col for col in other.columns if col != "Date"]
+        order.extend(col for col in self.columns
+                     if (col != "Date") and (col not in order))
+
+        merged = {}
+        for col in order:
+            values_left, values_right = columns[col]
+            if values_left is None:
+                merged[col] = interpolation.take(values_right, take_right)
+                continue
+            values = interpolation.take(values_left, take_left)
+            if values_right is not None:
+                update = interpolation.take(values_right, take_right)
+                has_update = ~pd.isna(update)
+                if has_update.any():
+                    values = np.where(has_update, update, values)
+            merged[col] = values
+
+        return dates, merged, dtype_map
+
+    def _column_arrays(
+            self,
+            df: "Telemetry"
+    ) -> dict[str, tuple[np.ndarray, Any]] | None:
+        # Returns the values and data type of each column except 'Date' or
+        # None if a column cannot be merged and interpolated on arrays.
+        arrays = {}
+        for col in df.columns:
+            if col == "Date":
+                continue
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                # restored without fixed categories, see merge_channels
+                values = df[col].to_numpy(dtype=object)
+                dtype = "category"
+            elif isinstance(dtype, np.dtype):
+                values = df[col].to_numpy()
+            else:
+                return None  # other extension data types
+            ch = self._CHANNELS.get(col, {})
+            if ((ch.get("type") == "continuous")
+                    and ((values.dtype.kind not in "iuf")
+                         or not interpolation.is_supported_method(
+                             ch["method"]))):
+                return None
+            arrays[col] = (values, dtype)
+        return arrays
+
+    def _resample_merged(
+            self,
+            dates: np.ndarray,
+            merged: dict[str, np.ndarray],
+            origin: np.datetime64,
+            frequency: int
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        # Resamples merged columns at a fixed frequency, same as
+        # Series.resample. Continuous channels are averaged within each
+        # interval and empty intervals are interpolated. Discrete channels
+        # use the last value before the start of each interval. Only known
+        # channels and 'Source' are kept.
+        frq = pd.Timedelta(seconds=1/frequency)
+        labels, bins = interpolation.resample_timeline(dates, origin,
+                                                       frq.value)
+        x = labels.view("int64")
+
+        # continuous channels with the same interpolation method and data
+        # type are resampled together
+        groups = {}
+        discrete = []
+        for ch, info in self._CHANNELS.items():
+            if ch not in merged:
+                continue
+            if info["type"] == "continuous":
+                values = merged[ch]
+                if values.dtype.kind != "f":
+                    values = merged[ch] = values.astype("float64")
+                groups.setdefault((info["method"], values.dtype), []) \
+                    .append(ch)
+            elif info["type"] == "discrete":
+                discrete.append(ch)
+
+        resampled = {}
+        for (method, _), channels in groups.items():
+            values = interpolation.bin_mean(
+                bins, len(labels), np.stack([merged[ch] for ch in channels])
+            )
+            values = interpolation.interpolate_many(
+                x, values, method, interpolation.limit_direction(method)
+            )
+            resampled.update(zip(channels, values, strict=True))
+
+        # index of the last value at or before the start of each interval
+        last = np.searchsorted(dates, labels, side="right") - 1
+        for ch in discrete:
+            resampled[ch] = interpolation.ffill_bfill(
+                interpolation.take(merged[ch], last)
+            )
+
+        resampled = {ch: resampled[ch] for ch in self._CHANNELS
+                     if ch in resampled}
+
+        # 'Source' is only kept for values at the start of an interval
+        exact = np.searchsorted(dates, labels, side="left")
+        is_exact = exact < len(dates)
+        is_exact[is_exact] = dates[exact[is_exact]] == labels[is_exact]
+        resampled["Source"] = interpolation.take(
+            merged["Source"], np.where(is_exact, exact, -1)
+        )
+
+        return labels, resampled
+
+    @staticmethod
+    def _restore_dtypes(columns: dict[str, np.ndarray],
+                        dtype_map: dict[str, Any]):
+        # restore data types from before merging
+        for col, dtype in dtype_map.items():
+            try:
+                columns[col] = pd.Series(columns[col], copy=False) \
+                    .astype(dtype)
+            except ValueError:
+                _logger.warning(f"Failed to preserve data type for column "
+                                f"'{col}' while merging telemetry.")
+
     def resample_channels(
             self,
             rule: str | None = None,
@@ -612,8 +937,9 @@ class Telemetry(BaseDataFrame):
                 .resample(rule, **kwargs).asfreq()
             new_date_ref = pd.Series(st.index)
 
-        new_tel = Telemetry(columns=self.columns).__finalize__(self)
-        new_tel.loc[:, "Date"] = new_date_ref
+        resampled = self._resample_channels_arrays(new_date_ref)
+        if resampled is not None:
+            return resampled
 
         combined_tel = self.merge_channels(
             Telemetry({"Date": new_date_ref}).__finalize__(self),
@@ -622,6 +948,136 @@ class Telemetry(BaseDataFrame):
         mask = combined_tel["Date"].isin(new_date_ref)
         return combined_tel.loc[mask, :].copy()
 
+    def _resample_channels_arrays(
+            self,
+            new_date_ref: pd.Series
+    ) -> Optional["Telemetry"]:
+        # Implements resample_channels by evaluating all channels directly
+        # at the new dates. The result is the same as merging with an object
+        # that only contains the new dates and then selecting those, but
+        # values are only calculated for the new dates. Returns None if the
+        # data is not supported, in which case the merge is used.
+        if (("Date" not in self.columns) or ("Driver" in self.columns)
+                or (len(self) == 0)):
+            return None
+
+        arrays = self._column_arrays(self)
+        new_dates = pd.Series(new_date_ref).to_numpy()
+        dates = self["Date"].to_numpy()
+        if ((arrays is None)
+                or (dates.dtype != "datetime64[ns]")
+                or (new_dates.dtype != "datetime64[ns]")
+                or (len(new_dates) == 0)):
+            return None
+
+        if not (interpolation.is_unique_timeline(dates)
+                and interpolation.is_unique_timeline(new_dates)):
+            return None
+        if not np.all(dates[1:] > dates[:-1]):
+            order = np.argsort(dates, kind="stable")
+            dates = dates[order]
+            arrays = {col: (values[order], dtype)
+                      for col, (values, dtype) in arrays.items()}
+        new_dates = np.sort(new_dates)
+
+        if self.get_first_non_zero_time_index() is None:
+            raise ValueError("No valid 'Time' data. Cannot resample!")
+
+        # position of the new dates in the merged timeline and index of
+        # new dates that already exist in self
+        before = np.searchsorted(dates, new_dates, side="left")
+        existing = before < len(dates)
+        existing[existing] = dates[before[existing]] == new_dates[existing]
+        index = before + np.arange(len(new_dates)) \
+            - (np.cumsum(existing) - existing)
+        take_existing = np.where(existing, before, -1)
+        # index of the last value at or before each new date
+        last = np.searchsorted(dates, new_dates, side="right") - 1
+
+        groups = {}
+        continuous = {}
+        resampled = {}
+        for col, (values, _) in arrays.items():
+            info = self._CHANNELS.get(col, {})
+            if info.get("type") == "continuous":
+                if values.dtype.kind != "f":
+                    values = values.astype("float64")
+                groups.setdefault((info["method"], values.dtype), []) \
+                    .append(col)
+                continuous[col] = values
+                resampled[col] = None  # calculated below, keep the order
+            elif info.get("type") == "discrete":
+                # forward fill, then backward fill leading missing values
+                valid = ~pd.isna(values)
+                fill = np.where(valid, np.arange(len(values)), -1)
+                np.maximum.accumulate(fill, out=fill)
+                fill = np.where(last >= 0, fill[last], -1)
+                if valid.any():
+                    fill[fill < 0] = np.argmax(valid)
+                resampled[col] = interpolation.take(values, fill)
+            else:
+                resampled[col] = interpolation.take(values, take_existing)
+
+        for (method, _), channels in groups.items():
+            # x-values of self and the new dates in the merged timeline
+            if method == "linear":
+                # pandas interpolates 'linear' by position, not by value
+                x = np.arange(len(dates)) \
+                    + np.searchsorted(new_dates, dates, side="left") \
+                    - np.searchsorted(new_dates[existing], dates,
+                                      side="left")
+                x_new = index
+            else:
+                x = dates.view("int64")
+                x_new = new_dates.view("int64")
+            values = np.stack([continuous[col] for col in channels])
+            result = np.full((len(channels), len(new_dates)), np.nan,
+                             dtype=values.dtype)
+            for rows, invalid in interpolation.group_by_missing(values):
+                valid = ~invalid
+                if not valid.any():
+                    continue
+                result[rows] = interpolation.interpolate_at(
+                    x[valid], values[np.ix_(rows, valid)], x_new, method
+                )
+                if interpolation.limit_direction(method) == "forward":
+                    result[np.ix_(rows, x_new < x[valid][0])] = np.nan
+                # existing valid values are not interpolated
+                keep = existing.copy()
+                keep[keep] = valid[before[keep]]
+                result[np.ix_(rows, keep)] \
+                    = values[np.ix_(rows, before[keep])]
+            resampled.update(zip(channels, result, strict=True))
+
+        if "Source" in resampled:
+            source_values = resampled["Source"]
+            is_missing = pd.isna(source_values)
+            if is_missing.any():
+                source_values = source_values.astype(object)
+                source_values[is_missing] = "interpolation"
+                resampled["Source"] = source_values
+
+        first_date = min(dates[0], new_dates[0])
+        session_time = new_dates - self.session.t0_date.to_datetime64()
+        resampled["SessionTime"] = session_time
+        resampled["Time"] = new_dates - first_date
+
+        dtype_map = {}
+        for col, (values, dtype) in arrays.items():
+            if dtype == "category":
+                # the categories include the values that are not selected
+                values = np.concatenate((values, resampled[col]))
+                if col == "Source":
+                    values[pd.isna(values)] = "interpolation"
+                dtype = pd.Series(values).astype("category").dtype
+            dtype_map[col] = dtype
+        self._restore_dtypes(resampled, dtype_map)
+
+        resampled = Telemetry({"Date": new_dates, **resampled}) \
+            .__finalize__(self)
+        resampled.index = index
+        return resampled
+
     def fill_missing(self):
         """Calculate missing values in self.
 
@@ -678,6 +1134,11 @@ class Telemetry(BaseDataFrame):
                 # ffill to fix first row
 
         if "Source" in ret.columns:
+            if (isinstance(ret["Source"].dtype, pd.CategoricalDtype)
+                    and "interpolation"
+                    not in ret["Source"].cat.categories):
+                ret["Source"] = ret["Source"] \
+                    .cat.add_categories("interpolation")
             ret.loc[:, "Source"] = ret.loc[:, "Source"] \
                 .fillna(value="interpolation")
 
@@ -830,6 +1291,7 @@ class Telemetry(BaseDataFrame):
         """Add column 'TrackStatus' to self.
 
         This column contains the Track Status for each event as a number.
+        Samples before the first track status message have no track status.
 
         See :func:`fastf1.api.track_status_data` for more information.
 
@@ -848,29 +1310,23 @@ class Telemetry(BaseDataFrame):
         else:
             d = self
 
-        ts = []
-        statuses = d.session.track_status["Status"]
-        events = d.session.t0_date + d.session.track_status["Time"]
+        statuses = d.session.track_status["Status"].to_numpy()
+        events = (d.session.t0_date
+                  + d.session.track_status["Time"]).to_numpy()
+        dates = d["Date"].to_numpy()
 
         # |--- event K ---|--- N telemetry samples ---|--- event K + 1 ---|
         #                           ^
         #                   all samples have the same
         #                 track status because of event K
         #
-        # For each track status event, calculate the in between events of the
-        # telemetry, up until the next track status event. For each of the in
-        # between events add the corresponding track status to an array. At
-        # last, create the new column 'TrackStatus' with the array of track
-        # statuses.
-        for index in range(events.shape[0] - 1):
-            curr_e = events[index]
-            next_e = events[index+1]
-
-            dd_shape = d[(d["Date"] < next_e) & (d["Date"] >= curr_e)].shape[0]
-            ts.extend([statuses[index]] * dd_shape)
-
-        dd_shape = d[(d["Date"] > events.iloc[-1])].shape[0]
-        ts.extend([statuses.iloc[-1]] * dd_shape)
+        # For each telemetry sample, find the index of the last track status
+        # event that occurred at the same time or before the sample. Samples
+        # before the first event have no track status.
+        index = np.searchsorted(events, dates, side="right") - 1
+        has_status = (index >= 0) & ~np.isnat(dates)
+        ts = np.full(len(dates), None, dtype=object)
+        ts[has_status] = statuses[index[has_status]]
 
         d["TrackStatus"] = ts
         return d
@@ -992,6 +1448,78 @@ class Telemetry(BaseDataFrame):
         t_start = self["SessionTime"].iloc[0]
         t_end = self["SessionTime"].iloc[-1]
 
+        distances = None
+        if isinstance(self.session, Session):
+            # distance of all drivers is integrated once per session
+            distances = self.session._get_driver_distances() \
+                .get_distances(self.driver, t_start, t_end)
+
+        if distances is not None:
+            drv_map, own_dst, other_dst, own_rows = distances
+            own_ref_tel = None
+            if return_reference:
+                own_ref_tel = self._driver_ahead_reference(*own_rows,
+                                                           t_start)
+        else:
+            drv_map, own_dst, other_dst, own_ref_tel = \
+                self._integrate_driver_distances(t_start, t_end)
+
+        drv_ahead, dist_to_drv_ahead = \
+            self._find_driver_ahead(drv_map, own_dst, other_dst)
+
+        if return_reference:
+            return drv_ahead, dist_to_drv_ahead, own_ref_tel
+
+        return drv_ahead, dist_to_drv_ahead
+
+    @staticmethod
+    def _find_driver_ahead(
+            drv_map: np.ndarray,
+            own_dst: np.ndarray,
+            other_dst: np.ndarray,
+            other_prev_dst: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Driver ahead and distance to the driver ahead for each sample,
+        # given the distance of self (1D) and of all other drivers (2D, one
+        # column per driver in drv_map). Optionally, the distance of all other
+        # drivers at the previous sample can be given, else it is taken from
+        # the previous row.
+        delta_dst = other_dst - own_dst[:, np.newaxis]
+
+        # ignore distance if it does not change; always ignored for the
+        # first sample, because the change is unknown
+        ignore = np.empty(other_dst.shape, dtype=bool)
+        if other_prev_dst is not None:
+            np.equal(other_dst - other_prev_dst, 0, out=ignore)
+        else:
+            ignore[0] = np.isfinite(other_dst[0])
+            np.equal(other_dst[1:] - other_dst[:-1], 0, out=ignore[1:])
+        # substitute nan with inf, else nan is returned as min, and remove
+        # cars behind so that neg numbers are not returned as min
+        ignore |= ~(delta_dst >= 0)
+        delta_dst[ignore] = np.inf
+
+        index_ahead = np.argmin(delta_dst, axis=1)
+        dist_to_drv_ahead = np.take_along_axis(
+            delta_dst, index_ahead[:, np.newaxis], axis=1
+        ).ravel()
+        drv_ahead = drv_map.astype(str)[index_ahead]
+
+        # remove driver and value where no car is ahead (all inf rows)
+        no_drv_ahead = dist_to_drv_ahead == np.inf
+        drv_ahead[no_drv_ahead] = ""
+        dist_to_drv_ahead[no_drv_ahead] = np.nan
+
+        return drv_ahead, dist_to_drv_ahead
+
+    def _integrate_driver_distances(
+            self,
+            t_start: pd.Timedelta,
+            t_end: pd.Timedelta
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, Optional["Telemetry"]]:
+        # General implementation for calculate_driver_ahead that integrates
+        # the distance of each driver from the car data. Used if the data is
+        # not supported by _DriverDistances.
         combined_distance = pd.DataFrame()
 
         # Assume the following lap profile as a catch all for all drivers
@@ -1113,41 +1641,486 @@ class Telemetry(BaseDataFrame):
         other_dst = combined_distance \
             .loc[:, combined_distance.columns != self.driver] \
             .to_numpy()
-        # replace distance with nan if it does not change
-        # prepend first row before diff so that array size stays the same;
-        # but missing first sample because of that
-        other_dst[
-            np.diff(other_dst, n=1, axis=0, prepend=other_dst[0, :]
-                    .reshape((1, -1))) == 0
-            ] = np.nan
-
-        # resize own_dst to match shape of other_dst for easy subtraction
-        own_dst = np.repeat(
-            own_dst.reshape((-1, 1)), other_dst.shape[1], axis=1
+
+        return drv_map, own_dst, other_dst, own_ref_tel
+
+    def _driver_ahead_reference(
+            self,
+            rows: slice,
+            distance: np.ndarray,
+            t_start: pd.Timedelta
+    ) -> "Telemetry":
+        # reference telemetry for calculate_driver_ahead, the car data of
+        # self.driver including the distance driven
+        ref_tel = self.session.car_data[self.driver].iloc[rows].copy()
+        if "Time" in ref_tel.columns:
+            ref_tel.loc[:, "Time"] = ref_tel["SessionTime"] - t_start
+        if "Distance" in ref_tel.columns:
+            ref_tel = ref_tel.drop(labels="Distance", axis=1)
+        ref_tel["Distance"] = distance
+        return ref_tel
+
+
+class _TelemetryMapping(MutableMapping):
+    """Dictionary of :class:`Telemetry` objects keyed by driver number.
+
+    The telemetry of a driver is only created from the raw API data when it
+    is accessed for the first time. The result is kept afterward. This means
+    that no processing is done for drivers whose data is never used.
+    """
+    def __init__(self, session: "Session",
+                 raw_data: Mapping[str, pd.DataFrame],
+                 compact_dtypes: bool = False):
+        self._session = session
+        self._raw_data = raw_data
+        self._compact_dtypes = compact_dtypes
+        # None marks telemetry that was not yet created
+        self._data: dict[str, Telemetry | None] = {
+            drv: None for drv in session.drivers if drv in raw_data
+        }
+        self._n_pending = len(self._data)
+
+    def __getitem__(self, drv: str) -> "Telemetry":
+        tel = self._data[drv]
+        if tel is None:
+            tel = self._data[drv] = self._create_telemetry(drv)
+            self._n_pending -= 1
+            if self._n_pending == 0:
+                # all data is processed, release the raw data
+                self._raw_data = None
+        return tel
+
+    def __setitem__(self, drv: str, tel: "Telemetry"):
+        if self._data.get(drv, False) is None:
+            self._n_pending -= 1
+        self._data[drv] = tel
+        self._invalidate_driver_distances()
+
+    def __delitem__(self, drv: str):
+        if self._data.pop(drv) is None:
+            self._n_pending -= 1
+        self._invalidate_driver_distances()
+
+    def __contains__(self, drv) -> bool:
+        return drv in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(drivers={list(self._data)})"
+
+    def memory_usage(self) -> dict[str, int]:
+        # deep memory usage in bytes per driver; for telemetry that was not
+        # created yet, the raw data is counted if it is held in memory (raw
+        # data from the columnar cache is only counted once it was loaded)
+        usage = {}
+        for drv, tel in self._data.items():
+            if tel is not None:
+                usage[drv] = _memory_usage(tel)
+            elif isinstance(self._raw_data, dict):
+                usage[drv] = _memory_usage(self._raw_data[drv])
+            elif (raw := self._raw_data.get_loaded(drv)) is not None:
+                usage[drv] = _memory_usage(raw)
+            else:
+                usage[drv] = 0
+        return usage
+
+    def _invalidate_driver_distances(self):
+        # the integrated distance of all drivers is calculated from the car
+        # data and needs to be recalculated if it is changed
+        if getattr(self._session, "_car_data", None) is self:
+            self._session._driver_distances = None
+
+    def _create_telemetry(self, drv: str) -> "Telemetry":
+        if isinstance(self._raw_data, columnar_cache.ColumnarFrames) \
+                and (self._raw_data.get_loaded(drv) is None):
+            # data from the columnar cache is not kept after the telemetry
+            # was created from it
+            raw = self._raw_data.load(drv)
+        else:
+            raw = self._raw_data[drv]
+
+        # drop and recalculate timestamps based on 'Date', because
+        # 'Date' has a higher resolution
+        tel = Telemetry(
+            raw.drop(labels="Time", axis=1),
+            session=self._session,
+            driver=drv,
+            drop_unknown_channels=True,
+            _cast_default_cols=not self._compact_dtypes,
+            _compact_dtypes=self._compact_dtypes
         )
 
-        delta_dst = other_dst - own_dst
-        # substitute nan with inf, else nan is returned as min
-        delta_dst[np.isnan(delta_dst)] = np.inf
-        # remove cars behind so that neg numbers are not returned as min
-        delta_dst[delta_dst < 0] = np.inf
+        tel["Date"] = tel["Date"].dt.round("ms")
 
-        index_ahead = np.argmin(delta_dst, axis=1)
+        tel["Time"] = tel["Date"] - self._session.t0_date
+        tel["SessionTime"] = tel["Time"]
 
-        drv_ahead = np.array([drv_map[i] for i in index_ahead])
-        # remove driver from all inf rows
-        drv_ahead[np.all(delta_dst == np.inf, axis=1)] = ""
+        return tel
 
-        dist_to_drv_ahead = np.array(
-            [delta_dst[i, index_ahead[i]] for i in range(len(index_ahead))]
-        )
-        # remove value from all inf rows
-        dist_to_drv_ahead[np.all(delta_dst == np.inf, axis=1)] = np.nan
 
-        if return_reference:
-            return drv_ahead, dist_to_drv_ahead, own_ref_tel
+class _DriverDistances:
+    """Integrated distance of all drivers of a session.
 
-        return drv_ahead, dist_to_drv_ahead
+    The distance that each driver has driven is integrated once from the car
+    data of the whole session. The distance since the start of any lap is
+    then obtained by subtracting the integrated distance at the start of that
+    lap. This is the same as integrating the distance since the start of the
+    lap (apart from floating point rounding), but the distance of each driver
+    only needs to be integrated once instead of once for each lap of each
+    driver in :meth:`Telemetry.calculate_driver_ahead`.
+    """
+    def __init__(self, session: "Session"):
+        self._laps = session.laps
+        self._car_data = session.car_data
+        # per driver: laps as (LapNumber, LapStartTime, Time) and car data
+        # as (SessionTime, speed in m/s, integrated distance)
+        self._drv_laps: dict[str, tuple[np.ndarray, ...]] = {}
+        self._drv_data: dict[str, tuple[np.ndarray, ...]] = {}
+        self.is_supported = True
+
+        for drv in session.drivers:
+            if drv not in self._car_data:
+                continue
+            drv_laps = self._laps[self._laps["DriverNumber"] == drv]
+            if drv_laps.empty:
+                continue
+            tel = self._car_data[drv]
+            if ("SessionTime" not in tel.columns) \
+                    or ("Speed" not in tel.columns):
+                self.is_supported = False
+                return
+            times = tel["SessionTime"].to_numpy()
+            speed = tel["Speed"].to_numpy()
+            if ((times.dtype != "timedelta64[ns]")
+                    or (speed.dtype.kind not in "iuf")
+                    or np.isnat(times).any()
+                    or not np.all(times[1:] > times[:-1])):
+                self.is_supported = False
+                return
+
+            speed = (speed / 3.6).astype("float64")
+            # the distance driven between subsequent samples; samples with
+            # unknown speed are skipped, same as with cumsum
+            seconds = times.view("int64") / 1e9
+            ds = speed[1:] * np.diff(seconds)
+            ds[np.isnan(ds)] = 0
+            distance = np.concatenate(([0.0], np.cumsum(ds)))
+
+            self._drv_laps[drv] = (
+                drv_laps["LapNumber"].to_numpy(dtype="float64"),
+                drv_laps["LapStartTime"].to_numpy(dtype="timedelta64[ns]"),
+                drv_laps["Time"].to_numpy(dtype="timedelta64[ns]")
+            )
+            self._drv_data[drv] = (times, speed, distance)
+
+    def is_current(self, session: "Session") -> bool:
+        # whether the laps and car data of the session are still the same
+        # objects from which the distance was calculated; changing the car
+        # data of a single driver resets the distances of the session instead
+        return ((getattr(session, "_laps", None) is self._laps)
+                and (getattr(session, "_car_data", None) is self._car_data))
+
+    def memory_usage(self) -> dict[str, int]:
+        # memory usage in bytes per driver
+        return {drv: sum(arr.nbytes for arr in self._drv_data[drv])
+                + sum(arr.nbytes for arr in self._drv_laps[drv])
+                for drv in self._drv_data}
+
+    def get_distances(
+            self,
+            driver: str,
+            t_start: pd.Timedelta,
+            t_end: pd.Timedelta
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray,
+               tuple[slice, np.ndarray]] | None:
+        """Distance of all drivers between two points in time.
+
+        The distance of each driver is counted from the start of the lap
+        during which a driver crosses the finish line before or at the same
+        time as ``driver``, like in
+        :meth:`Telemetry.calculate_driver_ahead`.
+
+        Returns:
+            The driver numbers of all other drivers, the distance of
+            ``driver`` and a 2D array with the distance of all other drivers
+            (one column per driver) on the union of the timestamps of all
+            drivers. Additionally, the rows of the car data of ``driver``
+            that are included and their distance. None is returned if the
+            data is not supported or if there is no data for ``driver``.
+        """
+        if (not self.is_supported) or (driver not in self._drv_laps):
+            return None
+        t_start = np.timedelta64(pd.Timedelta(t_start).value, "ns")
+        t_end = np.timedelta64(pd.Timedelta(t_end).value, "ns")
+
+        first_lap_number = self._first_lap_number(driver, t_start)
+        if first_lap_number is None:
+            return None
+
+        columns = {}
+        own_rows = None
+        for drv, (times, speed, distance) in self._drv_data.items():
+            rows = self._relevant_rows(drv, t_start, t_end, first_lap_number)
+            if rows is None:
+                continue
+            i_zero, i_first, i_last, offset = rows
+            drv_dst = offset + (distance[i_first:i_last] - distance[i_zero])
+            drv_dst[np.isnan(speed[i_first:i_last])] = np.nan
+            columns[drv] = (times[i_first:i_last], drv_dst)
+            if drv == driver:
+                own_rows = (slice(i_first, i_last), drv_dst)
+
+        if own_rows is None:
+            return None
+
+        # merge all drivers onto a common timeline
+        timeline = np.unique(np.concatenate(
+            [times for times, _ in columns.values()]
+        ))
+        combined = np.full((len(timeline), len(columns)), np.nan)
+        for i, (times, drv_dst) in enumerate(columns.values()):
+            combined[np.searchsorted(timeline, times), i] = drv_dst
+
+        drivers = np.array(list(columns), dtype=object)
+        is_own = drivers == driver
+        return (drivers[~is_own], combined[:, is_own].ravel(),
+                combined[:, ~is_own], own_rows)
+
+    def get_window_distances(
+            self,
+            driver: str,
+            t_starts: np.ndarray,
+            t_ends: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+               np.ndarray] | None:
+        """Distance of all drivers during multiple time windows.
+
+        This is the same as calling :meth:`get_distances` for each window
+        ``(t_starts[i], t_ends[i])``, but all windows are evaluated at once.
+        Only timestamps at which ``driver`` has car data are included. A
+        sample that lies within multiple windows is included once, for the
+        first of these windows.
+
+        Returns:
+            The driver numbers of all other drivers, the rows of the car data
+            of ``driver`` that are included, the distance of ``driver`` and a
+            2D array with the distance of all other drivers (one column per
+            driver) at these rows. Additionally, the same 2D array for the
+            previous row of each window; it is equal to the distance at the
+            row itself for the first row of a window. None is returned if the
+            data is not supported or if the distance cannot be calculated for
+            one of the windows.
+        """
+        if (not self.is_supported) or (driver not in self._drv_laps):
+            return None
+        n_windows = len(t_starts)
+
+        # per driver and window: the first row where the distance is zero,
+        # the included rows and the distance driven before the first row; no
+        # rows are included if the distance cannot be calculated
+        zero_rows = {drv: np.zeros(n_windows, dtype=int)
+                     for drv in self._drv_data}
+        first_rows = {drv: np.zeros(n_windows, dtype=int)
+                      for drv in self._drv_data}
+        last_rows = {drv: np.zeros(n_windows, dtype=int)
+                     for drv in self._drv_data}
+        offsets = {drv: np.zeros(n_windows) for drv in self._drv_data}
+        for k in range(n_windows):
+            t_start = np.timedelta64(pd.Timedelta(t_starts[k]).value, "ns")
+            t_end = np.timedelta64(pd.Timedelta(t_ends[k]).value, "ns")
+            first_lap_number = self._first_lap_number(driver, t_start)
+            if first_lap_number is None:
+                return None
+            for drv in self._drv_data:
+                rows = self._relevant_rows(drv, t_start, t_end,
+                                           first_lap_number)
+                if rows is not None:
+                    (zero_rows[drv][k], first_rows[drv][k],
+                     last_rows[drv][k], offsets[drv][k]) = rows
+            if last_rows[driver][k] == 0:
+                return None
+
+        # assign each row of the car data of driver to the first window that
+        # includes it
+        own_times = self._drv_data[driver][0]
+        window = np.full(len(own_times), -1)
+        for k in range(n_windows):
+            in_window = window[first_rows[driver][k]:last_rows[driver][k]]
+            in_window[in_window < 0] = k
+        rows = np.flatnonzero(window >= 0)
+        window = window[rows]
+        # previous row of each row within the same window
+        prev_rows = np.where(rows > first_rows[driver][window],
+                             rows - 1, rows)
+
+        drivers = []
+        own_dst = None
+        other_dst = []
+        other_prev_dst = []
+        for drv in self._drv_data:
+            args = (drv, zero_rows[drv][window],
+                    first_rows[drv][window], last_rows[drv][window],
+                    offsets[drv][window])
+            if drv == driver:
+                own_dst = self._distance_at(own_times[rows], *args)
+            else:
+                drivers.append(drv)
+                other_dst.append(self._distance_at(own_times[rows], *args))
+                other_prev_dst.append(
+                    self._distance_at(own_times[prev_rows], *args)
+                )
+
+        shape = (len(rows), len(drivers))
+        return (np.array(drivers, dtype=object), rows, own_dst,
+                np.array(other_dst).T.reshape(shape),
+                np.array(other_prev_dst).T.reshape(shape))
+
+    def _distance_at(
+            self,
+            at_times: np.ndarray,
+            drv: str,
+            zero_rows: np.ndarray,
+            first_rows: np.ndarray,
+            last_rows: np.ndarray,
+            offsets: np.ndarray
+    ) -> np.ndarray:
+        # Distance of a driver at the given timestamps, each one relative to
+        # the start of the relevant laps of its window, the same as in
+        # get_distances. The distance is NaN where the driver has no car data
+        # or the data is not included in the window.
+        times, speed, distance = self._drv_data[drv]
+        if len(times) == 0:
+            return np.full(len(at_times), np.nan)
+        pos = np.searchsorted(times, at_times)
+        in_bounds = np.minimum(pos, len(times) - 1)
+        valid = ((times[in_bounds] == at_times)
+                 & (pos >= first_rows) & (pos < last_rows))
+        drv_dst = offsets + (distance[in_bounds] - distance[zero_rows])
+        drv_dst[~valid | np.isnan(speed[in_bounds])] = np.nan
+        return drv_dst
+
+    def _first_lap_number(
+            self,
+            driver: str,
+            t_start: np.timedelta64
+    ) -> float | None:
+        # number of the lap of driver during which t_start is
+        numbers, starts, _ = self._drv_laps[driver]
+        laps_before = numbers[starts <= t_start]
+        if len(laps_before) == 0:
+            return None
+        return laps_before[-1]
+
+    def _relevant_rows(
+            self,
+            drv: str,
+            t_start: np.timedelta64,
+            t_end: np.timedelta64,
+            first_lap_number: float
+    ) -> tuple[int, int, int, float] | None:
+        # Rows of the car data of a driver for the distance between t_start
+        # and t_end: the first row of the relevant laps where the distance is
+        # zero, the first and last (exclusive) included row and the distance
+        # that was driven from the start of the lap to the first row.
+        window = self._relevant_window(drv, t_start, t_end, first_lap_number)
+        if window is None:
+            return None
+        times, speed, _ = self._drv_data[drv]
+        start, end = window
+        i_zero = np.searchsorted(times, start, side="left")
+        i_first = max(i_zero, np.searchsorted(times, t_start, side="left"))
+        i_last = min(np.searchsorted(times, end, side="right"),
+                     np.searchsorted(times, t_end, side="right"))
+        if (i_zero >= len(times)) or (i_first >= i_last):
+            return None
+
+        offset = speed[i_zero] \
+            * ((times[i_zero] - start).view("int64") / 1e9)
+        if np.isnan(offset):
+            offset = 0.0
+        return i_zero, i_first, i_last, offset
+
+    def _relevant_window(
+            self,
+            drv: str,
+            t_start: np.timedelta64,
+            t_end: np.timedelta64,
+            first_lap_number: float
+    ) -> tuple[np.timedelta64, np.timedelta64] | None:
+        # Start and end time of the laps of a driver that need to be
+        # considered, see Telemetry.calculate_driver_ahead for details.
+        numbers, starts, ends = self._drv_laps[drv]
+
+        laps_before = numbers[starts <= t_start]
+        if len(laps_before):
+            lap_n_before = laps_before[-1]
+            if lap_n_before < first_lap_number:
+                lap_n_before += 1
+        else:
+            lap_n_before = numbers.min()
+
+        laps_after = numbers[ends >= t_end]
+        lap_n_after = laps_after[0] if len(laps_after) else numbers.max()
+
+        pad_before = 0
+        pad_after = 0
+        while True:
+            relevant = ((numbers >= (lap_n_before - pad_before))
+                        & (numbers <= (lap_n_after + pad_after)))
+
+            if (pad_before >= 1) or (pad_after >= 1):
+                _logger.warning(f"Car number {drv} cannot be located "
+                                f"on track while calculating the distance"
+                                f"between cars.")
+                break
+
+            if not relevant.any():
+                break
+
+            if np.isnat(starts[relevant][-1]):
+                pad_before += 1
+                continue
+            if np.isnat(ends[relevant][0]):
+                pad_after += 1
+                continue
+            break
+
+        if not relevant.any():
+            return None
+
+        starts = starts[relevant]
+        ends = ends[relevant]
+        if len(starts) > 1:
+            # first start and last end, ignoring missing values
+            starts = starts[~np.isnat(starts)]
+            ends = ends[~np.isnat(ends)]
+            if (len(starts) == 0) or (len(ends) == 0):
+                return None
+            return starts.min(), ends.max()
+        if np.isnat(starts[0]) or np.isnat(ends[0]):
+            return None
+        return starts[0], ends[0]
+
+
+def _memory_usage(data: pd.DataFrame) -> int:
+    # deep memory usage of a dataframe in bytes, including the index
+    return int(data.memory_usage(index=True, deep=True).sum())
+
+
+def _total_seconds(values: pd.Series) -> np.ndarray:
+    # Same as calling ``pd.Timedelta.total_seconds`` for each value, which
+    # truncates to microseconds. Using ``Series.dt.total_seconds`` instead
+    # can change the result in the last digit. Missing values are NaN.
+    us = values.to_numpy(dtype="timedelta64[us]").view("int64")
+    seconds = us // 1_000_000
+    result = seconds + (us - seconds * 1_000_000) / 1e6
+    result[values.isna().to_numpy()] = np.nan
+    return result
 
 
 class Session:
@@ -1218,14 +2191,24 @@ class Session:
         self._t0_date: pd.Timestamp | None
         self._session_start_time: pd.Timedelta | None
 
-        self._car_data: dict
-        self._pos_data: dict
+        self._car_data: Mapping[str, Telemetry]
+        self._pos_data: Mapping[str, Telemetry]
 
         self._weather_data: pd.DataFrame
         self._results: SessionResults
 
         self._session_split_times: list | None = None
 
+        # raw API responses that were downloaded in advance while loading
+        self._prefetched_pages: dict[str, Any] = {}
+
+        # laps of this session with a cached 'telemetry' property, keyed by
+        # object id; entries are removed when the laps are garbage collected
+        self._cached_telemetry: weakref.WeakValueDictionary \
+            = weakref.WeakValueDictionary()
+        # distance of all drivers, see _get_driver_distances
+        self._driver_distances: _DriverDistances | None = None
+
     def __repr__(self):
         return (f"{self.event.year} Season Round {self.event.RoundNumber}: "
                 f"{self.event.EventName} - {self.name}")
@@ -1301,6 +2284,9 @@ class Session:
         the api by car number (where car number is a string and the telemetry
         is an instance of :class:`Telemetry`)
 
+        The telemetry of a driver is processed when it is accessed for the
+        first time.
+
         Data is available after calling `Session.load` with ``telemetry=True``
         """
         return self._get_property_warn_not_loaded("_car_data")
@@ -1311,6 +2297,9 @@ class Session:
         number (where car number is a string and the telemetry
         is an instance of :class:`Telemetry`)
 
+        The position data of a driver is processed when it is accessed for
+        the first time.
+
         Data is available after calling `Session.load` with ``telemetry=True``
         """
         return self._get_property_warn_not_loaded("_pos_data")
@@ -1363,7 +2352,11 @@ class Session:
 
     def load(self, *, laps: bool = True, telemetry: bool = True,
              weather: bool = True, messages: bool = True,
-             livedata: LiveTimingData = None):
+             livedata: LiveTimingData = None,
+             decode_workers: int | None = None,
+             drivers: Iterable[str] | None = None,
+             time_window: tuple | None = None,
+             compact_dtypes: bool = False):
         """Load session data from the supported APIs.
 
         This method allows to flexibly load some or all data that FastF1 can
@@ -1408,11 +2401,57 @@ class Session:
             messages: Load race control messages for the session
             livedata: instead of requesting the data from the api, locally
                 saved livetiming data can be used as a data source
+            decode_workers: Number of worker processes that are used for
+                decoding the raw telemetry data. By default, all data is
+                decoded in the current process. Multiple worker processes
+                can significantly speed up loading the telemetry data of
+                long sessions if the data is not cached yet.
+            drivers: Driver numbers (as string) of the drivers for which
+                telemetry data is loaded. The telemetry of all other drivers
+                is skipped while decoding the raw data, which reduces loading
+                time and memory usage. Lap timing data and all other data is
+                still loaded for all drivers. :attr:`Session.t0_date` is
+                still determined from the raw data of all drivers. Note that
+                the driver ahead (see :meth:`Telemetry.add_driver_ahead`)
+                can then only be one of the selected drivers, as the
+                telemetry of all other drivers is not available. By default,
+                telemetry data is loaded for all drivers.
+            time_window: Only load telemetry data within a time window,
+                given as a tuple ``(start, end)``. The bounds are either
+                session times (:class:`pandas.Timedelta` or
+                :class:`datetime.timedelta`) or lap numbers (int). For lap
+                numbers, the window extends from the earliest start of the
+                first lap to the latest end of the last lap of any driver,
+                which requires that laps are loaded as well. Only the raw
+                telemetry data within the window is decoded.
+                :attr:`Session.t0_date` is still determined from the raw
+                data outside the window as well, so that the telemetry is
+                aligned with the lap timing in the same way as when all data
+                is loaded. Only a sample of at most 1000 raw records outside
+                the window is used for this, so t0_date can differ very
+                slightly if there are more records.
+                Telemetry for a time window is not saved in the stage 2
+                cache. If the telemetry data is already cached, all cached
+                data is used instead.
+            compact_dtypes: Use smaller data types for the telemetry
+                channels to reduce memory usage. Continuous channels (e.g.
+                'Speed', 'RPM', 'X') are stored as float32 instead of
+                float64, 'nGear' and 'DRS' as int8 and 'Source' and
+                'Status' as categoricals. These data types are preserved
+                when telemetry is merged, resampled or interpolated.
         """
         _logger.info(f"Loading data for "
                      f"{self.event['EventName']} - {self.name}"
                      f" [v{fastf1.__version__}]")
 
+        if drivers is not None:
+            drivers = [str(drv) for drv in drivers]
+
+        if self.f1_api_support and (livedata is None):
+            self._prefetch_pages(laps=laps, telemetry=telemetry,
+                                 weather=weather, messages=messages,
+                                 drivers=drivers)
+
         self._load_session_info(livedata=livedata)
         self._load_drivers_results(livedata=livedata)
 
@@ -1426,7 +2465,13 @@ class Session:
                 self._fix_missing_laps_retired_on_track()
 
             if telemetry:
-                self._load_telemetry(livedata=livedata)
+                if time_window is not None:
+                    time_window = self._resolve_time_window(time_window)
+                self._load_telemetry(livedata=livedata,
+                                     decode_workers=decode_workers,
+                                     drivers=drivers,
+                                     time_window=time_window,
+                                     compact_dtypes=compact_dtypes)
 
             if weather:
                 self._load_weather_data(livedata=livedata)
@@ -1447,24 +2492,106 @@ class Session:
         self._calculate_race_like_session_results()
         self._calculate_practice_like_session_results()
 
+        self._prefetched_pages = {}  # release any unused responses
+
         _logger.info(f"Finished loading data for {len(self.drivers)} "
                      f"drivers: {self.drivers}")
 
+    # Maps the names of the API pages that are loaded by Session.load to the
+    # names of the API functions that parse them (used for the cache lookup).
+    _PREFETCH_PAGES = {
+        "session_info": "session_info",
+        "driver_list": "driver_info",
+        "session_status": "session_status_data",
+        "lap_count": "lap_count",
+        "track_status": "track_status_data",
+        "timing_data": "_extended_timing_data",
+        "timing_app_data": "timing_app_data",
+        "car_data": "car_data",
+        "position": "position_data",
+        "weather_data": "weather_data",
+        "race_control_messages": "race_control_messages",
+    }
+
+    # API pages that support parsing the data of selected drivers only
+    _PREFETCH_DRIVER_PAGES = ("car_data", "position")
+
+    def _prefetch_pages(self, *, laps, telemetry, weather, messages,
+                        drivers=None):
+        # Download the raw data for all required API pages concurrently. The
+        # responses are later passed to the API parser functions. Pages for
+        # which the parsed data is cached already are skipped. If a download
+        # fails here, the parser function will simply request the data again.
+        page_names = ["session_info", "driver_list"]
+        if laps:
+            page_names.extend(["session_status", "track_status",
+                               "timing_data", "timing_app_data"])
+            if self.name in self._RACE_LIKE_SESSIONS:
+                page_names.append("lap_count")
+        if telemetry:
+            page_names.extend(["car_data", "position"])
+        if weather:
+            page_names.append("weather_data")
+        if messages:
+            page_names.append("race_control_messages")
+
+        page_names = [
+            name for name in page_names
+            if not Cache._has_cached_data(
+                self.api_path, self._PREFETCH_PAGES[name],
+                drivers=(drivers if name in self._PREFETCH_DRIVER_PAGES
+                         else None)
+            )
+        ]
+        if len(page_names) < 2:
+            return  # nothing to gain
+
+        _logger.info(f"Fetching {len(page_names)} API pages...")
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(page_names)) as executor:
+            # The entries of streamed pages are only parsed when the
+            # response is consumed by the corresponding parser function,
+            # which iterates over the entries once. Session info data is
+            # accessed by index and is therefore fetched as a list.
+            futures = {name: executor.submit(api.fetch_page,
+                                             self.api_path, name,
+                                             stream=(name != "session_info"))
+                       for name in page_names}
+
+        for name, future in futures.items():
+            try:
+                self._prefetched_pages[name] = future.result()
+            except Exception as exc:
+                _logger.debug(f"Failed to prefetch API page '{name}'",
+                              exc_info=exc)
+
+    def _get_prefetched(self, name: str):
+        # returns a prefetched response or None
+        return self._prefetched_pages.pop(name, None)
+
     @soft_exceptions("session info data",
                      "Failed to load session info data!",
                      _logger)
     def _load_session_info(self, livedata=None):
-        self._session_info = api.session_info(self.api_path,
-                                              livedata=livedata)
+        self._session_info = api.session_info(
+            self.api_path, livedata=livedata,
+            response=self._get_prefetched("session_info")
+        )
 
     @soft_exceptions("lap timing data", "Failed to load timing data!", _logger)
     def _load_laps_data(self, livedata=None):
         data, _, session_split_times \
-            = api._extended_timing_data(self.api_path, livedata=livedata)
+            = api._extended_timing_data(
+                self.api_path, livedata=livedata,
+                response=self._get_prefetched("timing_data")
+            )
 
         self._session_split_times = session_split_times
 
-        app_data = api.timing_app_data(self.api_path, livedata=livedata)
+        app_data = api.timing_app_data(
+            self.api_path, livedata=livedata,
+            response=self._get_prefetched("timing_app_data")
+        )
         _logger.info("Processing timing data...")
         # Matching data and app_data. Not super straightforward
         # Sometimes a car may enter the pit without changing tyres, so
@@ -2070,11 +3197,6 @@ class Session:
         # ensure track status is not set
         laps["TrackStatus"] = ""
 
-        def _applicator(new_status, current_status):
-            if new_status not in current_status:
-                return current_status + new_status
-            return current_status
-
         # -- Track Status Timeline
         #           --> (status before) --|--- status ---|-- next_status -->
         #                                 |              |
@@ -2085,35 +3207,42 @@ class Session:
         #    (matches B and C)               |-- Lap --|
         # Case C (full overlap):     |---------- Lap ----------|
 
-        if len(track_status["Time"]) > 0:
-            t = track_status["Time"][0]
-            status = track_status["Status"][0]
-            for next_t, next_status in zip(track_status["Time"][1:],
-                                           track_status["Status"][1:],
-                                           strict=True):
+        if (len(track_status["Time"]) > 0) and (len(laps) > 0):
+            t = track_status["Time"].to_numpy()
+            statuses = track_status["Status"].to_numpy()
+            lap_start = laps["LapStartTime"].to_numpy().reshape(-1, 1)
+            lap_end = laps["Time"].to_numpy().reshape(-1, 1)
+            curr_t, next_t = t[:-1], t[1:]
 
+            # overlap matrix, laps as rows and track statuses as columns
+            sel = np.zeros((len(laps), len(t)), dtype=bool)
+            sel[:, :-1] = (
                 # Case A: The lap ends during the current status
-                sel = ((t <= laps["Time"]) & (laps["Time"] <= next_t))
+                ((curr_t <= lap_end) & (lap_end <= next_t))
                 # Case B: The lap starts during the current status
-                sel |= ((t <= laps["LapStartTime"])
-                        & (laps["LapStartTime"] <= next_t))
+                | ((curr_t <= lap_start) & (lap_start <= next_t))
                 # Case C: The lap fully contains the current status
-                sel |= ((laps["LapStartTime"] <= t) & (next_t <= laps["Time"]))
-
-                laps.loc[sel, "TrackStatus"] \
-                    = laps.loc[sel, "TrackStatus"].apply(
-                        lambda curr, s=status: _applicator(s, curr)
-                )
-
-                t = next_t
-                status = next_status
-
-            # process the very last status: any lap that ends after this status
-            # started was fully or partially set under this track status
-            sel = (t <= laps["Time"])
-            laps.loc[sel, "TrackStatus"] = laps.loc[sel, "TrackStatus"].apply(
-                lambda curr: _applicator(status, curr)
+                | ((lap_start <= curr_t) & (next_t <= lap_end))
             )
+            # the very last status: any lap that ends after this status
+            # started was fully or partially set under this track status
+            sel[:, -1] = t[-1] <= lap_end[:, 0]
+
+            # Many laps overlap with the same track statuses (e.g. laps of
+            # different drivers). Each unique combination of track statuses
+            # only needs to be converted to a string once. Each status is
+            # added only once per lap, in the order in which they occurred.
+            combinations, inverse = np.unique(sel, axis=0,
+                                              return_inverse=True)
+            combined_status = np.empty(len(combinations), dtype=object)
+            for i, row in enumerate(combinations):
+                current_status = ""
+                for new_status in statuses[row]:
+                    if new_status not in current_status:
+                        current_status += new_status
+                combined_status[i] = current_status
+
+            laps["TrackStatus"] = combined_status[inverse.reshape(-1)]
 
     @soft_exceptions("first lap time",
                      "Failed to add first lap time from Ergast!",
@@ -2166,7 +3295,10 @@ class Session:
     @soft_exceptions("track status data", "Failed to load track status data!",
                      _logger)
     def _load_track_status_data(self, livedata=None):
-        track_status = api.track_status_data(self.api_path, livedata=livedata)
+        track_status = api.track_status_data(
+            self.api_path, livedata=livedata,
+            response=self._get_prefetched("track_status")
+        )
         self._track_status = pd.DataFrame(track_status)
         if not self._track_status.size:
             _logger.warning("Could not load any valid session status "
@@ -2179,7 +3311,10 @@ class Session:
         # Lap count data only exists for race-like sessions.
         if self.name in self._RACE_LIKE_SESSIONS:
             try:
-                lap_count = api.lap_count(self.api_path, livedata=livedata)
+                lap_count = api.lap_count(
+                    self.api_path, livedata=livedata,
+                    response=self._get_prefetched("lap_count")
+                )
                 # 'TotalLaps' is intended lap count, use last value that is not
                 # None in case of wrong data being corrected later. Shouldn't
                 # usually change.
@@ -2197,8 +3332,10 @@ class Session:
     def _load_session_status_data(self, livedata=None):
         # check when a session was started; for a race this indicates the
         # start of the race
-        session_status = api.session_status_data(self.api_path,
-                                                 livedata=livedata)
+        session_status = api.session_status_data(
+            self.api_path, livedata=livedata,
+            response=self._get_prefetched("session_status")
+        )
         for i in range(len(session_status["Status"])):
             if session_status["Status"][i] == "Started":
                 self._session_start_time = session_status["Time"][i]
@@ -2338,95 +3475,72 @@ class Session:
         on provided information which can't catch all problems
         """
         # TODO: check for outliers in lap start position
+        laps = self._laps
+        is_drv_lap = laps["DriverNumber"].isin(self.drivers).to_numpy()
+
+        # previous lap of the same driver
+        drv_groups = laps.groupby("DriverNumber", sort=False)
+        has_prev = (drv_groups.cumcount() > 0).to_numpy()
+        prev_time = drv_groups["Time"].shift()
+        prev_status = drv_groups["TrackStatus"].shift()
+
+        # require existence, non-existence and specific values for
+        # some variables
+        check_1 = (laps["PitInTime"].isna()
+                   & laps["PitOutTime"].isna()
+                   & ~laps["FastF1Generated"].astype(bool)
+                   # slightly paranoid, allow only green + yellow flag
+                   & laps["TrackStatus"].isin(("1", "2", "12", "21"))
+                   & laps["LapTime"].notna()
+                   & laps["Sector1Time"].notna()
+                   & laps["Sector2Time"].notna()
+                   & laps["Sector3Time"].notna()).to_numpy()
+
+        # only do check 2 if all necessary values for this check are even
+        # available (data not available means fail);
+        # sum of sector times should be almost equal to lap time
+        # (tolerance 3ms)
+        lap_time = _total_seconds(laps["LapTime"])
+        sector_sum = _total_seconds(laps["Sector1Time"]
+                                    + laps["Sector2Time"]
+                                    + laps["Sector3Time"])
+        check_2 = check_1 & (np.abs(sector_sum - lap_time) <= 0.003)
+
+        # first lap after safety car often has timing issues
+        # (as do all laps under safety car)
+        check_3 = ~has_prev | (prev_status != "4").to_numpy()
+
+        # If the difference between the end time of the previous lap and
+        # the end time of this lap is within a certain tolerance, the lap
+        # time data is considered to be valid.
+        pre_check_4 = (laps["Time"].notna() & laps["LapTime"].notna()
+                       & prev_time.notna()).to_numpy() & has_prev
+        time_diff = _total_seconds(laps["Time"] - prev_time)
+        check_4 = ~pre_check_4 | (np.abs(time_diff - lap_time) <= 0.003)
+
+        integrity_error = ((check_1 & ~check_2)
+                           | (pre_check_4 & ~check_4))
+        is_accurate = check_1 & check_2 & check_3 & check_4
+
+        laps.loc[is_drv_lap, "IsAccurate"] = is_accurate[is_drv_lap]
+
+        drv_numbers = laps.loc[is_drv_lap, "DriverNumber"]
+        n_laps = drv_numbers.value_counts()
+        n_errors = pd.Series(integrity_error[is_drv_lap]) \
+            .groupby(drv_numbers.to_numpy()).sum()
         for drv in self.drivers:
-            is_accurate = []
-            prev_lap = None
-            integrity_errors = 0
-            for _, lap in self.laps[self.laps["DriverNumber"] == drv] \
-                    .iterrows():
-                lap_integrity_ok = True
-                # require existence, non-existence and specific values for
-                # some variables
-                check_1 = (pd.isna(lap["PitInTime"])
-                           & pd.isna(lap["PitOutTime"])
-                           & (not lap["FastF1Generated"])
-                           # slightly paranoid, allow only green + yellow flag
-                           & (lap["TrackStatus"] in ("1", "2", "12", "21"))
-                           & (not pd.isna(lap["LapTime"]))
-                           & (not pd.isna(lap["Sector1Time"]))
-                           & (not pd.isna(lap["Sector2Time"]))
-                           & (not pd.isna(lap["Sector3Time"])))
-
-                if check_1:
-                    # only do check 2 if all necessary values for this check
-                    # are even available;
-                    # sum of sector times should be almost equal to lap time
-                    # (tolerance 3ms)
-                    check_2 = np.allclose(
-                        np.sum((lap["Sector1Time"], lap["Sector2Time"],
-                                lap["Sector3Time"])).total_seconds(),
-                        lap["LapTime"].total_seconds(),
-                        atol=0.003, rtol=0, equal_nan=False
-                    )
-                    if not check_2:
-                        lap_integrity_ok = False
-                else:
-                    check_2 = False  # data not available means fail
-
-                if prev_lap is not None:
-                    # first lap after safety car often has timing issues
-                    # (as do all laps under safety car)
-                    check_3 = prev_lap["TrackStatus"] != "4"
-                else:
-                    check_3 = True  # no previous lap, no SC error
-
-                pre_check_4 = (((not pd.isna(lap["Time"]))
-                               & (not pd.isna(lap["LapTime"])))
-                               and (prev_lap is not None)
-                               and (not pd.isna(prev_lap["Time"])))
-
-                if pre_check_4:  # needed condition for check_4
-                    time_diff = np.sum((lap["Time"],
-                                        -1 * prev_lap["Time"])).total_seconds()
-                    lap_time = lap["LapTime"].total_seconds()
-                    # If the difference between the two times is within a
-                    # certain tolerance, the lap time data is considered
-                    # to be valid.
-                    check_4 = np.allclose(time_diff, lap_time,
-                                          atol=0.003, rtol=0, equal_nan=False)
-
-                    if not check_4:
-                        lap_integrity_ok = False
-
-                else:
-                    check_4 = True
-
-                if not lap_integrity_ok:
-                    integrity_errors += 1
-
-                result = check_1 and check_2 and check_3 and check_4
-                is_accurate.append(result)
-                prev_lap = lap
-
-            if len(is_accurate) > 0:
-                self._laps.loc[
-                    self.laps["DriverNumber"] == drv, "IsAccurate"
-                ] = is_accurate
-            else:
+            if n_laps.get(drv, 0) == 0:
                 _logger.warning(f"Failed to perform lap accuracy check - all "
                                 f"laps marked as inaccurate (driver {drv})")
-                self._laps.loc[
-                    self.laps["DriverNumber"] == drv, "IsAccurate"
-                ] = False  # default should be inaccurate
-
-            # necessary to explicitly cast to bool
-            self._laps[["IsAccurate"]] \
-                = self._laps[["IsAccurate"]].astype(bool)
 
-            if integrity_errors > 0:
+            if n_errors.get(drv, 0) > 0:
                 _logger.warning(
                     f"Driver {drv: >2}: Lap timing integrity check "
-                    f"failed for {integrity_errors} lap(s)")
+                    f"failed for {n_errors[drv]} lap(s)")
+
+        if len(self.drivers) > 0:
+            # necessary to explicitly cast to bool
+            laps[["IsAccurate"]] = laps[["IsAccurate"]].astype(bool)
 
     @soft_exceptions("results", "Failed to load results data!", _logger)
     def _load_drivers_results(self, *, livedata=None):
@@ -2530,7 +3644,10 @@ class Session:
 
     def _drivers_from_f1_api(self, *, livedata=None):
         try:
-            f1di = api.driver_info(self.api_path, livedata=livedata)
+            f1di = api.driver_info(
+                self.api_path, livedata=livedata,
+                response=self._get_prefetched("driver_list")
+            )
         except Exception as exc:
             _logger.warning("Failed to load extended driver information!")
             _logger.debug("Exception while loading driver list", exc_info=exc)
@@ -2680,21 +3797,58 @@ class Session:
 
     @soft_exceptions("weather data", "Failed to load weather data!", _logger)
     def _load_weather_data(self, livedata=None):
-        weather_data = api.weather_data(self.api_path, livedata=livedata)
+        weather_data = api.weather_data(
+            self.api_path, livedata=livedata,
+            response=self._get_prefetched("weather_data")
+        )
         weather_df = pd.DataFrame(weather_data)
         self._weather_data = weather_df
 
     @soft_exceptions("race control messages",
                      "Failed to load race control messages!", _logger)
     def _load_race_control_messages(self, livedata=None):
-        race_control_messages = api.race_control_messages(self.api_path,
-                                                          livedata=livedata)
+        race_control_messages = api.race_control_messages(
+            self.api_path, livedata=livedata,
+            response=self._get_prefetched("race_control_messages")
+        )
         race_control_df = pd.DataFrame(race_control_messages)
         self._race_control_messages = race_control_df
 
+    def _resolve_time_window(self, time_window: tuple) \
+            -> tuple[pd.Timedelta, pd.Timedelta]:
+        # convert the bounds of a time window to session times; integer
+        # bounds are lap numbers
+        start, end = time_window
+        if isinstance(start, (int, np.integer)) \
+                or isinstance(end, (int, np.integer)):
+            laps = getattr(self, "_laps", None)
+            if laps is None:
+                raise ValueError("Laps need to be loaded to select a time "
+                                 "window by lap numbers.")
+
+        if isinstance(start, (int, np.integer)):
+            start_time = laps.loc[laps["LapNumber"] == start,
+                                  "LapStartTime"].min()
+            if pd.isna(start_time):
+                raise ValueError(f"No start time for lap {start}")
+            start = start_time
+
+        if isinstance(end, (int, np.integer)):
+            end_time = laps.loc[laps["LapNumber"] == end, "Time"].max()
+            if pd.isna(end_time):
+                raise ValueError(f"No end time for lap {end}")
+            end = end_time
+
+        return pd.Timedelta(start), pd.Timedelta(end)
+
     @soft_exceptions("telemetry data", "Failed to load telemetry data!",
                      _logger)
-    def _load_telemetry(self, livedata: LiveTimingData = None):
+    def _load_telemetry(self, livedata: LiveTimingData = None,
+                        decode_workers: int | None = None,
+                        drivers: list[str] | None = None,
+                        time_window: tuple[pd.Timedelta, pd.Timedelta]
+                        | None = None,
+                        compact_dtypes: bool = False):
         """Load telemetry data from the API.
 
         This method can only be called after :meth:`load_laps` has been
@@ -2707,6 +3861,8 @@ class Session:
         instance of :class:`Telemetry` is created per driver. The properties
         :attr:`Session.car_data` and :attr:`Session.pos_data` are dictionaries
         which hold the the `Telemetry` objects keyed by driver number.
+        The `Telemetry` object for a driver is only created when it is
+        accessed for the first time.
 
         The telemetry data can either be accessed through the above mentioned
         attributes or conveniently on a per ap basis through :class:`Lap`
@@ -2719,50 +3875,41 @@ class Session:
         Args:
             livedata: instead of requesting the data from the api, locally
                 saved livetiming data can be used as a data source
+            decode_workers: number of worker processes that are used for
+                decoding the raw data
+            drivers: driver numbers of the drivers for which telemetry is
+                loaded; all drivers by default
+            time_window: only telemetry within this window of session times
+                is loaded; all telemetry by default
+            compact_dtypes: use smaller data types for the telemetry
+                channels
         """
         try:
-            car_data = api.car_data(self.api_path, livedata=livedata)
+            car_data = api.car_data(
+                self.api_path, livedata=livedata, workers=decode_workers,
+                response=self._get_prefetched("car_data"), drivers=drivers,
+                time_window=time_window
+            )
         except api.SessionNotAvailableError:
             _logger.warning("Car telemetry data is unavailable!")
             car_data = {}
 
         try:
-            pos_data = api.position_data(self.api_path, livedata=livedata)
+            pos_data = api.position_data(
+                self.api_path, livedata=livedata, workers=decode_workers,
+                response=self._get_prefetched("position"), drivers=drivers,
+                time_window=time_window
+            )
         except api.SessionNotAvailableError:
             _logger.warning("Car position data is unavailable!")
             pos_data = {}
 
         self._calculate_t0_date(car_data, pos_data)
 
-        self._car_data = {}
-        self._pos_data = {}
-
-        for (src, processed) in ((car_data, self._car_data),
-                                 (pos_data, self._pos_data)):
-            if not src:
-                continue
-
-            for drv in self.drivers:
-                # drop and recalculate timestamps based on 'Date', because
-                # 'Date' has a higher resolution
-                try:
-                    drv_car = Telemetry(
-                        src[drv].drop(labels="Time", axis=1),
-                        session=self,
-                        driver=drv,
-                        drop_unknown_channels=True,
-                        _cast_default_cols=True
-                    )
-                except KeyError:
-                    # not pos data or car data exists for this driver
-                    continue
-
-                drv_car["Date"] = drv_car["Date"].dt.round("ms")
-
-                drv_car["Time"] = drv_car["Date"] - self.t0_date
-                drv_car["SessionTime"] = drv_car["Time"]
-
-                processed[drv] = drv_car
+        # telemetry objects are only created when the data of a driver is
+        # accessed for the first time
+        self._car_data = _TelemetryMapping(self, car_data, compact_dtypes)
+        self._pos_data = _TelemetryMapping(self, pos_data, compact_dtypes)
 
         if hasattr(self, "_laps"):
             self._laps["LapStartDate"] \
@@ -2811,6 +3958,176 @@ class Session:
         )
         return circuit_info
 
+    _MEMORY_COMPONENTS = ("laps", "car_data", "pos_data", "weather_data",
+                          "race_control_messages", "telemetry_cache")
+
+    def memory_usage(self) -> pd.DataFrame:
+        """Memory usage of the loaded data in bytes.
+
+        The memory usage is determined deeply, i.e. including the memory that
+        is used by Python objects like strings. It is reported for the
+        following components:
+
+            - ``'laps'``: :attr:`Session.laps`
+            - ``'car_data'``: :attr:`Session.car_data`
+            - ``'pos_data'``: :attr:`Session.pos_data`
+            - ``'weather_data'``: :attr:`Session.weather_data`
+            - ``'race_control_messages'``:
+              :attr:`Session.race_control_messages`
+            - ``'telemetry_cache'``: Telemetry that is cached by the
+              :attr:`Lap.telemetry` and :attr:`Laps.telemetry` properties of
+              laps of this session, as long as these laps still exist, and
+              the distance of all drivers that is integrated once for
+              calculating the driver ahead
+
+        For car data and position data, the raw data is counted for drivers
+        whose telemetry was not yet created. Raw data in the columnar stage 2
+        cache is only counted once it was loaded from disk. Components that
+        are not loaded have a memory usage of zero.
+
+        Returns:
+            A DataFrame with one row per component. The column 'Total'
+            contains the total memory usage of each component. Additionally,
+            there is one column per driver number, which contains the memory
+            usage of the data of this driver. Components that are not split
+            by driver have no value in the driver columns.
+        """
+        drivers = list(getattr(self, "_results", {}).get("DriverNumber", []))
+        usage = {comp: {} for comp in self._MEMORY_COMPONENTS}
+
+        laps = getattr(self, "_laps", None)
+        if laps is not None:
+            usage["laps"]["Total"] = _memory_usage(laps)
+            for drv, drv_laps in laps.groupby("DriverNumber"):
+                usage["laps"][drv] = _memory_usage(drv_laps)
+
+        for comp, attr in (("car_data", "_car_data"),
+                           ("pos_data", "_pos_data")):
+            tel_data = getattr(self, attr, None)
+            if tel_data is None:
+                continue
+            if isinstance(tel_data, _TelemetryMapping):
+                drv_usage = tel_data.memory_usage()
+            else:
+                drv_usage = {drv: _memory_usage(tel)
+                             for drv, tel in tel_data.items()}
+            usage[comp].update(drv_usage)
+            usage[comp]["Total"] = sum(drv_usage.values())
+
+        for comp, attr in (("weather_data", "_weather_data"),
+                           ("race_control_messages",
+                            "_race_control_messages")):
+            data = getattr(self, attr, None)
+            if data is not None:
+                usage[comp]["Total"] = _memory_usage(data)
+
+        cache_usage = usage["telemetry_cache"]
+        cache_usage["Total"] = 0
+        for laps in list(self._cached_telemetry.values()):
+            tel = laps.__dict__.get("telemetry")
+            if tel is None:
+                continue
+            nbytes = _memory_usage(tel)
+            cache_usage["Total"] += nbytes
+            if isinstance(laps, Lap):
+                laps_drivers = [laps["DriverNumber"]]
+            else:
+                laps_drivers = laps["DriverNumber"].unique()
+            for drv in laps_drivers:
+                cache_usage[drv] = cache_usage.get(drv, 0) \
+                    + nbytes // len(laps_drivers)
+        distances = getattr(self, "_driver_distances", None)
+        if distances is not None:
+            for drv, nbytes in distances.memory_usage().items():
+                cache_usage["Total"] += nbytes
+                cache_usage[drv] = cache_usage.get(drv, 0) + nbytes
+
+        for comp_usage in usage.values():
+            comp_usage.setdefault("Total", 0)
+            for drv in comp_usage:
+                if drv != "Total" and drv not in drivers:
+                    drivers.append(drv)
+
+        return pd.DataFrame.from_dict(usage, orient="index",
+                                      columns=["Total", *drivers]) \
+            .astype("Int64")
+
+    def release(self, *components: str,
+                drivers: Iterable[str] | None = None):
+        """Release loaded data to free memory.
+
+        Released data is no longer available until it is loaded again by
+        calling :meth:`Session.load`. For example, position data can be
+        released while laps and car data are kept::
+
+            session.release("pos_data")
+
+        Note that the memory is only freed if no other references to the
+        data exist, for example telemetry that was sliced from the released
+        data is not affected.
+
+        Args:
+            *components: One or multiple components that are released. See
+                :meth:`memory_usage` for the available components.
+            drivers: Driver numbers (as string) of the drivers for which data
+                is released. This is only supported for the components
+                ``'car_data'``, ``'pos_data'`` and ``'telemetry_cache'``. By
+                default, the data of all drivers is released.
+        """
+        if not components:
+            raise ValueError("No components given.")
+        for comp in components:
+            if comp not in self._MEMORY_COMPONENTS:
+                raise ValueError(f"Unknown component '{comp}'")
+            if (drivers is not None) and (comp not in ("car_data", "pos_data",
+                                                       "telemetry_cache")):
+                raise ValueError(f"Cannot release component '{comp}' for "
+                                 f"individual drivers.")
+        if drivers is not None:
+            drivers = [str(drv) for drv in drivers]
+
+        for comp in components:
+            if comp in ("laps", "car_data", "telemetry_cache"):
+                # integrated distance, calculated from laps and car data
+                self._driver_distances = None
+
+            if comp == "telemetry_cache":
+                for key, laps in list(self._cached_telemetry.items()):
+                    if drivers is not None:
+                        if isinstance(laps, Lap):
+                            laps_drivers = {laps["DriverNumber"]}
+                        else:
+                            laps_drivers = set(laps["DriverNumber"])
+                        if laps_drivers.isdisjoint(drivers):
+                            continue
+                    laps.__dict__.pop("telemetry", None)
+                    del self._cached_telemetry[key]
+
+            elif not hasattr(self, f"_{comp}"):
+                continue  # not loaded
+
+            elif drivers is not None:
+                tel_data = getattr(self, f"_{comp}")
+                for drv in drivers:
+                    if drv in tel_data:
+                        del tel_data[drv]
+
+            else:
+                delattr(self, f"_{comp}")
+
+    def _get_driver_distances(self) -> _DriverDistances:
+        # integrated distance of all drivers for calculating the driver
+        # ahead; recalculated if laps or car data have changed
+        distances = getattr(self, "_driver_distances", None)
+        if (distances is None) or not distances.is_current(self):
+            distances = self._driver_distances = _DriverDistances(self)
+        return distances
+
+    def _register_cached_telemetry(self, laps: Union["Lap", "Laps"]):
+        # keep track of laps with cached telemetry for memory_usage and
+        # release
+        self._cached_telemetry[id(laps)] = laps
+
     def _calculate_t0_date(self, *tel_data_sets: dict):
         """
         Calculate the date timestamp at which data for this session is
@@ -2829,14 +4146,26 @@ class Session:
             tel_data_sets: Dictionaries containing car telemetry data or
                 position data
         """
-        date_offset = None
-
-        data = []
+        offsets = []
         for tds in tel_data_sets:
-            data.extend(list(tds.values()))
+            if getattr(tds, "date_offset", None) is not None:
+                # the data holds the offset of all data, including drivers
+                # that are not selected and data outside the time window, so
+                # that t0_date does not depend on the selection
+                offsets.append(tds.date_offset)
+                continue
+            for drv in tds:
+                if isinstance(tds, columnar_cache.ColumnarFrames):
+                    # only read the required columns and do not keep them,
+                    # so that the data of each driver is still loaded
+                    # lazily when its telemetry is created
+                    d = tds.load(drv, columns=("Date", "Time"))
+                else:
+                    d = tds[drv]
+                offsets.append(max(d["Date"] - d["Time"]))
 
-        for d in data:
-            new_offset = max(d["Date"] - d["Time"])
+        date_offset = None
+        for new_offset in offsets:
             if date_offset is None or new_offset > date_offset:
                 date_offset = new_offset
 
@@ -2949,7 +4278,10 @@ class Laps(BaseDataFrame):
 
         Returns:
             instance of :class:`Telemetry`"""
-        return self.get_telemetry()
+        telemetry = self.get_telemetry()
+        if isinstance(getattr(self, "session", None), Session):
+            self.session._register_cached_telemetry(self)
+        return telemetry
 
     def join(self, *args, **kwargs):
         """Wraps :meth:`pandas.DataFrame.join` and adds metadata propagation.
@@ -3026,6 +4358,192 @@ class Laps(BaseDataFrame):
         merged = pos_data.merge_channels(car_data, frequency=frequency)
         return merged.slice_by_lap(self, interpolate_edges=True)
 
+    def get_telemetry_batch(
+            self,
+            *,
+            frequency: int | Literal["original"] | None = None,
+            driver_ahead: bool = True,
+            as_dict: bool = False
+    ) -> Telemetry | dict[tuple[str, float], Telemetry]:
+        """Telemetry data for each individual lap in `self`
+
+        This returns the same data as calling :meth:`Lap.get_telemetry` for
+        each lap, but it is much faster when telemetry for many laps is
+        needed. Car data and position data are merged and the driver ahead
+        is calculated only once per driver. The result is then split into
+        laps. `self` may contain laps of multiple drivers.
+
+        Because the data of each driver is merged as a whole, interpolated
+        values can differ very slightly from the result of
+        :meth:`Lap.get_telemetry`. If the data is resampled, the time base
+        starts at the first sample of each driver instead of at the start of
+        each lap. The channels 'Distance' and 'RelativeDistance' are
+        calculated for each lap individually, as usual.
+
+        Laps without a start time or end time are skipped.
+
+        Args:
+            frequency: Optional frequency to overwrite the default value set by
+                :attr:`~Telemetry.TELEMETRY_FREQUENCY`.
+                (Either string 'original' or integer for a frequency in Hz)
+            driver_ahead: Add the 'DriverAhead' and 'DistanceToDriverAhead'
+                channels. Calculating them is the most time-consuming part
+                and can be skipped if they are not needed.
+            as_dict: Return a dictionary of :class:`Telemetry` objects, one
+                for each lap and keyed by ``(DriverNumber, LapNumber)``,
+                instead of a single object.
+
+        Returns:
+            instance of :class:`Telemetry` that contains the data of all laps
+            with additional 'DriverNumber' and 'LapNumber' columns, or a
+            dictionary of :class:`Telemetry` (see ``as_dict``)
+        """
+        laps_tel = {}
+        is_valid = self["LapStartTime"].notna() & self["Time"].notna()
+        for drv in self.loc[is_valid, "DriverNumber"].unique():
+            drv_laps = self.loc[is_valid & (self["DriverNumber"] == drv)]
+            laps_tel.update(
+                drv_laps._get_telemetry_batch_driver(frequency, driver_ahead)
+            )
+
+        if as_dict:
+            return laps_tel
+
+        if not laps_tel:
+            return Telemetry(session=self.session)
+
+        result = pd.concat(
+            [tel.assign(DriverNumber=drv, LapNumber=lap_number)
+             for (drv, lap_number), tel in laps_tel.items()],
+            ignore_index=True
+        )
+        return result.__finalize__(Telemetry(session=self.session))
+
+    def _get_telemetry_batch_driver(self, frequency, driver_ahead) \
+            -> dict[tuple[str, float], Telemetry]:
+        # Implements get_telemetry_batch for the laps of a single driver.
+        pos_data = self.get_pos_data(pad=1, pad_side="both")
+        car_data = self.get_car_data(pad=1, pad_side="both")
+        if car_data.empty or pos_data.empty:
+            return {}
+
+        start_times = self["LapStartTime"].to_numpy(dtype="timedelta64[ns]")
+        end_times = self["Time"].to_numpy(dtype="timedelta64[ns]")
+        car_time = car_data["SessionTime"].to_numpy()
+        # first and last sample of the car data of each lap
+        i_first = np.searchsorted(car_time, start_times, side="left")
+        i_last = np.searchsorted(car_time, end_times, side="right") - 1
+        has_data = i_first <= i_last
+
+        if driver_ahead:
+            drv_ahead = self._get_driver_ahead_batch(car_data, i_first,
+                                                     i_last)
+
+        # The distance is integrated once over all laps. For each lap, the
+        # distance is shifted so that it starts at the first sample of the
+        # padded lap, exactly like when it is integrated for a single lap.
+        # RelativeDistance is recalculated per lap based on that.
+        car_data = car_data.add_distance().add_relative_distance()
+        car_distance = car_data["Distance"].to_numpy()
+        car_speed = car_data["Speed"].to_numpy()
+
+        if driver_ahead:
+            car_data = car_data.merge_channels(drv_ahead, frequency=frequency)
+        merged = pos_data.merge_channels(car_data, frequency=frequency)
+
+        # the interpolated samples at the start and end of each lap are added
+        # for all laps at once
+        edge_times = np.unique(np.concatenate((start_times[has_data],
+                                               end_times[has_data])))
+        edges = Telemetry({"SessionTime": edge_times,
+                           "Date": edge_times + self.session.t0_date},
+                          session=self.session).__finalize__(merged)
+        merged = merged.merge_channels(edges, frequency="original")
+        merged_time = merged._get_sorted_time_index()
+
+        laps_tel = {}
+        for k, (_, lap) in enumerate(self.iterrows()):
+            if not has_data[k]:
+                continue  # no data for this lap
+            start_time = start_times[k]
+            i_pad_first = max(0, i_first[k] - 1)
+            i_pad_last = min(len(car_time) - 1, i_last[k] + 1)
+
+            offset = car_distance[i_pad_first] - (
+                car_speed[i_pad_first] / 3.6
+                * pd.Timedelta(car_time[i_pad_first] - start_time)
+                .total_seconds()
+            )
+            end_distance = car_distance[i_pad_last] - offset
+
+            if merged_time is not None:
+                i_start = np.searchsorted(merged_time,
+                                          start_time.view("int64"),
+                                          side="left")
+                i_end = np.searchsorted(merged_time,
+                                        end_times[k].view("int64"),
+                                        side="right")
+                tel = merged.iloc[i_start:i_end].copy()
+                tel.loc[:, "Time"] = tel["SessionTime"] - start_time
+            else:
+                tel = merged.slice_by_lap(lap)
+            tel["Distance"] = tel["Distance"] - offset
+            tel["RelativeDistance"] = tel["Distance"] / end_distance
+
+            laps_tel[(lap["DriverNumber"], lap["LapNumber"])] = tel
+
+        return laps_tel
+
+    def _get_driver_ahead_batch(
+            self,
+            car_data: Telemetry,
+            i_first: np.ndarray,
+            i_last: np.ndarray
+    ) -> Telemetry:
+        # Driver ahead for all laps of a single driver. Like in
+        # Lap.get_telemetry, it is calculated from the car data of each lap,
+        # padded by one sample and without the padding. The distance of all
+        # drivers is evaluated for all laps at once. If that is not supported,
+        # driver ahead is calculated for each lap individually.
+        car_time = car_data["SessionTime"].to_numpy()
+        i_first = np.maximum(i_first - 1, 0) + 1
+        i_last = np.minimum(i_last + 2, len(car_time)) - 2
+        valid = i_first <= i_last
+
+        distances = None
+        if isinstance(self.session, Session) and valid.any():
+            distances = self.session._get_driver_distances() \
+                .get_window_distances(car_data.driver,
+                                      car_time[i_first[valid]],
+                                      car_time[i_last[valid]])
+
+        if distances is None:
+            drv_ahead = pd.concat([
+                car_data.slice_by_lap(lap, pad=1, pad_side="both")
+                .iloc[1:-1]
+                .add_driver_ahead()
+                .loc[:, ("DriverAhead", "DistanceToDriverAhead",
+                         "Date", "Time", "SessionTime")]
+                for _, lap in self.iterrows()
+            ])
+            return drv_ahead \
+                .drop_duplicates(subset="SessionTime") \
+                .reset_index(drop=True) \
+                .__finalize__(car_data)
+
+        drv_map, rows, own_dst, other_dst, other_prev_dst = distances
+        drv_ahead, dist_to_drv_ahead = Telemetry._find_driver_ahead(
+            drv_map, own_dst, other_dst, other_prev_dst
+        )
+        # rows of the car data of the driver in the session
+        ref_tel = self.session.car_data[car_data.driver].iloc[rows]
+        return Telemetry({"DriverAhead": drv_ahead,
+                          "DistanceToDriverAhead": dist_to_drv_ahead,
+                          "Date": ref_tel["Date"].to_numpy(),
+                          "Time": ref_tel["Time"].to_numpy(),
+                          "SessionTime": ref_tel["SessionTime"].to_numpy()}) \
+            .__finalize__(car_data)
+
     def get_car_data(self, **kwargs) -> Telemetry:
         """
         Car data for all laps in `self`
@@ -3103,6 +4621,9 @@ class Laps(BaseDataFrame):
             - the last known value before the end of the lap if there are
               no values within the duration of a lap
 
+        If no weather data is available for a lap, the corresponding row only
+        contains missing values.
+
         .. note::
             The returned DataFrame will have one row for each lap in `self`.
             If `self` contains laps from multiple drivers, these may overlap
@@ -3168,16 +4689,38 @@ class Laps(BaseDataFrame):
             <BLANKLINE>
             [275 rows x 38 columns]
         """  # noqa: E501 (due to long examples and doctest output)
-        wd = [lap.get_weather_data() for _, lap in self.iterrows()]
-        if wd:
-            df = pd.concat(wd, axis=1).T
-        else:
-            df = pd.DataFrame(columns=self.session.weather_data.columns)
-
-        # restore column data types
-        for col in df.columns:
-            df[col] = df[col].astype(self.session.weather_data[col].dtype)
-
+        weather_data = self.session.weather_data
+        weather_time = weather_data["Time"].to_numpy()
+        order = None
+        if not weather_data["Time"].is_monotonic_increasing:
+            # missing values are sorted to the end
+            order = np.argsort(weather_time, kind="stable")
+            weather_time = weather_time[order]
+
+        lap_start = self["LapStartTime"].to_numpy()
+        lap_end = self["Time"].to_numpy()
+        # first sample at or after the start of the lap and number of samples
+        # up to and including the end of the lap
+        first_after_start = np.searchsorted(weather_time, lap_start, "left")
+        n_before_end = np.searchsorted(weather_time, lap_end, "right")
+        n_before_end[np.isnat(lap_end)] = 0
+
+        # use the first value within the duration of the lap or fall back
+        # to the last value before the lap ended
+        within_lap = ~np.isnat(lap_start) & (first_after_start < n_before_end)
+        index = np.where(within_lap, first_after_start, n_before_end - 1)
+        if order is not None:
+            index[index >= 0] = order[index[index >= 0]]
+
+        if (index >= 0).all():
+            return weather_data.iloc[index]
+
+        # no data for some laps: these rows only contain missing values
+        df = weather_data \
+            .reset_index(names="_WeatherIndex") \
+            .reindex(index) \
+            .set_index("_WeatherIndex")
+        df.index.name = weather_data.index.name
         return df
 
     def pick_lap(self, lap_number: int) -> "Laps":
@@ -3651,7 +5194,10 @@ class Lap(BaseSeries):
 
         Returns:
             instance of :class:`Telemetry`"""
-        return self.get_telemetry()
+        telemetry = self.get_telemetry()
+        if isinstance(getattr(self, "session", None), Session):
+            self.session._register_cached_telemetry(self)
+        return telemetry
 
     def get_telemetry(self,
                       *,
@@ -0,0 +1,244 @@
+"""Columnar storage format for the stage 2 cache.
+
+Results of API functions that consist of one DataFrame per driver (car data
+and position data) can be stored in a columnar format instead of a single
+pickle file. Each column of each driver's DataFrame is saved as a separate
+``.npy`` file in a subdirectory per driver. A ``manifest.json`` file contains
+the cache version, the drivers and the names and data types of all columns.
+Columns of object dtype are stored as integer codes and their categories are
+saved in the manifest. If only the data of some drivers was parsed, the
+manifest additionally contains this selection of drivers. The latest
+``Date - Time`` of all data, from which the session's ``t0_date`` is
+calculated, is saved in the manifest as well if it is known.
+
+The data is loaded lazily. The data of a driver is only read when it is
+accessed for the first time and the column files are memory-mapped. Only the
+data of the drivers and columns that are actually used is read from disk.
+"""
+import json
+import os
+import re
+import shutil
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Mapping
+)
+
+import numpy as np
+import pandas as pd
+
+from fastf1.internals.pandas_extensions import create_df_fast
+
+
+_MANIFEST_NAME = "manifest.json"
+_SAFE_NAME = re.compile(r"^[\w\-]+$")
+
+
+def is_supported(data) -> bool:
+    """Check whether ``data`` can be stored in the columnar format.
+
+    Supported is a non-empty dictionary of DataFrames with a default range
+    index, keyed by strings that can safely be used as directory names.
+    Object columns may only contain strings and missing values.
+    """
+    if not isinstance(data, dict) or not data:
+        return False
+
+    for key, df in data.items():
+        if not isinstance(key, str) or not _SAFE_NAME.match(key):
+            return False
+        if not isinstance(df, pd.DataFrame):
+            return False
+        if not (isinstance(df.index, pd.RangeIndex)
+                and df.index.start == 0 and df.index.step == 1):
+            return False
+        if df.columns.has_duplicates \
+                or not all(isinstance(col, str) for col in df.columns):
+            return False
+
+        for col in df.columns:
+            dtype = df[col].dtype
+            if not isinstance(dtype, np.dtype):
+                return False  # extension dtypes are not supported
+            if (dtype.kind == "O") and pd.api.types.infer_dtype(
+                    df[col], skipna=True) not in ("string", "empty"):
+                return False
+
+    return True
+
+
+def write(path: str, data: dict[str, pd.DataFrame], version: int,
+          drivers: list[str] | None = None,
+          date_offset: pd.Timestamp | None = None):
+    """Write a dictionary of DataFrames to a columnar cache directory.
+
+    The data is first written to a temporary directory that replaces any
+    existing cache directory once all data has been written successfully.
+
+    Args:
+        path: path of the cache directory
+        data: the data that is cached
+        version: cache version
+        drivers: selection of drivers for which the data was parsed;
+            ``None`` if the data contains all drivers
+        date_offset: latest ``Date - Time`` of the data of all drivers,
+            including drivers that are not part of the selection
+    """
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+
+    manifest = {"version": version, "selection": drivers, "drivers": {},
+                "date_offset": (None if date_offset is None
+                                else pd.Timestamp(date_offset).value)}
+    for key, df in data.items():
+        os.mkdir(os.path.join(tmp_path, key))
+        columns = []
+        for n, col in enumerate(df.columns):
+            values = df[col].to_numpy()
+            entry = {"name": col, "dtype": str(values.dtype)}
+            if values.dtype.kind == "O":
+                values, entry["categories"] = _encode_objects(values)
+            np.save(os.path.join(tmp_path, key, f"{n}.npy"), values,
+                    allow_pickle=False)
+            columns.append(entry)
+        manifest["drivers"][key] = {"length": len(df), "columns": columns}
+
+    # the manifest is written last, the cached data is considered to be
+    # invalid if it does not exist
+    with open(os.path.join(tmp_path, _MANIFEST_NAME), "w") as manifest_file:
+        json.dump(manifest, manifest_file)
+
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp_path, path)
+
+
+def read(path: str) -> dict | None:
+    """Read a columnar cache directory.
+
+    Returns a dictionary with the cache ``version``, the lazily loaded
+    ``data`` and the selection of ``drivers`` for which the data was parsed
+    (``None`` if it contains all drivers). ``None`` is returned instead if the
+    directory does not contain valid cached data.
+    """
+    try:
+        with open(os.path.join(path, _MANIFEST_NAME)) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or "drivers" not in manifest:
+        return None
+
+    date_offset = manifest.get("date_offset")
+    if date_offset is not None:
+        date_offset = pd.Timestamp(date_offset)
+
+    return {"version": manifest.get("version"),
+            "data": ColumnarFrames(path, manifest["drivers"], date_offset),
+            "drivers": manifest.get("selection")}
+
+
+def _encode_objects(values: np.ndarray) -> tuple[np.ndarray, list]:
+    categories = {}
+    codes = np.fromiter(
+        (categories.setdefault(val, len(categories)) for val in values),
+        dtype="int32", count=len(values)
+    )
+    return codes, list(categories)
+
+
+class ColumnarFrames(Mapping):
+    """Read-only mapping of lazily loaded DataFrames from a columnar cache
+    directory.
+
+    Each DataFrame is loaded on first access and is kept afterward. Use
+    :meth:`load` to read only some of the columns. The latest ``Date - Time``
+    of all data is available as ``date_offset`` (``None`` if unknown).
+    """
+    def __init__(self, path: str, drivers: dict,
+                 date_offset: pd.Timestamp | None = None):
+        self._path = path
+        self._drivers = drivers
+        self._frames = {}
+        self.date_offset = date_offset
+
+    def __getitem__(self, key: str) -> pd.DataFrame:
+        if key not in self._frames:
+            self._frames[key] = self.load(key)
+        return self._frames[key]
+
+    def __contains__(self, key) -> bool:
+        # avoid loading the data, which the default implementation would do
+        return key in self._drivers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._drivers)
+
+    def __len__(self) -> int:
+        return len(self._drivers)
+
+    def __repr__(self) -> str:
+        return f"ColumnarFrames({self._path!r}, keys={list(self._drivers)})"
+
+    def get_loaded(self, key: str) -> pd.DataFrame | None:
+        """Return the DataFrame for ``key`` if it was loaded already.
+
+        The data is not loaded if it was not accessed before, ``None`` is
+        returned instead.
+        """
+        return self._frames.get(key)
+
+    def select(self, keys: Iterable[str]) -> "ColumnarFrames":
+        """Return a new mapping that only contains the given keys.
+
+        Keys that do not exist are ignored. Data that was loaded already is
+        shared with the new mapping and the date offset is kept.
+        """
+        keys = set(keys)
+        selected = ColumnarFrames(
+            self._path,
+            {key: info for key, info in self._drivers.items() if key in keys},
+            self.date_offset
+        )
+        selected._frames = {key: df for key, df in self._frames.items()
+                            if key in keys}
+        return selected
+
+    def load(self, key: str, columns: Iterable[str] | None = None) \
+            -> pd.DataFrame:
+        """Read the DataFrame for ``key`` from disk.
+
+        Args:
+            key: dictionary key of the DataFrame (usually the driver number)
+            columns: names of the columns that should be read; all columns
+                are read by default
+        """
+        info = self._drivers[key]
+        if columns is not None:
+            columns = set(columns)
+
+        arrays, names = [], []
+        for n, entry in enumerate(info["columns"]):
+            if (columns is not None) and (entry["name"] not in columns):
+                continue
+            file_path = os.path.join(self._path, key, f"{n}.npy")
+            # empty files cannot be memory-mapped; copy-on-write ensures that
+            # the data stays writable without modifying the file on disk
+            mmap_mode = "c" if info["length"] else None
+            values = np.asarray(np.load(file_path, mmap_mode=mmap_mode,
+                                        allow_pickle=False))
+            if "categories" in entry:
+                categories = np.empty(len(entry["categories"]), dtype=object)
+                categories[:] = entry["categories"]
+                values = categories[values]
+            arrays.append(values)
+            names.append(entry["name"])
+
+        if not arrays:
+            return pd.DataFrame(index=pd.RangeIndex(info["length"]))
+
+        return create_df_fast(arrays=arrays, columns=names)
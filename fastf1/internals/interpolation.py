@@ -0,0 +1,267 @@
+"""Array-based helpers for merging and interpolating telemetry channels.
+
+These functions implement the merging and interpolation steps of
+:meth:`fastf1.core.Telemetry.merge_channels` directly on numpy arrays. They
+produce the same values as the equivalent pandas operations, but avoid
+creating intermediate DataFrames.
+
+These functions are not part of the public API and may change without
+notice.
+"""
+import numpy as np
+import pandas as pd
+
+
+# methods that pandas implements with np.interp
+_NP_METHODS = ("linear", "index", "values", "time")
+
+# methods that pandas implements with scipy.interpolate.interp1d
+_INTERP1D_METHODS = ("nearest", "zero", "slinear", "quadratic", "cubic")
+
+
+def is_supported_method(method: str) -> bool:
+    """Whether :func:`interpolate` supports an interpolation method."""
+    return (method in _NP_METHODS) or (method in _INTERP1D_METHODS)
+
+
+def is_unique_timeline(values: np.ndarray) -> bool:
+    """Whether a ``datetime64[ns]`` array contains neither duplicate values
+    nor NaT."""
+    if np.isnat(values).any():
+        return False
+    if not np.all(values[1:] > values[:-1]):
+        # not strictly increasing, check for duplicates
+        sorted_values = np.sort(values)
+        if np.any(sorted_values[1:] == sorted_values[:-1]):
+            return False
+    return True
+
+
+def union_timeline(left: np.ndarray, right: np.ndarray) \
+        -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Merge two timelines into a sorted timeline of all unique values.
+
+    Args:
+        left: ``datetime64[ns]`` array without duplicate values
+        right: ``datetime64[ns]`` array without duplicate values
+
+    Returns:
+        The merged timeline and for each of its values the index of the
+        same value in ``left`` and ``right`` or -1 if the value does not
+        exist there. None is returned if one of the inputs contains
+        duplicate values or NaT.
+    """
+    if not (is_unique_timeline(left) and is_unique_timeline(right)):
+        return None
+
+    timeline = np.union1d(left, right)
+    take_left = np.full(len(timeline), -1, dtype=np.intp)
+    take_left[np.searchsorted(timeline, left)] = np.arange(len(left))
+    take_right = np.full(len(timeline), -1, dtype=np.intp)
+    take_right[np.searchsorted(timeline, right)] = np.arange(len(right))
+    return timeline, take_left, take_right
+
+
+def take(values: np.ndarray, indexer: np.ndarray) -> np.ndarray:
+    """Select values by index, where -1 creates a missing value.
+
+    The data type is promoted as necessary to hold missing values, exactly
+    like pandas does when merging data (e.g. int to float, bool to object).
+    """
+    return pd.api.extensions.take(values, indexer, allow_fill=True)
+
+
+def ffill_bfill(values: np.ndarray) -> np.ndarray:
+    """Forward fill missing values, then backward fill leading missing
+    values.
+
+    Returns the input array if there are no missing values or if all values
+    are missing.
+    """
+    valid = ~pd.isna(values)
+    if valid.all() or not valid.any():
+        return values
+    indexer = np.where(valid, np.arange(len(values)), -1)
+    np.maximum.accumulate(indexer, out=indexer)
+    indexer[indexer < 0] = np.argmax(valid)
+    return values[indexer]
+
+
+def limit_direction(method: str) -> str:
+    """Direction in which :meth:`fastf1.core.Telemetry.fill_missing` fills
+    missing values for an interpolation method.
+
+    pandas only fills leading missing values if ``limit_direction='both'``
+    is passed, which is not possible for the methods of
+    :func:`scipy.interpolate.interp1d`.
+    """
+    return "forward" if method in _INTERP1D_METHODS else "both"
+
+
+def interpolate(x: np.ndarray, values: np.ndarray, method: str,
+                limit_direction: str) -> np.ndarray:
+    """Interpolate missing values like :meth:`pandas.Series.interpolate`.
+
+    Values outside the range of valid values are extrapolated by scipy for
+    the methods of :func:`scipy.interpolate.interp1d` and set to the first
+    and last valid value for all other methods.
+
+    Args:
+        x: ``int64`` x-values (i.e. the timeline as integer nanoseconds)
+        values: Float values with missing values; not modified.
+        method: Interpolation method, see :func:`is_supported_method`
+        limit_direction: 'forward' to keep leading missing values or
+            'both' to fill them too
+
+    Returns:
+        Array with interpolated values and of the same data type as the
+        input values.
+    """
+    return interpolate_many(x, values[np.newaxis, :], method,
+                            limit_direction)[0]
+
+
+def interpolate_many(x: np.ndarray, values: np.ndarray, method: str,
+                     limit_direction: str) -> np.ndarray:
+    """Interpolate missing values of multiple channels at once.
+
+    Same as :func:`interpolate`, but ``values`` is a 2D array with one
+    channel per row. Channels with missing values in the same places share
+    a single interpolation (i.e. a single spline is computed for all of
+    them).
+    """
+    result = values
+    if method == "linear":
+        # pandas interpolates 'linear' by position, not by value
+        x = np.arange(values.shape[1])
+
+    for rows, invalid in group_by_missing(values):
+        if invalid.all() or not invalid.any():
+            continue
+        if result is values:
+            result = values.copy()
+        valid = ~invalid
+        xp = x[valid]
+        filled = interpolate_at(xp, values[np.ix_(rows, valid)],
+                                x[invalid], method)
+        if limit_direction == "forward":
+            filled[:, x[invalid] < xp[0]] = np.nan
+        result[np.ix_(rows, invalid)] = filled
+
+    return result
+
+
+def interpolate_at(xp: np.ndarray, fp: np.ndarray, x: np.ndarray,
+                   method: str) -> np.ndarray:
+    """Evaluate the interpolation of multiple channels at new x-values.
+
+    Args:
+        xp: Strictly increasing x-values of the known data
+        fp: 2D array of known values without missing values, one channel
+            per row
+        x: x-values at which the interpolation is evaluated
+        method: Interpolation method, see :func:`is_supported_method`
+
+    Returns:
+        2D ``float64`` array with one row per channel
+    """
+    if method in _NP_METHODS:
+        return np.stack([np.interp(x, xp, row) for row in fp])
+
+    from scipy.interpolate import interp1d
+    terp = interp1d(xp, fp, kind=method, axis=1,
+                    fill_value="extrapolate", bounds_error=False)
+    return terp(x)
+
+
+def resample_timeline(dates: np.ndarray, origin: np.datetime64,
+                      freq: int) -> tuple[np.ndarray, np.ndarray]:
+    """Create a fixed-frequency timeline for resampling.
+
+    The timeline and intervals are the same as those created by
+    :meth:`pandas.Series.resample` with ``origin=origin`` (intervals are
+    closed on the left and labeled by their start).
+
+    Args:
+        dates: Sorted ``datetime64[ns]`` array without NaT
+        origin: Timestamp to which the intervals are aligned
+        freq: Length of each interval in nanoseconds
+
+    Returns:
+        The start of each interval and for each value in ``dates`` the
+        index of the interval it belongs to.
+    """
+    x = dates.view("int64")
+    origin = int(np.datetime64(origin, "ns").view("int64"))
+    first, last = int(x[0]), int(x[-1])
+    start = first - (first - origin) % freq
+    end = last + freq - (last - origin) % freq
+    labels = np.arange(start, end, freq, dtype="int64")
+    return labels.view("datetime64[ns]"), (x - start) // freq
+
+
+def bin_mean(bins: np.ndarray, n_bins: int, values: np.ndarray) \
+        -> np.ndarray:
+    """Calculate the mean of all valid values in each interval.
+
+    The values are summed using Kahan summation in the data type of the
+    values, which is the same as pandas does for
+    ``Series.resample(...).mean()``, so that the results are identical.
+
+    Args:
+        bins: Sorted interval index for each value, see
+            :func:`resample_timeline`
+        n_bins: Number of intervals
+        values: 2D float array with one channel per row
+
+    Returns:
+        2D array of the same data type as ``values`` with one row per
+        channel and one column per interval. The mean of intervals without
+        valid values is NaN.
+    """
+    dtype = values.dtype
+    result = np.full((values.shape[0], n_bins), np.nan, dtype=dtype)
+
+    for i, row in enumerate(values):
+        valid = ~np.isnan(row)
+        row_bins = bins[valid]
+        row = row[valid]
+        # the n-th value of each interval is added in the n-th step, the
+        # values of all intervals are added at the same time
+        rank = np.arange(len(row_bins)) \
+            - np.searchsorted(row_bins, row_bins, side="left")
+        order = np.argsort(rank, kind="stable")
+        steps = np.cumsum(np.bincount(rank))
+        sums = np.zeros(n_bins, dtype=dtype)
+        compensation = np.zeros(n_bins, dtype=dtype)
+        with np.errstate(invalid="ignore"):
+            for step in np.split(order, steps[:-1]):
+                b = row_bins[step]
+                y = row[step] - compensation[b]
+                t = sums[b] + y
+                comp = (t - sums[b]) - y
+                # infinite values, see pandas GH#50367
+                comp[np.isnan(comp)] = 0
+                compensation[b] = comp
+                sums[b] = t
+
+        counts = np.bincount(row_bins, minlength=n_bins)
+        has_values = counts > 0
+        result[i, has_values] = \
+            sums[has_values] / counts[has_values].astype(dtype)
+
+    return result
+
+
+def group_by_missing(values: np.ndarray):
+    """Group the rows of a 2D float array by their missing values.
+
+    Yields the indices of all rows that have missing values in the same
+    places together with the mask of missing values of these rows.
+    """
+    invalid = np.isnan(values)
+    groups = {}
+    for i, row in enumerate(invalid):
+        groups.setdefault(row.tobytes(), []).append(i)
+    for rows in groups.values():
+        yield rows, invalid[rows[0]]
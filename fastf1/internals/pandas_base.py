@@ -82,29 +82,34 @@ class BaseDataFrame(pd.DataFrame):
         super().__init__(*args, **kwargs)
 
         if _cast_default_cols and (self._COLUMNS is not None):
-            for col, _type in self._COLUMNS.items():
-                if col not in self.columns:
-                    continue
-                cast = True
-                if self[col].isna().all():
-                    # empty column, set appropriate NA-type
-                    if isinstance(_type, str) and _type != "object":
-                        # type given as string, e.g. 'datetime64[ns]'
-                        self[col] = pd.Series(dtype=_type)
-                    elif type(None) in typing.get_args(_type):
-                        # type given using typing module and type is marked as
-                        # optional, e.g. typing.Optional[int]
-                        self[col] = None
-                        cast = False  # do not cast this column
-                    elif (_type == object) or (_type == "object"):  # noqa: E721, type comparison with ==
-                        # object type, set to None
-                        self[col] = None
-                        cast = False
-                    else:
-                        self[col] = _type()
-
-                if cast and (type(None) not in typing.get_args(_type)):
-                    self[col] = self[col].astype(_type)
+            self._cast_columns(self._COLUMNS)
+
+    def _cast_columns(self, columns: dict[str, Any]):
+        # cast the given columns of self to the given data types; columns
+        # that do not exist in self are skipped
+        for col, _type in columns.items():
+            if col not in self.columns:
+                continue
+            cast = True
+            if self[col].isna().all():
+                # empty column, set appropriate NA-type
+                if isinstance(_type, str) and _type != "object":
+                    # type given as string, e.g. 'datetime64[ns]'
+                    self[col] = pd.Series(dtype=_type)
+                elif type(None) in typing.get_args(_type):
+                    # type given using typing module and type is marked as
+                    # optional, e.g. typing.Optional[int]
+                    self[col] = None
+                    cast = False  # do not cast this column
+                elif (_type == object) or (_type == "object"):  # noqa: E721, type comparison with ==
+                    # object type, set to None
+                    self[col] = None
+                    cast = False
+                else:
+                    self[col] = _type()
+
+            if cast and (type(None) not in typing.get_args(_type)):
+                self[col] = self[col].astype(_type)
 
     @property
     def _constructor(self) -> Callable[..., "BaseDataFrame"]:
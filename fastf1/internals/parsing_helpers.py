@@ -5,7 +5,14 @@ notice. The thin wrappers in :mod:`fastf1.utils` provide a deprecated public
 entry point that forwards to the implementations defined here.
 """
 import datetime
-from functools import reduce
+import re
+from collections.abc import Sequence
+from functools import (
+    lru_cache,
+    reduce
+)
+
+import numpy as np
 
 from fastf1.logger import get_logger
 
@@ -41,44 +48,19 @@ def to_timedelta(x: str | datetime.timedelta) \
             - `36:54` (minutes + seconds)
             - `8:45:46` (hours, minutes, seconds)
 
+    The results of parsing strings are cached.
+
     Args:
         x: timestamp
     """
     # this is faster than using pd.timedelta on a string
     if isinstance(x, str) and len(x):
-        try:
-            hours, minutes = 0, 0
-            if len(hms := x.split(":")) == 3:
-                hours, minutes, seconds = hms
-            elif len(hms) == 2:
-                minutes, seconds = hms
-            else:
-                seconds = hms[0]
-
-            if "." in seconds:
-                seconds, msus = seconds.split(".")
-                if len(msus) < 6:
-                    msus = msus + "0" * (6 - len(msus))
-                elif len(msus) > 6:
-                    msus = msus[0:6]
-            else:
-                msus = 0
-
-            return datetime.timedelta(
-                hours=int(hours), minutes=int(minutes),
-                seconds=int(seconds), microseconds=int(msus)
-            )
-
-        except Exception as exc:
-            _logger.debug(f"Failed to parse timedelta string '{x}'",
-                          exc_info=exc)
-            return None
-
-    elif isinstance(x, datetime.timedelta):
+        return _str_to_timedelta(x)
+
+    if isinstance(x, datetime.timedelta):
         return x
 
-    else:
-        return None
+    return None
 
 
 def to_datetime(x: str | datetime.datetime) \
@@ -99,35 +81,248 @@ def to_datetime(x: str | datetime.datetime) \
             - `2020-12-13T13:27:15.32Z`
             - `2020-12-13T13:27:15`
 
+    The results of parsing strings are cached.
+
     Args:
         x: timestamp
     """
     if isinstance(x, str) and x:
-        try:
-            date, time = x.strip("Z").split("T")
-            year, month, day = date.split("-")
-            hours, minutes, seconds = time.split(":")
-            if "." in seconds:
-                seconds, msus = seconds.split(".")
-                if len(msus) < 6:
-                    msus = msus + "0" * (6 - len(msus))
-                elif len(msus) > 6:
-                    msus = msus[0:6]
-            else:
-                msus = 0
-
-            return datetime.datetime(
-                int(year), int(month), int(day), int(hours),
-                int(minutes), int(seconds), int(msus)
-            )
-
-        except Exception as exc:
-            _logger.debug(f"Failed to parse datetime string '{x}'",
-                          exc_info=exc)
-            return None
-
-    elif isinstance(x, datetime.datetime):
+        return _str_to_datetime(x)
+
+    if isinstance(x, datetime.datetime):
         return x
 
-    else:
+    return None
+
+
+# Timestamp strings are often repeated in the raw data. The parsed objects
+# are immutable and can be shared safely.
+@lru_cache(maxsize=65536)
+def _str_to_timedelta(x: str) -> datetime.timedelta | None:
+    try:
+        hours, minutes = 0, 0
+        if len(hms := x.split(":")) == 3:
+            hours, minutes, seconds = hms
+        elif len(hms) == 2:
+            minutes, seconds = hms
+        else:
+            seconds = hms[0]
+
+        if "." in seconds:
+            seconds, msus = seconds.split(".")
+            if len(msus) < 6:
+                msus = msus + "0" * (6 - len(msus))
+            elif len(msus) > 6:
+                msus = msus[0:6]
+        else:
+            msus = 0
+
+        return datetime.timedelta(
+            hours=int(hours), minutes=int(minutes),
+            seconds=int(seconds), microseconds=int(msus)
+        )
+
+    except Exception as exc:
+        _logger.debug(f"Failed to parse timedelta string '{x}'",
+                      exc_info=exc)
         return None
+
+
+@lru_cache(maxsize=65536)
+def _str_to_datetime(x: str) -> datetime.datetime | None:
+    try:
+        date, time = x.strip("Z").split("T")
+        year, month, day = date.split("-")
+        hours, minutes, seconds = time.split(":")
+        if "." in seconds:
+            seconds, msus = seconds.split(".")
+            if len(msus) < 6:
+                msus = msus + "0" * (6 - len(msus))
+            elif len(msus) > 6:
+                msus = msus[0:6]
+        else:
+            msus = 0
+
+        return datetime.datetime(
+            int(year), int(month), int(day), int(hours),
+            int(minutes), int(seconds), int(msus)
+        )
+
+    except Exception as exc:
+        _logger.debug(f"Failed to parse datetime string '{x}'",
+                      exc_info=exc)
+        return None
+
+
+def to_timedelta_array(values: Sequence | np.ndarray) -> np.ndarray:
+    """Convert a sequence of time strings to a ``timedelta64[ns]`` array.
+
+    This is the bulk version of :func:`to_timedelta` and accepts the same
+    string formats. The strings are parsed with vectorized operations.
+    Values that cannot be parsed this way fall back to
+    :func:`to_timedelta`. Invalid values are returned as ``NaT``.
+
+    Args:
+        values: one-dimensional sequence of timestamps
+    """
+    values, str_mask = _as_string_array(values)
+    result = np.full(len(values), np.timedelta64("NaT"),
+                     dtype="timedelta64[ns]")
+    fallback = ~str_mask
+
+    if str_mask.any():
+        idx = np.flatnonzero(str_mask)
+        parsed, valid = _parse_timedelta_strings(values[idx].astype(str))
+        result[idx[valid]] = parsed[valid]
+        fallback[idx[~valid]] = True
+
+    for i in np.flatnonzero(fallback):
+        if (td := to_timedelta(values[i])) is not None:
+            result[i] = np.timedelta64(td, "ns")
+
+    return result
+
+
+def to_datetime_array(values: Sequence | np.ndarray) -> np.ndarray:
+    """Convert a sequence of date strings to a ``datetime64[ns]`` array.
+
+    This is the bulk version of :func:`to_datetime` and accepts the same
+    string formats. The strings are parsed with vectorized operations.
+    Values that cannot be parsed this way fall back to
+    :func:`to_datetime`. Invalid values are returned as ``NaT``.
+
+    Args:
+        values: one-dimensional sequence of timestamps
+    """
+    values, str_mask = _as_string_array(values)
+    result = np.full(len(values), np.datetime64("NaT"),
+                     dtype="datetime64[ns]")
+    fallback = ~str_mask
+
+    if str_mask.any():
+        idx = np.flatnonzero(str_mask)
+        parsed, valid = _parse_datetime_strings(values[idx].astype(str))
+        result[idx[valid]] = parsed[valid]
+        fallback[idx[~valid]] = True
+
+    for i in np.flatnonzero(fallback):
+        if (dt := to_datetime(values[i])) is not None:
+            result[i] = np.datetime64(dt, "ns")
+
+    return result
+
+
+def _as_string_array(values) -> tuple[np.ndarray, np.ndarray]:
+    # returns the values as a one-dimensional array and a mask of the
+    # elements that are non-empty strings
+    if isinstance(values, np.ndarray) and values.dtype.kind == "U":
+        str_mask = values != ""
+    else:
+        values = np.asarray(values, dtype=object)
+        str_mask = np.fromiter(
+            (isinstance(val, str) and val != "" for val in values.flat),
+            dtype=bool, count=values.size
+        )
+    if values.ndim != 1:
+        raise ValueError("Expected a one-dimensional sequence of values")
+    return values, str_mask
+
+
+# Layouts of the supported string formats. All digits are replaced by '0'
+# before a string is matched against one of these patterns.
+_TIMEDELTA_LAYOUT = re.compile(
+    r"(?:(?:(?P<hours>0{1,9}):)?(?P<minutes>0{1,9}):)?(?P<seconds>0{1,9})"
+    r"(?:\.(?P<fraction>0*))?"
+)
+_DATETIME_LAYOUT = re.compile(
+    r"(?P<year>0{4})-(?P<month>0{2})-(?P<day>0{2})"
+    r"T(?P<hours>0{2}):(?P<minutes>0{2}):(?P<seconds>0{2})"
+    r"(?:\.(?P<fraction>0*))?Z*"
+)
+
+
+def _parse_fixed_width(strings: np.ndarray, layout: re.Pattern) \
+        -> tuple[dict[str, np.ndarray], np.ndarray]:
+    # Vectorized parsing of the strings in ``strings`` that match ``layout``.
+    # Strings with the same positions of digits and separators are grouped
+    # and each group is parsed column-wise. Returns the integer value of each
+    # named group of the layout (the fraction in microseconds) and a mask of
+    # the strings that match the layout.
+    n = len(strings)
+    width = strings.dtype.itemsize // 4
+    codes = strings.view(np.uint32).reshape(n, width)
+    # only ASCII characters can be part of a valid layout
+    codes = np.minimum(codes, 255).astype(np.uint8)
+
+    masked = np.where((codes >= 48) & (codes <= 57), 48, codes)
+    masked = np.ascontiguousarray(masked).view(f"V{width}").ravel()
+    unique, inverse, counts = np.unique(masked, return_inverse=True,
+                                        return_counts=True)
+    order = np.argsort(inverse.ravel(), kind="stable")
+    bounds = np.cumsum(counts)
+
+    values = {name: np.zeros(n, dtype=np.int64)
+              for name in layout.groupindex}
+    valid = np.zeros(n, dtype=bool)
+    for k, key in enumerate(unique):
+        match = layout.fullmatch(
+            key.tobytes().rstrip(b"\0").decode("latin-1")
+        )
+        if match is None:
+            continue
+
+        rows = order[bounds[k] - counts[k]:bounds[k]]
+        valid[rows] = True
+        # one contiguous row per character position
+        columns = np.ascontiguousarray(codes[rows].T)
+        for name in layout.groupindex:
+            start, stop = match.span(name)
+            scale = 1
+            if name == "fraction":
+                # truncated to microseconds
+                stop = min(stop, start + 6)
+                scale = 10 ** (6 - (stop - start))
+            value = np.zeros(len(rows), dtype=np.int64)
+            for col in range(start, stop):  # no-op if the group is missing
+                value = value * 10 + (columns[col] - 48)
+            values[name][rows] = value * scale
+
+    return values, valid
+
+
+def _parse_timedelta_strings(strings: np.ndarray) \
+        -> tuple[np.ndarray, np.ndarray]:
+    # vectorized version of ``_str_to_timedelta``
+    values, valid = _parse_fixed_width(strings, _TIMEDELTA_LAYOUT)
+    total_us = (((values["hours"] * 60 + values["minutes"]) * 60
+                 + values["seconds"]) * 1_000_000 + values["fraction"])
+    return (total_us * 1000).astype("timedelta64[ns]"), valid
+
+
+def _parse_datetime_strings(strings: np.ndarray) \
+        -> tuple[np.ndarray, np.ndarray]:
+    # vectorized version of ``_str_to_datetime``
+    values, valid = _parse_fixed_width(strings, _DATETIME_LAYOUT)
+    year, month, day = values["year"], values["month"], values["day"]
+
+    valid &= (
+        # limited to the range that can be represented with nanoseconds
+        (year > 1677) & (year < 2262)
+        & (month >= 1) & (month <= 12) & (day >= 1)
+        & (values["hours"] < 24) & (values["minutes"] < 60)
+        & (values["seconds"] < 60)
+    )
+    month_start = ((np.where(valid, year, 1970) - 1970) * 12
+                   + np.where(valid, month, 1) - 1).astype("datetime64[M]")
+    first_day = month_start.astype("datetime64[D]")
+    days_in_month = ((month_start + 1).astype("datetime64[D]")
+                     - first_day).astype(np.int64)
+    valid &= day <= days_in_month
+
+    time_us = (((values["hours"] * 60 + values["minutes"]) * 60
+                 + values["seconds"]) * 1_000_000 + values["fraction"])
+    result = (first_day
+              + np.where(valid, day - 1, 0).astype("timedelta64[D]")
+              ).astype("datetime64[ns]") \
+        + np.where(valid, time_us * 1000, 0).astype("timedelta64[ns]")
+    return result, valid
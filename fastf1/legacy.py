@@ -65,6 +65,63 @@ lap. This reference is used to project car positions and calculate
 things like distance between cars.
 """
 
+_CHUNK_SIZE = 2000
+"""Number of samples for which the relative distances between all drivers
+are calculated at once."""
+
+
+def _closest_driver_ahead(reference_s, total_s, dmap, pit_mask, drivers_list,
+                          chunk_size=_CHUNK_SIZE):
+    """Find the closest driver ahead of each driver and the distance to them.
+
+    The distance from one car to another is the distance along the reference lap from the
+    projected position of the first car to the projected position of the other car, wrapping
+    around at the finish line. It is calculated in chunks of samples for all pairs of drivers at
+    once, so that memory usage depends neither on the resolution of the reference lap nor on the
+    length of the session.
+
+    Args:
+        reference_s: distance of each point of the reference lap
+        total_s: length of the reference lap
+        dmap: index of the reference lap point onto which the position of a car is projected;
+            one row per sample and one column per driver
+        pit_mask: True where a car is out of the pits and on track; same shape as ``dmap``
+        drivers_list: array of driver numbers, one for each column of ``dmap``
+        chunk_size: number of samples that are processed at once
+
+    Returns:
+        The distance to the driver ahead and the driver number of the driver ahead, each with
+        the same shape as ``dmap``. Both are NaN or None respectively while a car is in the pits.
+    """
+    stream_length, n_drivers = dmap.shape
+    distance = np.empty((stream_length, n_drivers))
+    closest_index = np.empty((stream_length, n_drivers), dtype=int)
+    in_pit = ~pit_mask
+    diagonal = np.arange(n_drivers)
+    for start in range(0, stream_length, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        position = reference_s[dmap[chunk]]
+        # rel_distance[sample, my driver, his driver]
+        rel_distance = (position[:, np.newaxis, :]
+                        - position[:, :, np.newaxis])
+        rel_distance[rel_distance <= 0] += total_s
+
+        # ignore other cars in the pit, but never the car itself
+        ignore = np.repeat(in_pit[chunk, np.newaxis, :], n_drivers, axis=1)
+        ignore[:, diagonal, diagonal] = False
+        rel_distance[ignore] = np.nan
+
+        chunk_index = np.nanargmin(rel_distance, axis=2)
+        closest_index[chunk] = chunk_index
+        distance[chunk] = np.take_along_axis(
+            rel_distance, chunk_index[:, :, np.newaxis], axis=2
+        )[:, :, 0]
+
+    driver = drivers_list[closest_index].astype(object)
+    distance[in_pit] = np.nan
+    driver[in_pit] = None
+    return distance, driver
+
 
 def _get_reference_lap(session):
     """Find a reference lap for creating the track map in `_make_trajectory`."""
@@ -178,14 +235,6 @@ def _make_trajectory(session, ref_lap):
             projection_index[projection_index == len(reference_s)] = 0
             dmap[:, index] = fix_suzuka(projection_index.copy(), reference_s)
 
-        """Create transform matrix to change distance point of reference
-        """
-        t_matrix = np.empty((ssize, ssize))
-        for index in range(ssize):
-            rref = reference_s - reference_s[index]
-            rref[rref <= 0] = total_s + rref[rref <= 0]
-            t_matrix[index, :] = rref
-
         """Create mask to remove distance elements when car is on track
         """
         time = session.pos_data[drivers_list[0]]['Time']
@@ -213,31 +262,15 @@ def _make_trajectory(session, ref_lap):
             on_track = (session.pos_data[driver_number]['Status'] == 'OnTrack')
             pit_mask[:, driver_index] &= on_track.values
 
-        """Calculate relative distances using transform matrix
+        """Calculate relative distances from the projected positions
         """
+        distance, driver = _closest_driver_ahead(reference_s, total_s, dmap, pit_mask,
+                                                 drivers_list)
+
         driver_ahead = {}
-        stream_axis = np.arange(stream_length)
         for my_di, my_d in enumerate(drivers_list):
-            rel_distance = np.empty(np.shape(dmap))
-
-            for his_di, his_d in enumerate(drivers_list):
-                my_pos_i = dmap[:, my_di]
-                his_pos_i = dmap[:, his_di]
-                rel_distance[:, his_di] = t_matrix[my_pos_i, his_pos_i]
-
-            his_in_pit = ~pit_mask.copy()
-            his_in_pit[:, my_di] = False
-            my_in_pit = ~pit_mask[:, drivers_list == my_d][:, 0]
-            rel_distance[his_in_pit] = np.nan
-
-            closest_index = np.nanargmin(rel_distance, axis=1)
-            closest_distance = rel_distance[stream_axis, closest_index]
-            closest_driver = drivers_list[closest_index].astype(object)
-            closest_distance[my_in_pit] = np.nan
-            closest_driver[my_in_pit] = None
-
-            data = {'DistanceToDriverAhead': closest_distance,
-                    'DriverAhead': closest_driver}
+            data = {'DistanceToDriverAhead': distance[:, my_di],
+                    'DriverAhead': driver[:, my_di]}
             driver_ahead[my_d] = session.pos_data[my_d].join(pd.DataFrame(data), how='outer')
 
     else:
@@ -5,9 +5,12 @@ import math
 import os
 import pickle
 import re
+import shutil
 import sys
+import threading
 import time
 import warnings
+from collections.abc import Iterable
 from typing import (
     Any,
     Literal
@@ -18,6 +21,7 @@ from requests_cache import CacheMixin
 from requests_cache.backends.base import BaseCache
 
 from fastf1.exceptions import RateLimitExceededError
+from fastf1.internals import columnar_cache
 from fastf1.logger import get_logger
 
 
@@ -51,18 +55,21 @@ class _MinIntervalLimitDelay:
     """Ensure that there is at least a minimum delay between each request.
 
     Sleeps for the remaining amount of time if the last request was more recent
-    than allowed by the minimum interval rule.
+    than allowed by the minimum interval rule. Requests from multiple threads
+    are delayed one after another.
     """
     def __init__(self, interval: float):
         self._interval: float = interval
         self._t_last: float = 0.0
+        self._lock = threading.Lock()
 
     def limit(self):
-        t_now = time.time()
-        if (delta := (t_now - self._t_last)) < self._interval:
-            time.sleep(self._interval - delta)
-            t_now += self._interval - delta
-        self._t_last = t_now
+        with self._lock:
+            t_now = time.time()
+            if (delta := (t_now - self._t_last)) < self._interval:
+                time.sleep(self._interval - delta)
+                t_now += self._interval - delta
+            self._t_last = t_now
 
 
 class _CallsPerIntervalLimitRaise:
@@ -76,12 +83,14 @@ class _CallsPerIntervalLimitRaise:
         self._interval: float = interval
         self._timestamps = collections.deque(maxlen=calls)
         self._info = info
+        self._lock = threading.Lock()
 
     def limit(self):
-        self._timestamps.append(time.time())
-        if (len(self._timestamps) == self._timestamps.maxlen and
-            self._timestamps[0] > (time.time() - self._interval)):
-            raise RateLimitExceededError(self._info)
+        with self._lock:
+            self._timestamps.append(time.time())
+            if (len(self._timestamps) == self._timestamps.maxlen and
+                    self._timestamps[0] > (time.time() - self._interval)):
+                raise RateLimitExceededError(self._info)
 
 
 class _SessionWithRateLimiting(requests.Session):
@@ -168,6 +177,13 @@ class Cache(metaclass=_MetaCache):
     Raw GET and POST requests are cached in a sqlite db using the
     'requests-cache' module.
 
+    Optionally, car data and position data can be saved in a columnar format
+    instead, by setting ``func_cache_format='columnar'`` when calling
+    :func:`configure`. Each column of each driver's data is then stored in a
+    separate file. This data is loaded lazily from memory-mapped files, so
+    that only the data of the drivers that are actually used needs to be read
+    from disk. All other parsed API data is still saved as a pickled object.
+
     Requests that can be served from the cache do not count towards any
     API rate limits.
 
@@ -212,6 +228,7 @@ class Cache(metaclass=_MetaCache):
     _API_CORE_VERSION = 15
     _IGNORE_VERSION = False
     _FORCE_RENEW = False
+    _FUNC_CACHE_FORMAT: Literal["pickle", "columnar"] = "pickle"
 
     _requests_session_cached: _CachedSessionWithRateLimiting | None = None
     _requests_session: requests.Session = _SessionWithRateLimiting()
@@ -253,8 +270,13 @@ class Cache(metaclass=_MetaCache):
         force_renew: bool = False,
         ignore_version: bool = False,
         use_requests_cache: bool = True,
+        func_cache_format: Literal["pickle", "columnar"] = "pickle",
         _backend: str | BaseCache | None = None,
     ):
+        if func_cache_format not in ("pickle", "columnar"):
+            raise ValueError(f"Invalid value '{func_cache_format}' for "
+                             f"argument 'func_cache_format'")
+
         sanitized_cached_dir = cls._ensure_cache_directory(cache_dir)
         if sanitized_cached_dir is None:
             return
@@ -262,6 +284,7 @@ class Cache(metaclass=_MetaCache):
         cls._CACHE_DIR = cache_dir
         cls._IGNORE_VERSION = ignore_version
         cls._FORCE_RENEW = force_renew
+        cls._FUNC_CACHE_FORMAT = func_cache_format
 
         if use_requests_cache:
             if isinstance(_backend, BaseCache):
@@ -424,10 +447,14 @@ class Cache(metaclass=_MetaCache):
             raise ValueError("Unable to clear cache. Could not determine "
                              "cache directory.")
 
-        for dirpath, _dirnames, filenames in os.walk(sanitized_cache_dir):
+        for dirpath, dirnames, filenames in os.walk(sanitized_cache_dir):
             for filename in filenames:
                 if filename.endswith(".ff1pkl"):
                     os.remove(os.path.join(dirpath, filename))
+            for dirname in list(dirnames):
+                if dirname.endswith((".ff1col", ".ff1col.tmp")):
+                    shutil.rmtree(os.path.join(dirpath, dirname))
+                    dirnames.remove(dirname)
 
         if deep:
             if cls._requests_session_cached is not None:
@@ -463,6 +490,25 @@ class Cache(metaclass=_MetaCache):
             if cls._CACHE_DIR and not cls._func_tmp_disabled:
                 # caching is enabled
                 func_name = str(func.__name__)
+                # Some api functions can parse the data for a selection of
+                # drivers only. The cached data then records this selection
+                # and can be used for any subset of these drivers. Cached data
+                # is also used if only a limited time window is requested.
+                drivers = func_kwargs.get("drivers")
+                cached_drivers = None
+
+                if cls._FUNC_CACHE_FORMAT == "columnar" and not cls._ci_mode:
+                    cached = columnar_cache.read(
+                        cls._get_cache_file_path(api_path, func_name,
+                                                 ext=".ff1col")
+                    )
+                    if (cached is not None) and cls._data_ok_for_use(cached):
+                        if cls._has_drivers(cached, drivers):
+                            _logger.info(f"Using cached data for {func_name}")
+                            return cls._select_drivers(cached["data"],
+                                                       drivers)
+                        cached_drivers = cached["drivers"]
+
                 cache_file_path = cls._get_cache_file_path(api_path, func_name)
 
                 if os.path.isfile(cache_file_path):
@@ -485,18 +531,28 @@ class Cache(metaclass=_MetaCache):
                         cached = None
 
                     if (cached is not None) and cls._data_ok_for_use(cached):
-                        # cached data is ok for use, return it
-                        _logger.info(f"Using cached data for {func_name}")
-                        return cached["data"]
+                        if cls._has_drivers(cached, drivers):
+                            # cached data is ok for use, return it
+                            _logger.info(f"Using cached data for {func_name}")
+                            return cls._select_drivers(cached["data"],
+                                                       drivers)
+                        cached_drivers = cached.get("drivers")
+
+                    if func_kwargs.get("time_window") is not None:
+                        # data for a limited time window is never cached
+                        return func(api_path, **func_kwargs)
 
                     # cached data needs to be downloaded again and updated
                     _logger.info(f"Updating cache for {func_name}...")
+                    selection = cls._extend_selection(func_kwargs,
+                                                      cached_drivers)
                     data = func(api_path, **func_kwargs)
 
                     if data is not None:
-                        cls._write_cache(data, cache_file_path)
+                        cls._write_cache(data, cache_file_path,
+                                         drivers=selection)
                         _logger.info("Cache updated!")
-                        return data
+                        return cls._select_drivers(data, drivers)
 
                     _logger.critical(
                         "A cache update is required but the data failed "
@@ -508,13 +564,20 @@ class Cache(metaclass=_MetaCache):
                     exit()
 
                 else:  # cached data does not yet exist for this api request
+                    if func_kwargs.get("time_window") is not None:
+                        # data for a limited time window is never cached
+                        return func(api_path, **func_kwargs)
+
                     _logger.info(f"No cached data found for {func_name}. "
                                  f"Loading data...")
+                    selection = cls._extend_selection(func_kwargs,
+                                                      cached_drivers)
                     data = func(api_path, **func_kwargs)
                     if data is not None:
-                        cls._write_cache(data, cache_file_path)
+                        cls._write_cache(data, cache_file_path,
+                                         drivers=selection)
                         _logger.info("Data has been written to cache!")
-                        return data
+                        return cls._select_drivers(data, drivers)
 
                     _logger.critical("Failed to load data!")
                     exit()
@@ -525,7 +588,8 @@ class Cache(metaclass=_MetaCache):
         return _cached_api_request
 
     @classmethod
-    def _get_cache_file_path(cls, api_path: str, name: str):
+    def _get_cache_file_path(cls, api_path: str, name: str,
+                             ext: str = ".ff1pkl"):
         # extend the cache dir path using the api path and a file name
         # leading '/static/' is dropped from api path
         cache_dir_path = os.path.join(cls._CACHE_DIR, api_path[8:])
@@ -533,9 +597,30 @@ class Cache(metaclass=_MetaCache):
             # create subfolders if they don't yet exist
             os.makedirs(cache_dir_path)
 
-        file_name = name + ".ff1pkl"
+        file_name = name + ext
         return os.path.join(cache_dir_path, file_name)
 
+    @classmethod
+    def _has_cached_data(cls, api_path: str, func_name: str,
+                         drivers: Iterable[str] | None = None) -> bool:
+        # Check whether the stage 2 cache can be used for an api function.
+        # For pickled data, only the existence of the file is checked, as
+        # loading the data to check the version and the selection of drivers
+        # would be expensive.
+        if (not cls._CACHE_DIR) or cls._func_tmp_disabled or cls._ci_mode \
+                or cls._FORCE_RENEW:
+            return False
+
+        if cls._FUNC_CACHE_FORMAT == "columnar":
+            cached = columnar_cache.read(
+                cls._get_cache_file_path(api_path, func_name, ext=".ff1col")
+            )
+            if (cached is not None) and cls._data_ok_for_use(cached) \
+                    and cls._has_drivers(cached, drivers):
+                return True
+
+        return os.path.isfile(cls._get_cache_file_path(api_path, func_name))
+
     @classmethod
     def _data_ok_for_use(cls, cached: dict):
         # check if cached data is ok or needs to be downloaded again
@@ -546,15 +631,64 @@ class Cache(metaclass=_MetaCache):
             cached["version"] == cls._API_CORE_VERSION
         )
 
+    @staticmethod
+    def _has_drivers(cached: dict, drivers: Iterable[str] | None) -> bool:
+        # check whether cached data contains the data of all requested
+        # drivers; data without a selection of drivers contains all drivers
+        selection = cached.get("drivers")
+        if selection is None:
+            return True
+        return (drivers is not None) and set(drivers).issubset(selection)
+
+    @staticmethod
+    def _select_drivers(data: Any, drivers: Iterable[str] | None) -> Any:
+        # reduce (cached) data to the requested drivers; lazily loaded
+        # columnar data and telemetry data provide their own selection so
+        # that additional attributes of the data are kept
+        if drivers is None:
+            return data
+        if hasattr(data, "select"):
+            return data.select(drivers)
+        drivers = set(drivers)
+        return {drv: value for drv, value in data.items() if drv in drivers}
+
+    @staticmethod
+    def _extend_selection(func_kwargs: dict,
+                          cached_drivers: list[str] | None) \
+            -> list[str] | None:
+        # If data for a selection of drivers is requested, also parse the
+        # data of the drivers that were cached before, so that the new cached
+        # data can serve both. Returns the selection of drivers that is
+        # parsed or None if all drivers are parsed.
+        drivers = func_kwargs.get("drivers")
+        if drivers is None:
+            return None
+        selection = set(drivers).union(cached_drivers or ())
+        func_kwargs["drivers"] = sorted(selection)
+        return sorted(selection)
+
     @classmethod
     def _write_cache(
             cls,
             data: Any,
             cache_file_path: str,
+            drivers: list[str] | None = None,
             **kwargs
     ):
+        if (cls._FUNC_CACHE_FORMAT == "columnar") and not kwargs \
+                and columnar_cache.is_supported(data):
+            columnar_path = os.path.splitext(cache_file_path)[0] + ".ff1col"
+            columnar_cache.write(columnar_path, data, cls._API_CORE_VERSION,
+                                 drivers=drivers,
+                                 date_offset=getattr(data, "date_offset",
+                                                     None))
+            if os.path.isfile(cache_file_path):
+                # remove outdated data in the default format
+                os.remove(cache_file_path)
+            return
+
         new_cached = dict(
-            version=cls._API_CORE_VERSION, data=data,
+            version=cls._API_CORE_VERSION, data=data, drivers=drivers,
             **kwargs
         )
         with open(cache_file_path, "wb") as cache_file_obj:
@@ -97,9 +97,11 @@ def run_in_subprocess(
 
     global _MP_CONFIGURED
     if not _MP_CONFIGURED:
-        multiprocessing.set_start_method('spawn')
         # "spawn" is slower than the linux default but ensure that the child
-        # process is created cleanly with no inherited state in all cases
+        # process is created cleanly with no inherited state in all cases;
+        # the default context may already be in use by tests that decode
+        # data with worker processes
+        multiprocessing.set_start_method('spawn', force=True)
         _MP_CONFIGURED = True
 
     # inject internal arguments for wrapper configuration
@@ -7,10 +7,14 @@ warnings (the public wrappers in :mod:`fastf1.utils` are responsible for the
 """
 import datetime
 
+import numpy as np
+
 from fastf1.internals.parsing_helpers import (
     recursive_dict_get,
     to_datetime,
-    to_timedelta
+    to_datetime_array,
+    to_timedelta,
+    to_timedelta_array
 )
 
 
@@ -57,6 +61,43 @@ def test_to_datetime():
         assert to_datetime(ts) == expected
 
 
+def test_to_timedelta_array():
+    values = ['13:24:46.320215', '13:24:46.3202159', '24:46.32', '4:46',
+              '46', '13:24:46.', '', None, 'invalid', '1:2:3:4',
+              datetime.timedelta(seconds=5)]
+    result = to_timedelta_array(values)
+    assert result.dtype == np.dtype('timedelta64[ns]')
+    for val, res in zip(values, result):
+        expected = to_timedelta(val)
+        if expected is None:
+            assert np.isnat(res)
+        else:
+            assert res == np.timedelta64(expected, 'ns')
+
+    # numpy string arrays are supported directly
+    result = to_timedelta_array(np.array(['1:00.5', '2']))
+    expected = np.array([60_500, 2_000], dtype='timedelta64[ms]')
+    assert (result == expected).all()
+
+
+def test_to_datetime_array():
+    values = ['2020-12-13T13:27:15.320653Z', '2020-12-13T13:27:15.3206539Z',
+              '2020-12-13T13:27:15.32', '2020-12-13T13:27:15',
+              '2020-12-13T13:27:15.', '2020-2-3T3:27:15', '2020-02-30T00:00:00',
+              '2020-12-13T24:00:00', '2020-12-13', '', None,
+              datetime.datetime(2020, 12, 13, 13, 27, 15)]
+    result = to_datetime_array(values)
+    assert result.dtype == np.dtype('datetime64[ns]')
+    for val, res in zip(values, result):
+        expected = to_datetime(val)
+        if expected is None:
+            assert np.isnat(res)
+        else:
+            assert res == np.datetime64(expected, 'ns')
+
+    assert len(to_datetime_array([])) == 0
+
+
 def test_recursive_dict_get():
     data = {'a': {'b': {'c': 42}}}
     assert recursive_dict_get(data, 'a', 'b', 'c') == 42
@@ -1,4 +1,8 @@
+import base64
 import datetime
+import json
+import threading
+import zlib
 
 import numpy as np
 import pandas as pd
@@ -6,6 +10,11 @@ import pytest
 
 import fastf1._api
 from fastf1 import Cache
+from fastf1.core import (
+    Laps,
+    Session,
+    SessionResults
+)
 
 
 def test_timing_data():
@@ -62,6 +71,172 @@ def test_timing_data():
             .isna().any().any()
 
 
+def test_align_laps():
+    # driver '2' is 1.5s behind the leader, but its lap times are
+    # (incorrectly) 0.5s too early
+    laps_data = pd.DataFrame({
+        'Time': pd.to_timedelta([100, 190, 280, 101, 191, 281], unit='s'),
+        'Driver': ['1', '1', '1', '2', '2', '2'],
+        'NumberOfLaps': [1, 2, 3, 1, 2, 3],
+        'PitInTime': pd.NaT,
+        'PitOutTime': pd.NaT
+    })
+    # stream data is not sorted; the closest sample needs to be used
+    stream_data = pd.DataFrame({
+        'Time': pd.to_timedelta([150, 99, 100.4, 120, np.nan, 90], unit='s'),
+        'Driver': ['1', '1', '2', '2', '2', '2'],
+        'GapToLeader': ['LAP 2', 'LAP 1', '+1.500', '+3.000', '+9.000',
+                        '+5.000']
+    })
+
+    fastf1._api._align_laps(laps_data, stream_data)
+    lap_times = laps_data.groupby('Driver')['Time'].apply(list)
+    for leader_time, other_time in zip(lap_times['1'], lap_times['2'],
+                                       strict=True):
+        assert other_time - leader_time == pd.Timedelta(seconds=1.5)
+
+
+def test_timing_data_driver(caplog):
+    def value(val):
+        return {'Value': val}
+
+    driver_raw = [
+        # lap to the grid through the pit lane; the pit entry before the
+        # first pit exit is ignored
+        ('00:00:10.000', {'InPit': True}),
+        ('00:01:00.000', {'InPit': False, 'PitOut': True}),
+        ('00:01:02.000', {'Position': 3, 'GapToLeader': '+1.234',
+                          'IntervalToPositionAhead': value('+0.500')}),
+        ('00:01:30.000', {'Sectors': {'0': value('30.000')}}),
+        ('00:02:00.000', {'Sectors': {'1': value('29.500')},
+                          'Speeds': {'I2': value('250')}}),
+        ('00:02:30.000', {'NumberOfLaps': 1, 'Position': 2}),
+        # values up to five seconds late belong to the previous lap
+        ('00:02:31.000', {'Sectors': {'2': value('31.000')},
+                          'LastLapTime': value('1:30.500'),
+                          'Speeds': {'FL': value('280'),
+                                     'ST': value('310')}}),
+        ('00:03:00.000', {'Sectors': {'0': value('29.000')},
+                          'Speeds': {'I1': value('300')},
+                          'GapToLeader': '+0.800'}),
+        ('00:03:30.000', {'Sectors': {'1': value('30.000')}}),
+        ('00:04:00.000', {'NumberOfLaps': 2,
+                          'IntervalToPositionAhead': value('+0.200')}),
+        ('00:04:01.000', {'Sectors': {'2': value('31.000')},
+                          'LastLapTime': value('1:30.000'),
+                          'BestLapTime': value('1:30.000'),
+                          'BestLapTimes': {'0': value('1:30.000')}}),
+        # in-lap and a pit exit shortly before the start of the next lap
+        ('00:05:20.000', {'InPit': True}),
+        ('00:05:30.000', {'NumberOfLaps': 3,
+                          'LastLapTime': value('1:30.000')}),
+        ('00:06:00.000', {'InPit': False}),
+        ('00:06:02.000', {'NumberOfLaps': 4, 'Position': 1}),
+        # late data for a previous lap is ignored
+        ('00:06:10.000', {'NumberOfLaps': 2,
+                          'LastLapTime': value('1:10.000')}),
+        ('00:06:20.000', {'NumberOfLaps': 4}),
+        # second (sub)session; lap times above 150 seconds are ignored and
+        # a pit exit in the same line as the start of a lap belongs to the
+        # next lap
+        ('00:08:00.000', {'BestLapTimes': {'1': value('1:29.000')},
+                          'InPit': True}),
+        ('00:09:00.000', {'NumberOfLaps': 5, 'LastLapTime': value('3:00.000'),
+                          'InPit': False}),
+        ('00:10:29.000', {'Sectors': {'0': value('29.000'),
+                                      '1': value('30.000')}}),
+        ('00:10:30.000', {'NumberOfLaps': 6, 'LastLapTime': value('1:29.000'),
+                          'BestLapTime': value('1:29.000'),
+                          'Sectors': {'2': value('30.000')},
+                          'GapToLeader': 'LAP 6'}),
+        # explicitly missing lap time
+        ('00:12:00.000', {'NumberOfLaps': 7, 'LastLapTime': value('')}),
+        # deleted lap, the previous personal best is sent again
+        ('00:13:28.000', {'NumberOfLaps': 8, 'LastLapTime': value('1:28.000'),
+                          'BestLapTime': value('1:28.000')}),
+        ('00:13:40.000', {'BestLapTime': value('1:29.000')}),
+    ]
+
+    laps, split_times, stream = fastf1._api._timing_data_driver(driver_raw,
+                                                                '1')
+    assert "Ignoring late data" in caplog.text
+
+    def seconds(*values):
+        return pd.to_timedelta(values, unit='s')
+
+    nan = np.nan
+    # expected values as created by the original implementation, which
+    # parsed laps data and stream data in separate passes
+    expected_laps = pd.DataFrame({
+        'Time': seconds(150, 240, 330, 362, 540, 629, 720, 808),
+        'Driver': ['1'] * 8,
+        'LapTime': seconds(90.5, 90, 90, nan, nan, 89, nan, 88),
+        'NumberOfLaps': [1, 2, 3, 4, 5, 6, 7, 8],
+        'NumberOfPitStops': [0, 0, 0, 1, 2, 2, 2, 2],
+        'PitOutTime': seconds(60, nan, nan, nan, 360, 540, nan, nan),
+        'PitInTime': seconds(nan, nan, 320, nan, 480, nan, nan, nan),
+        'Sector1Time': seconds(30, 29, nan, nan, nan, 29, nan, nan),
+        'Sector2Time': seconds(29.5, 30, nan, nan, nan, 30, nan, nan),
+        'Sector3Time': seconds(31, 31, nan, nan, nan, 30, nan, nan),
+        'Sector1SessionTime': seconds(90, 179, nan, nan, nan, 569, nan, nan),
+        'Sector2SessionTime': seconds(120, 209, nan, nan, nan, 599, nan,
+                                      nan),
+        'Sector3SessionTime': seconds(151, 240, nan, nan, nan, 629, nan,
+                                      nan),
+        'SpeedI1': [nan, 300, nan, nan, nan, nan, nan, nan],
+        'SpeedI2': [250, nan, nan, nan, nan, nan, nan, nan],
+        'SpeedFL': [280, nan, nan, nan, nan, nan, nan, nan],
+        'SpeedST': [nan, 310, nan, nan, nan, nan, nan, nan],
+        'IsPersonalBest': [False, True, False, False, False, True, False,
+                           False],
+    })
+    pd.testing.assert_frame_equal(pd.DataFrame(laps), expected_laps)
+    assert split_times == [datetime.timedelta(0),
+                           datetime.timedelta(minutes=8)]
+
+    expected_stream = pd.DataFrame({
+        'Time': seconds(62, 150, 180, 240, 362, 630),
+        'Driver': ['1'] * 6,
+        'Position': [3, 2, 2, 2, 1, 1],
+        'GapToLeader': ['+1.234', '+1.234', '+0.800', '+0.800', '+0.800',
+                        'LAP 6'],
+        'IntervalToPositionAhead': ['+0.500', '+0.500', '+0.500', '+0.200',
+                                    '+0.200', '+0.200'],
+    })
+    pd.testing.assert_frame_equal(pd.DataFrame(stream), expected_stream)
+
+
+def test_record_lines():
+    records = ['00:00:01.000"abc"', '00:00:02.000{"a": 1}',
+               '00:00:03.000"\u00e9"', '00:00:04.000{}']
+    content = '\ufeff' + '\r\n'.join(records) + '\r\n' + '00:00:05.000'
+    lines = fastf1._api._RecordLines(content.encode('utf-8'))
+
+    # same result as splitting the decoded text, the last incomplete record
+    # is ignored
+    expected = content.encode('utf-8').decode('utf-8-sig') \
+        .split('\r\n')[:-1]
+    assert list(lines) == expected
+    assert len(lines) == 4
+    assert lines[1] == records[1]
+    assert lines[-1] == records[-1]
+    assert list(lines[1:3]) == records[1:3]
+    assert list(lines[::2]) == records[::2]
+    assert len(lines[4:]) == 0
+    assert not fastf1._api._RecordLines(b'')
+    np.testing.assert_array_equal(
+        lines.prefix_range_mask('00:00:02.000', '00:00:03.000'),
+        [False, True, True, False]
+    )
+    assert list(lines.take([3, 0])) == [records[3], records[0]]
+
+    entries = fastf1._api._iter_stream_entries(lines, zipped=False)
+    assert list(entries) == [['00:00:01.000', 'abc'],
+                             ['00:00:02.000', {'a': 1}],
+                             ['00:00:03.000', '\u00e9'],
+                             ['00:00:04.000', {}]]
+
+
 def test_timing_app_data():
     # requires clean parsing
     with Cache.disabled(disable_http_cache=False, disable_func_cache=True):
@@ -107,6 +282,321 @@ def test_position_data(caplog):
             'int64', 'int64', 'int64', 'object']).all()
 
 
+def _encode_record(timestamp, payload):
+    # encode a payload like a record of a compressed (.z) data stream
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw = compressor.compress(json.dumps(payload).encode()) \
+        + compressor.flush()
+    return f'{timestamp}"{base64.b64encode(raw).decode()}"'
+
+
+def test_car_data_decoding(caplog):
+    response = []
+    for i in range(5000):
+        cars = {'1': {'Channels': {'0': 10000 + i, '2': i % 340, '3': 7,
+                                   '4': 100, '5': 0, '45': 12}}}
+        if i % 2:
+            # driver 44 is only included in every second sample
+            # and the DRS channel is missing
+            cars['44'] = {'Channels': {'0': 9000, '2': 250, '3': 6,
+                                       '4': 99, '5': 100}}
+        utc = (datetime.datetime(2020, 8, 8, 9, 45, 0, 61979)
+               + datetime.timedelta(seconds=i))
+        payload = {'Entries': [{'Utc': utc.isoformat() + '7Z',
+                                'Cars': cars}]}
+        response.append(_encode_record('00:01:00.000', payload))
+    response.append('00:01:00.000"invalid"')
+
+    with Cache.disabled():
+        data = fastf1._api.car_data('', response=response)
+
+    assert "failed to decode 1 messages" in caplog.text
+    assert "Driver 44: Car data is incomplete!" in caplog.text
+    assert list(data.keys()) == ['1', '44']
+    for drv_data in data.values():
+        assert drv_data.shape == (5000, 9)
+        assert (drv_data.dtypes == [
+            'timedelta64[ns]', 'datetime64[ns]', 'int64', 'int64', 'int64',
+            'int64', 'bool', 'int64', 'object']).all()
+
+    assert (data['1']['RPM'] == np.arange(10000, 15000)).all()
+    assert data['1']['Date'].iloc[0] \
+        == pd.Timestamp('2020-08-08 09:45:00.061979')
+    assert (data['1']['Time'] == pd.Timedelta(minutes=1)).all()
+    assert (data['44']['DRS'] == 0).all()
+    assert (data['44']['Brake'] == (np.arange(5000) % 2).astype(bool)).all()
+
+
+def test_position_data_decoding():
+    response = []
+    for i in range(10):
+        entries = {'1': {'Status': 'OnTrack', 'X': i, 'Y': -i, 'Z': 1},
+                   '44': {'Status': str(i % 2), 'X': 0, 'Y': 0, 'Z': 0},
+                   '55': {'X': 0, 'Y': 0, 'Z': 0}}
+        payload = {'Position': [{'Timestamp': f'2020-08-08T09:45:0{i}.1Z',
+                                 'Entries': entries}]}
+        response.append(_encode_record('00:01:00.000', payload))
+
+    with Cache.disabled():
+        data = fastf1._api.position_data('', response=response)
+
+    assert (data['1']['X'] == np.arange(10)).all()
+    assert (data['1']['Y'] == -np.arange(10)).all()
+    assert (data['1']['Status'] == 'OnTrack').all()
+    assert data['44']['Status'].to_list() == ['OnTrack', 'OffTrack'] * 5
+    assert data['55']['Status'].isna().all()
+    assert (data['55']['Source'] == 'pos').all()
+
+
+def test_telemetry_decoding_with_workers():
+    car_response = []
+    pos_response = []
+    for i in range(100):
+        date = f'2020-08-08T09:45:{i % 60:02d}.{i}Z'
+        cars = {str(drv): {'Channels': {'0': i, '2': drv, '3': 7, '4': 100,
+                                        '5': 0, '45': 12}}
+                for drv in range(1, 21) if (i + drv) % 7}
+        car_response.append(_encode_record(
+            '00:01:00.000', {'Entries': [{'Utc': date, 'Cars': cars}]}
+        ))
+        entries = {str(drv): {'Status': 'OnTrack', 'X': i, 'Y': drv, 'Z': 0}
+                   for drv in range(1, 21) if (i + drv) % 5}
+        pos_response.append(_encode_record(
+            '00:01:00.000',
+            {'Position': [{'Timestamp': date, 'Entries': entries}]}
+        ))
+
+    # worker processes are spawned, which is safe while other threads are
+    # running (forking a multi-threaded process is deprecated)
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        with Cache.disabled():
+            for func, response in ((fastf1._api.car_data, car_response),
+                                   (fastf1._api.position_data, pos_response)):
+                serial = func('', response=response)
+                parallel = func('', response=response, workers=2)
+                assert list(serial.keys()) == list(parallel.keys())
+                for drv in serial:
+                    pd.testing.assert_frame_equal(serial[drv], parallel[drv])
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_telemetry_decoding_driver_selection():
+    car_response = []
+    pos_response = []
+    for i in range(100):
+        date = f'2020-08-08T09:45:{i % 60:02d}.{i}Z'
+        # driver 2 is missing in some samples, driver 3 in even more samples
+        cars = {str(drv): {'Channels': {'0': i, '2': drv, '3': 7, '4': 100,
+                                        '5': 0, '45': 12}}
+                for drv in (1, 2, 3) if (i % (2 * drv)) or (drv == 1)}
+        car_response.append(_encode_record(
+            '00:01:00.000', {'Entries': [{'Utc': date, 'Cars': cars}]}
+        ))
+        entries = {drv: {'Status': 'OnTrack', 'X': i, 'Y': 0, 'Z': 0}
+                   for drv in cars}
+        pos_response.append(_encode_record(
+            '00:01:00.000',
+            {'Position': [{'Timestamp': date, 'Entries': entries}]}
+        ))
+
+    with Cache.disabled():
+        for func, response in ((fastf1._api.car_data, car_response),
+                               (fastf1._api.position_data, pos_response)):
+            full = func('', response=response)
+            for workers in (None, 2):
+                selected = func('', response=response, workers=workers,
+                                drivers=['3', '2'])
+                # the data of the selected drivers is completed using the
+                # most complete data of all drivers
+                assert list(selected.keys()) == ['2', '3']
+                for drv in selected:
+                    assert len(selected[drv]) == 100
+                    pd.testing.assert_frame_equal(selected[drv], full[drv])
+
+
+def test_telemetry_decoding_time_window():
+    car_response = []
+    pos_response = []
+    for i in range(100):
+        timestamp = f'00:{i // 60:02d}:{i % 60:02d}.000'
+        date = f'2020-08-08T09:{i // 60:02d}:{i % 60:02d}.000Z'
+        cars = {'1': {'Channels': {'0': i, '2': 1, '3': 7, '4': 100,
+                                   '5': 0, '45': 12}}}
+        car_response.append(_encode_record(
+            timestamp, {'Entries': [{'Utc': date, 'Cars': cars}]}
+        ))
+        entries = {'1': {'Status': 'OnTrack', 'X': i, 'Y': 0, 'Z': 0}}
+        pos_response.append(_encode_record(
+            timestamp, {'Position': [{'Timestamp': date, 'Entries': entries}]}
+        ))
+
+    time_window = (pd.Timedelta(seconds=10), pd.Timedelta(seconds=70))
+    with Cache.disabled():
+        for func, response in ((fastf1._api.car_data, car_response),
+                               (fastf1._api.position_data, pos_response)):
+            lines = fastf1._api._RecordLines(
+                ('\r\n'.join(response) + '\r\n').encode()
+            )
+            for resp in (response, lines):
+                data = func('', response=resp, time_window=time_window)
+                # both bounds are inclusive
+                assert len(data['1']) == 61
+                assert data['1']['Date'].iloc[0] \
+                    == pd.Timestamp('2020-08-08T09:00:10')
+                assert data['1']['Date'].iloc[-1] \
+                    == pd.Timestamp('2020-08-08T09:01:10')
+                # latest 'Date - Time' of all samples, including those outside
+                # the window
+                assert data.date_offset == pd.Timestamp('2020-08-08T09:00')
+
+
+def test_time_window_date_offset_sample(monkeypatch):
+    # only a bounded sample of the records outside the time window is
+    # decompressed to determine the date offset
+    class _Records(list):
+        def __getitem__(self, item):
+            accessed.append(item)
+            return super().__getitem__(item)
+
+    accessed = []
+    records = _Records()
+    for i in range(100):
+        timestamp = f'00:{i // 60:02d}:{i % 60:02d}.000'
+        date = f'2020-08-08T09:{i // 60:02d}:{i % 60:02d}.{99 - i:03d}Z'
+        records.append(_encode_record(timestamp, {'Entries': [{'Utc': date}]}))
+
+    inside, outside = fastf1._api._records_in_time_window(
+        records, False, (pd.Timedelta(seconds=10), pd.Timedelta(seconds=69))
+    )
+    assert inside == records[10:70]
+    np.testing.assert_array_equal(outside, [*range(10), *range(70, 100)])
+
+    accessed.clear()
+    monkeypatch.setattr(fastf1._api, '_DATE_OFFSET_SAMPLE_SIZE', 5)
+    offset = fastf1._api._max_date_offset(records, outside, False, 'Utc')
+    # evenly spaced, including the first and the last record
+    assert accessed == [0, 70, 80, 89, 99]
+    assert offset == pd.Timestamp('2020-08-08T09:00:00.099')
+
+
+def test_telemetry_time_window_t0_date():
+    # t0_date and the telemetry of a lap are the same when only the data
+    # within a time window is loaded; the sample with the least delay, which
+    # determines t0_date, is outside the time window
+    start = pd.Timestamp('2020-08-08T09:00')
+    car_response = []
+    pos_response = []
+    for i in range(200):
+        timestamp = f'00:{i // 60:02d}:{i % 60:02d}.000'
+        delay = 0.25 if (i == 5) else (i % 7) / 100
+        date = (start + pd.Timedelta(seconds=i + delay)).isoformat() + 'Z'
+        cars = {'1': {'Channels': {'0': 10000 + i, '2': 200 + i % 50,
+                                   '3': 7, '4': 100, '5': 0, '45': 12}}}
+        car_response.append(_encode_record(
+            timestamp, {'Entries': [{'Utc': date, 'Cars': cars}]}
+        ))
+        entries = {'1': {'Status': 'OnTrack', 'X': i, 'Y': 0, 'Z': 0}}
+        pos_response.append(_encode_record(
+            timestamp, {'Position': [{'Timestamp': date, 'Entries': entries}]}
+        ))
+
+    def load(time_window):
+        session = Session.__new__(Session)
+        session.api_path = ''
+        session._prefetched_pages = {'car_data': car_response,
+                                     'position': pos_response}
+        session._results = SessionResults({'DriverNumber': ['1']})
+        session._laps = Laps({
+            'DriverNumber': ['1'] * 6,
+            'LapNumber': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            'LapStartTime': pd.to_timedelta(range(0, 180, 30), unit='s'),
+            'Time': pd.to_timedelta(range(30, 210, 30), unit='s'),
+        }, session=session, _force_default_cols=True)
+        with Cache.disabled():
+            session._load_telemetry(time_window=time_window)
+        return session
+
+    full = load(None)
+    windowed = load((pd.Timedelta(seconds=40), pd.Timedelta(seconds=130)))
+
+    assert full.t0_date == start + pd.Timedelta(seconds=0.25)
+    assert windowed.t0_date == full.t0_date
+    pd.testing.assert_series_equal(windowed.laps['LapStartDate'],
+                                   full.laps['LapStartDate'])
+    for data in ('car_data', 'pos_data'):
+        for lap_number in (3, 4):
+            lap = full.laps.pick_laps(lap_number)
+            pd.testing.assert_frame_equal(
+                getattr(windowed, data)['1'].slice_by_lap(lap)
+                .reset_index(drop=True),
+                getattr(full, data)['1'].slice_by_lap(lap)
+                .reset_index(drop=True)
+            )
+
+
+def test_telemetry_driver_selection_t0_date():
+    # t0_date is the same when only the telemetry of some drivers is loaded;
+    # the sample with the least delay, which determines t0_date, only
+    # contains data of a driver that is not selected
+    start = pd.Timestamp('2020-08-08T09:00')
+    car_response = []
+    pos_response = []
+    for i in range(100):
+        timestamp = f'00:{i // 60:02d}:{i % 60:02d}.000'
+        delay = 0.25 if (i == 5) else (i % 7) / 100
+        date = (start + pd.Timedelta(seconds=i + delay)).isoformat() + 'Z'
+        drivers = ('44', ) if (i == 5) else ('1', '16', '44')
+        cars = {drv: {'Channels': {'0': 10000 + i, '2': 200, '3': 7,
+                                   '4': 100, '5': 0, '45': 12}}
+                for drv in drivers}
+        car_response.append(_encode_record(
+            timestamp, {'Entries': [{'Utc': date, 'Cars': cars}]}
+        ))
+        entries = {drv: {'Status': 'OnTrack', 'X': i, 'Y': 0, 'Z': 0}
+                   for drv in drivers}
+        pos_response.append(_encode_record(
+            timestamp, {'Position': [{'Timestamp': date, 'Entries': entries}]}
+        ))
+
+    def load(**kwargs):
+        session = Session.__new__(Session)
+        session.api_path = ''
+        session._prefetched_pages = {'car_data': car_response,
+                                     'position': pos_response}
+        session._results = SessionResults({'DriverNumber': ['1', '16',
+                                                            '44']})
+        session._laps = Laps({
+            'DriverNumber': ['1'] * 3,
+            'LapNumber': [1.0, 2.0, 3.0],
+            'LapStartTime': pd.to_timedelta(range(0, 90, 30), unit='s'),
+            'Time': pd.to_timedelta(range(30, 120, 30), unit='s'),
+        }, session=session, _force_default_cols=True)
+        with Cache.disabled():
+            session._load_telemetry(**kwargs)
+        return session
+
+    full = load()
+    assert full.t0_date == start + pd.Timedelta(seconds=0.25)
+    for kwargs in ({'drivers': ['1']},
+                   {'drivers': ['1', '16'],
+                    'time_window': (pd.Timedelta(seconds=30),
+                                    pd.Timedelta(seconds=60))}):
+        selected = load(**kwargs)
+        assert list(selected.car_data) == kwargs['drivers']
+        assert selected.t0_date == full.t0_date
+        pd.testing.assert_series_equal(selected.laps['LapStartDate'],
+                                       full.laps['LapStartDate'])
+        lap = full.laps.pick_laps(2)
+        pd.testing.assert_frame_equal(
+            selected.car_data['1'].slice_by_lap(lap).reset_index(drop=True),
+            full.car_data['1'].slice_by_lap(lap).reset_index(drop=True)
+        )
+
 def test_track_status_data():
     # requires clean parsing
     with Cache.disabled(disable_http_cache=False, disable_func_cache=True):
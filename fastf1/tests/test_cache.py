@@ -1,6 +1,8 @@
 import logging
 import os
 
+import pytest
+
 import fastf1._api
 import fastf1.ergast.interface
 import fastf1.testing
@@ -116,3 +118,235 @@ def _test_cache_used_and_clear(tmpdir):
 
         Cache.clear_cache(tmpdir)  # should delete pickle files
         assert os.listdir(cache_dir_path) == []
+
+
+def test_columnar_cache(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_columnar_cache, tmpdir,
+                                     use_default_cache=False)
+
+
+def _test_columnar_cache(tmpdir):
+    import numpy as np
+    import pandas as pd
+
+    data = {
+        '1': pd.DataFrame({
+            'Date': pd.date_range('2020-07-17 12:00', periods=3, freq='s'),
+            'Speed': np.array([100, 150, 200]),
+            'Brake': [True, False, False],
+            'Status': ['OnTrack', None, 'OffTrack'],
+        }),
+        '44': pd.DataFrame({
+            'Date': pd.date_range('2020-07-17 12:00', periods=2, freq='s'),
+            'Speed': np.array([120, 160]),
+            'Brake': [False, False],
+            'Status': ['OnTrack', 'OnTrack'],
+        })
+    }
+    calls = []
+
+    @Cache.api_request_wrapper
+    def frames_data(path):
+        calls.append(path)
+        return data
+
+    Cache.configure(cache_dir=tmpdir, use_requests_cache=False,
+                    func_cache_format='columnar')
+    api_path = '/static/2020/2020-07-19_Hungarian_Grand_Prix/'
+
+    frames_data(api_path)
+    cached = frames_data(api_path)
+    assert len(calls) == 1  # second call is served from the cache
+
+    cache_dir_path = os.path.join(tmpdir, api_path[8:])
+    assert os.listdir(cache_dir_path) == ['frames_data.ff1col']
+
+    assert list(cached.keys()) == ['1', '44']
+    for drv in data:
+        pd.testing.assert_frame_equal(cached[drv], data[drv])
+    pd.testing.assert_frame_equal(cached.load('44', columns=['Speed']),
+                                  data['44'][['Speed']])
+
+    Cache.clear_cache(tmpdir)
+    assert os.listdir(cache_dir_path) == []
+
+
+@pytest.mark.parametrize('func_cache_format', ['pickle', 'columnar'])
+def test_cache_driver_selection(tmpdir, func_cache_format):
+    fastf1.testing.run_in_subprocess(_test_cache_driver_selection, tmpdir,
+                                     func_cache_format,
+                                     use_default_cache=False)
+
+
+def _test_cache_driver_selection(tmpdir, func_cache_format):
+    import pandas as pd
+
+    data = {drv: pd.DataFrame({'Speed': [int(drv)] * 3})
+            for drv in ('1', '16', '44')}
+    calls = []
+
+    @Cache.api_request_wrapper
+    def frames_data(path, drivers=None):
+        calls.append(drivers)
+        return {drv: df for drv, df in data.items()
+                if (drivers is None) or (drv in drivers)}
+
+    Cache.configure(cache_dir=tmpdir, use_requests_cache=False,
+                    func_cache_format=func_cache_format)
+    api_path = '/static/2020/2020-07-19_Hungarian_Grand_Prix/'
+
+    assert list(frames_data(api_path, drivers=['1'])) == ['1']
+    assert list(frames_data(api_path, drivers=['1'])) == ['1']
+    assert calls == [['1']]  # served from the cache
+
+    # the cached selection is extended with the new driver
+    result = frames_data(api_path, drivers=['44'])
+    assert list(result) == ['44']
+    pd.testing.assert_frame_equal(result['44'], data['44'])
+    assert calls[-1] == ['1', '44']
+    frames_data(api_path, drivers=['1', '44'])
+    assert len(calls) == 2
+
+    # requesting all drivers requires parsing all data once
+    assert list(frames_data(api_path)) == ['1', '16', '44']
+    assert calls[-1] is None
+    assert list(frames_data(api_path, drivers=['16'])) == ['16']
+    assert list(frames_data(api_path)) == ['1', '16', '44']
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize('func_cache_format', ['pickle', 'columnar'])
+def test_cache_driver_selection_date_offset(tmpdir, func_cache_format):
+    fastf1.testing.run_in_subprocess(
+        _test_cache_driver_selection_date_offset, tmpdir, func_cache_format,
+        use_default_cache=False
+    )
+
+
+def _test_cache_driver_selection_date_offset(tmpdir, func_cache_format):
+    import pandas as pd
+
+    offset = pd.Timestamp('2020-07-19 13:00:00.123456789')
+    calls = []
+
+    @Cache.api_request_wrapper
+    def frames_data(path, drivers=None):
+        calls.append(drivers)
+        data = {drv: pd.DataFrame({'Speed': [int(drv)] * 3})
+                for drv in ('1', '16', '44')
+                if (drivers is None) or (drv in drivers)}
+        return fastf1._api._TelemetryData(data, offset)
+
+    Cache.configure(cache_dir=tmpdir, use_requests_cache=False,
+                    func_cache_format=func_cache_format)
+    api_path = '/static/2020/2020-07-19_Hungarian_Grand_Prix/'
+
+    # the offset of all data is kept when cached data serves a selection of
+    # drivers
+    assert frames_data(api_path, drivers=['1']).date_offset == offset
+    assert frames_data(api_path).date_offset == offset
+    for _ in range(2):
+        result = frames_data(api_path, drivers=['16'])
+        assert list(result) == ['16']
+        assert result.date_offset == offset
+    assert calls == [['1'], None]
+
+
+def test_cache_time_window(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_cache_time_window, tmpdir,
+                                     use_default_cache=False)
+
+
+def _test_cache_time_window(tmpdir):
+    import pandas as pd
+
+    calls = []
+
+    @Cache.api_request_wrapper
+    def frames_data(path, time_window=None):
+        calls.append(time_window)
+        n = 3 if time_window is None else 1
+        return {'1': pd.DataFrame({'Speed': [100] * n})}
+
+    Cache.configure(cache_dir=tmpdir, use_requests_cache=False)
+    api_path = '/static/2020/2020-07-19_Hungarian_Grand_Prix/'
+    cache_dir_path = os.path.join(tmpdir, api_path[8:])
+    window = (pd.Timedelta(seconds=10), pd.Timedelta(seconds=20))
+
+    # data for a time window is not cached
+    assert len(frames_data(api_path, time_window=window)['1']) == 1
+    assert not os.path.exists(cache_dir_path) \
+        or os.listdir(cache_dir_path) == []
+    assert len(frames_data(api_path, time_window=window)['1']) == 1
+    assert len(calls) == 2
+
+    # if all data is cached, the cached data is used
+    assert len(frames_data(api_path)['1']) == 3
+    assert len(frames_data(api_path, time_window=window)['1']) == 3
+    assert calls == [window, window, None]
+
+
+def test_columnar_cache_session_lazy_load(tmpdir):
+    fastf1.testing.run_in_subprocess(_test_columnar_cache_session_lazy_load,
+                                     tmpdir, use_default_cache=False)
+
+
+def _test_columnar_cache_session_lazy_load(tmpdir):
+    import numpy as np
+    import pandas as pd
+
+    from fastf1.core import (
+        Session,
+        SessionResults
+    )
+    from fastf1.internals import columnar_cache
+
+    drivers = ['1', '16', '44']
+    start = pd.Timestamp('2020-07-17 12:00')
+    car_data, pos_data = {}, {}
+    for n, drv in enumerate(drivers):
+        time = pd.to_timedelta(np.arange(10) * 0.25, unit='s')
+        # the sample with the least delay determines the offset
+        date = start + time + pd.to_timedelta([0.1] * 9 + [0.2 + n / 100],
+                                              unit='s')
+        car_data[drv] = pd.DataFrame({
+            'Time': time, 'Date': date, 'RPM': 10000, 'Speed': 200,
+            'nGear': 7, 'Throttle': 100, 'Brake': False, 'DRS': 0,
+            'Source': 'car'
+        })
+        pos_data[drv] = pd.DataFrame({
+            'Time': time, 'Date': date, 'Status': 'OnTrack', 'X': 0, 'Y': 0,
+            'Z': 0, 'Source': 'pos'
+        })
+
+    Cache.configure(cache_dir=tmpdir, use_requests_cache=False,
+                    func_cache_format='columnar')
+    session = Session.__new__(Session)
+    session.api_path = '/static/2020/2020-07-19_Hungarian_Grand_Prix/'
+    session._prefetched_pages = {}
+    session._results = SessionResults({'DriverNumber': drivers})
+    for name, data in (('car_data', car_data), ('position_data', pos_data)):
+        columnar_cache.write(
+            Cache._get_cache_file_path(session.api_path, name,
+                                       ext='.ff1col'),
+            data, Cache._API_CORE_VERSION
+        )
+
+    session._load_telemetry()
+
+    # calculating t0_date does not load and keep the data of all drivers
+    assert session.t0_date == start + pd.Timedelta(seconds=0.22)
+    assert session.car_data._raw_data._frames == {}
+    assert session.pos_data._raw_data._frames == {}
+
+    tel = session.car_data['16']
+    assert tel['Time'].iloc[0] == pd.Timedelta(seconds=-0.12)
+    # the cached data is not kept after the telemetry was created
+    assert session.car_data._raw_data._frames == {}
+
+    # cached data is only counted once it was loaded into memory
+    usage = session.car_data.memory_usage()
+    assert usage['16'] > 0
+    assert usage['1'] == 0
+    _ = session.car_data._raw_data['1']
+    assert session.car_data.memory_usage()['1'] > 0
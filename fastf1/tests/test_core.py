@@ -145,6 +145,61 @@ def test_add_lap_status_to_laps():
     assert (laps['TrackStatus'] == expected_per_lap_status).all()
 
 
+def test_add_lap_status_to_laps_missing_times():
+    session = Session.__new__(Session)
+    session._track_status = pd.DataFrame(
+        [[pd.Timedelta(minutes=0), '1', 'AllClear'],
+         [pd.Timedelta(minutes=2.5), '4', 'SCDeployed'],
+         [pd.Timedelta(minutes=4.5), '1', 'AllClear']],
+        columns=('Time', 'Status', 'Message')
+    )
+
+    laps = Laps(
+        [[pd.Timedelta(minutes=1), pd.Timedelta(minutes=2)],
+         [pd.NaT, pd.Timedelta(minutes=3)],
+         [pd.Timedelta(minutes=3), pd.NaT],
+         [pd.NaT, pd.NaT],
+         [pd.Timedelta(minutes=4), pd.Timedelta(minutes=5)]],
+        _force_default_cols=False,
+        columns=('LapStartTime', 'Time')
+    )
+    session._add_track_status_to_laps(laps)
+
+    expected_per_lap_status = ['1', '4', '4', '', '41']
+
+    assert (laps['TrackStatus'] == expected_per_lap_status).all()
+
+
+def test_check_lap_accuracy():
+    session = Session.__new__(Session)
+    session._results = SessionResults({'DriverNumber': ['1', '2']})
+
+    def _lap(drv, time, lap_time, sectors=(30, 30, 30), status='1'):
+        return {'DriverNumber': drv,
+                'Time': pd.Timedelta(seconds=time),
+                'LapTime': pd.Timedelta(seconds=lap_time),
+                'Sector1Time': pd.Timedelta(seconds=sectors[0]),
+                'Sector2Time': pd.Timedelta(seconds=sectors[1]),
+                'Sector3Time': pd.Timedelta(seconds=sectors[2]),
+                'FastF1Generated': False,
+                'TrackStatus': status}
+
+    session._laps = Laps([
+        _lap('1', 100, 90),
+        _lap('2', 101, 90),
+        _lap('1', 190, 90, status='4'),  # safety car
+        _lap('2', 191.002, 90.002, sectors=(30, 30, 30.002)),
+        _lap('1', 280, 90),  # first lap after safety car
+        _lap('2', 281.002, 90, sectors=(30, 30, 30.1)),  # sector sum
+        _lap('1', 370, 90),
+        _lap('2', 371.5, 90),  # gap between laps
+    ], session=session, _force_default_cols=True)
+
+    session._check_lap_accuracy()
+    assert session.laps['IsAccurate'].to_list() \
+        == [True, True, False, True, False, False, True, False]
+
+
 def test_rcm_parsing_deleted_laps():
     session = fastf1.get_session(2024, 5, 'SQ')
     session.load(telemetry=False, weather=False)
@@ -227,4 +282,41 @@ def test_practice_session_results_time_and_position():
 
     # results should be sorted by position
     valid = results.dropna(subset=['Position'])
-    assert (valid['Position'].diff().dropna() >= 0).all()
\ No newline at end of file
+    assert (valid['Position'].diff().dropna() >= 0).all()
+
+
+def test_session_memory_usage_and_release():
+    session = fastf1.get_session(2020, 'Italy', 'R')
+    session.load(messages=False)
+
+    usage = session.memory_usage()
+    assert list(usage.index) == list(Session._MEMORY_COMPONENTS)
+    assert usage.loc['laps', 'Total'] > 0
+    assert usage.loc['car_data', 'Total'] > 0
+    assert usage.loc['pos_data', 'Total'] > 0
+    assert usage.loc['race_control_messages', 'Total'] == 0
+    assert usage.loc['telemetry_cache', 'Total'] == 0
+
+    lap = session.laps.pick_drivers('16').pick_fastest()
+    _ = lap.telemetry
+    usage = session.memory_usage()
+    assert usage.loc['telemetry_cache', 'Total'] > 0
+    assert usage.loc['telemetry_cache', '16'] > 0
+
+    session.release('telemetry_cache', drivers=['16'])
+    assert 'telemetry' not in lap.__dict__
+
+    session.release('car_data', drivers=['16'])
+    assert '16' not in session.car_data
+    assert pd.isna(session.memory_usage().loc['car_data', '16'])
+
+    session.release('pos_data')
+    with pytest.raises(fastf1.exceptions.DataNotLoadedError):
+        _ = session.pos_data
+    assert session.memory_usage().loc['pos_data', 'Total'] == 0
+    assert len(session.laps) > 0
+
+    with pytest.raises(ValueError):
+        session.release('laps', drivers=['16'])
+    with pytest.raises(ValueError):
+        session.release('unknown')
@@ -1,5 +1,6 @@
 # test some known special cases
 
+import datetime
 import logging
 
 import pandas as pd
@@ -9,6 +10,7 @@ import fastf1
 import fastf1.ergast
 import fastf1.testing
 from fastf1 import _api
+from fastf1.internals.parsing_helpers import recursive_dict_get, to_timedelta
 from fastf1.testing.reference_values import LAP_DTYPES
 
 
@@ -247,6 +249,196 @@ def test_laps_aligned_consistency(year, round_):
     pd.testing.assert_frame_equal(laps_data, laps_data_ref)
 
 
+def _laps_data_driver_reference(driver_raw, drv):
+    # original implementation of the laps data parser, which iterates over
+    # the data twice; the first pass finds the start times of all laps so
+    # that a pit out time shortly before the start of a lap can be added to
+    # that lap
+    empty_vals = _api.EMPTY_LAPS
+    lapcnt = 0
+    api_lapcnt = 0
+    in_past = False
+    out_of_pit = False
+
+    drv_data = {key: [val, ] for key, val in empty_vals.items()}
+
+    for time, resp in driver_raw:
+        if (in_past and 'NumberOfLaps' in resp
+                and resp['NumberOfLaps'] == api_lapcnt):
+            in_past = False
+        if 'NumberOfLaps' in resp and resp['NumberOfLaps'] < api_lapcnt:
+            in_past = True
+            continue
+        if in_past:
+            continue
+
+        if ('InPit' in resp) and (resp['InPit'] is False):
+            out_of_pit = True
+
+        if 'NumberOfLaps' in resp and resp['NumberOfLaps'] > api_lapcnt:
+            api_lapcnt += 1
+            if out_of_pit:
+                drv_data['Time'][lapcnt] = to_timedelta(time)
+                lapcnt += 1
+                for key, val in empty_vals.items():
+                    drv_data[key].append(val)
+
+    lapcnt = 0
+    api_lapcnt = 0
+    in_past = False
+    personal_best_lap_times = []
+    session_split_times = [datetime.timedelta(0)]
+    pitstops = -1
+
+    for time, resp in driver_raw:
+        if (in_past and 'NumberOfLaps' in resp
+                and resp['NumberOfLaps'] == api_lapcnt):
+            in_past = False
+        if in_past or ('NumberOfLaps' in resp
+                       and resp['NumberOfLaps'] < api_lapcnt):
+            in_past = True
+            continue
+
+        lap_offset = 0
+        if ((lapcnt > 0) and (to_timedelta(time) - drv_data['Time'][lapcnt - 1]
+                              < pd.Timedelta(5, 's'))):
+            lap_offset = 1
+
+        if 'Sectors' in resp and isinstance(resp['Sectors'], dict):
+            for sn, sector, sesst in (
+                    ('0', 'Sector1Time', 'Sector1SessionTime'),
+                    ('1', 'Sector2Time', 'Sector2SessionTime'),
+                    ('2', 'Sector3Time', 'Sector3SessionTime')):
+                if val := recursive_dict_get(resp, 'Sectors', sn, 'Value'):
+                    drv_data[sector][lapcnt - lap_offset] = to_timedelta(val)
+                    drv_data[sesst][lapcnt - lap_offset] = to_timedelta(time)
+
+        if ((last_lap_time := resp.get('LastLapTime'))
+                and (val := last_lap_time.get('Value')) is not None):
+            val = to_timedelta(val)
+            if (val is None) or (val.total_seconds() < 150):
+                drv_data['LapTime'][lapcnt - lap_offset] = val
+
+        if 'Speeds' in resp:
+            for trapkey, trapname in (('I1', 'SpeedI1'), ('I2', 'SpeedI2'),
+                                      ('FL', 'SpeedFL'), ('ST', 'SpeedST')):
+                if val := recursive_dict_get(resp, 'Speeds', trapkey,
+                                             'Value'):
+                    if trapkey == 'ST':
+                        drv_data[trapname][lapcnt] = float(val)
+                    else:
+                        drv_data[trapname][lapcnt - lap_offset] = float(val)
+
+        if 'InPit' in resp:
+            if resp['InPit'] is True:
+                if pitstops >= 0:
+                    drv_data['PitInTime'][lapcnt] = to_timedelta(time)
+            elif ((('NumberOfLaps' in resp)
+                   and resp['NumberOfLaps'] > api_lapcnt)
+                  or (drv_data['Time'][lapcnt] - to_timedelta(time))
+                  < pd.Timedelta(5, 's')):
+                drv_data['PitOutTime'][lapcnt + 1] = to_timedelta(time)
+                pitstops += 1
+            else:
+                drv_data['PitOutTime'][lapcnt] = to_timedelta(time)
+                pitstops += 1
+
+        if val := recursive_dict_get(resp, 'BestLapTime', 'Value'):
+            personal_best_lap_times.append(
+                (to_timedelta(time), to_timedelta(val))
+            )
+
+        if (val := resp.get('BestLapTimes')) and isinstance(val, dict):
+            session_n = int(list(val.keys())[0])
+            if (session_n + 1) > len(session_split_times):
+                session_split_times.append(to_timedelta(time))
+
+        if 'NumberOfLaps' in resp and resp['NumberOfLaps'] > api_lapcnt:
+            api_lapcnt += 1
+            if pitstops >= 0:
+                drv_data['Time'][lapcnt] = to_timedelta(time)
+                drv_data['NumberOfLaps'][lapcnt] = lapcnt + 1
+                drv_data['NumberOfPitStops'][lapcnt] = pitstops
+                drv_data['Driver'][lapcnt] = drv
+                lapcnt += 1
+
+    return _api._finalize_laps_data_driver(
+        drv_data, lapcnt, pitstops, personal_best_lap_times,
+        session_split_times, drv
+    )
+
+
+def _stream_data_driver_reference(driver_raw, drv):
+    # original implementation of the timing stream parser
+    empty_vals = _api.EMPTY_STREAM
+    drv_data = {key: [val, ] for key, val in empty_vals.items()}
+    i = 0
+
+    for time, resp in driver_raw:
+        new_entry = False
+        if val := recursive_dict_get(resp, 'Position'):
+            drv_data['Position'][i] = int(val)
+            new_entry = True
+        if val := recursive_dict_get(resp, 'GapToLeader'):
+            drv_data['GapToLeader'][i] = val
+            new_entry = True
+        if val := recursive_dict_get(resp, 'IntervalToPositionAhead',
+                                     'Value'):
+            drv_data['IntervalToPositionAhead'][i] = val
+            new_entry = True
+
+        if new_entry:
+            drv_data['Time'][i] = to_timedelta(time)
+            drv_data['Driver'][i] = drv
+            i += 1
+            for key in empty_vals:
+                drv_data[key].append(drv_data[key][-1])
+
+    for key in drv_data:
+        drv_data[key] = drv_data[key][:-1]
+
+    return drv_data
+
+
+@pytest.mark.parametrize(
+    'year, round_, session_name',
+    (
+        (2020, 15, 'R'),
+        (2023, 1, 'R'),
+        (2024, 4, 'R'),
+        (2024, 5, 'SQ'),
+    )
+)
+def test_timing_data_driver_recorded_sessions(year, round_, session_name):
+    # The single pass parser needs to return the same laps data and stream
+    # data for recorded sessions as the original two pass implementation.
+    session = fastf1.get_session(year, round_, session_name)
+    response = _api.fetch_page(session.api_path, 'timing_data')
+
+    resp_per_driver = {}
+    for entry in response:
+        if (len(entry) < 2) or 'Lines' not in entry[1]:
+            continue
+        for drv, data in entry[1]['Lines'].items():
+            resp_per_driver.setdefault(drv, []).append((entry[0], data))
+
+    assert resp_per_driver
+    for drv, driver_raw in resp_per_driver.items():
+        laps, split_times, stream = _api._timing_data_driver(driver_raw, drv)
+        ref_laps, ref_split_times \
+            = _laps_data_driver_reference(driver_raw, drv)
+        ref_stream = _stream_data_driver_reference(driver_raw, drv)
+
+        assert split_times == ref_split_times
+        if ref_laps is None:
+            assert laps is None
+        else:
+            pd.testing.assert_frame_equal(pd.DataFrame(laps),
+                                          pd.DataFrame(ref_laps))
+        pd.testing.assert_frame_equal(pd.DataFrame(stream),
+                                      pd.DataFrame(ref_stream))
+
+
 def test_explicitly_missing_lap_times_calculated():
     # Russel had transponder issues in bahrain 2025, which caused the timing
     # problems. Two lap times were missing but the source explicitly indicated
@@ -1,4 +1,5 @@
 import datetime
+import types
 
 import numpy as np
 import pandas
@@ -162,6 +163,33 @@ def test_laps_get_telemetry_non_default_frequency(reference_laps_data):
             == pd.Timedelta(0.1, 'seconds'))
 
 
+def test_laps_get_telemetry_batch(reference_laps_data):
+    session, laps = reference_laps_data
+    drv_laps = laps.pick_drivers(['BOT', 'HAM']).pick_laps(range(10, 13))
+
+    tel_dict = drv_laps.get_telemetry_batch(frequency='original',
+                                            as_dict=True)
+    assert len(tel_dict) == 6
+    for _, lap in drv_laps.iterrows():
+        tel = tel_dict[(lap['DriverNumber'], lap['LapNumber'])]
+        ref = lap.get_telemetry(frequency='original')
+        assert tel.shape == ref.shape
+        assert list(tel.columns) == list(ref.columns)
+        assert (tel['SessionTime'].to_numpy()
+                == ref['SessionTime'].to_numpy()).all()
+        # car data samples are not interpolated and need to match exactly
+        is_car = (ref['Source'] == 'car').to_numpy()
+        for col in ('Speed', 'RPM', 'Distance', 'RelativeDistance'):
+            assert np.allclose(tel[col].to_numpy()[is_car],
+                               ref[col].to_numpy()[is_car])
+
+    tel = drv_laps.get_telemetry_batch(driver_ahead=False)
+    assert isinstance(tel, fastf1.core.Telemetry)
+    assert 'DriverAhead' not in tel.columns
+    assert len(tel.loc[:, ('DriverNumber', 'LapNumber')]
+               .drop_duplicates()) == 6
+
+
 def test_laps_get_weather_data(reference_laps_data):
     session, laps = reference_laps_data
     wd = laps.get_weather_data()
@@ -181,6 +209,30 @@ def test_laps_get_weather_data(reference_laps_data):
         assert col in wd.columns
 
 
+def test_laps_get_weather_data_selection():
+    weather_data = pd.DataFrame({
+        'Time': pd.to_timedelta([60, 120, 180, 240], unit='s'),
+        'AirTemp': [20.0, 21.0, 22.0, 23.0],
+        'WindDirection': [10, 20, 30, 40]
+    })
+    laps = fastf1.core.Laps({
+        'LapStartTime': pd.to_timedelta([50, 130, 190, np.nan, 10, 200],
+                                        unit='s'),
+        'Time': pd.to_timedelta([130, 170, 250, 230, 20, np.nan], unit='s')
+    })
+    laps.session = types.SimpleNamespace(weather_data=weather_data)
+
+    wd = laps.get_weather_data()
+    # first value within the lap, else last value before the end of the lap
+    assert wd['AirTemp'].iloc[:4].to_list() == [20.0, 21.0, 23.0, 22.0]
+    assert wd.index[:4].to_list() == [0, 1, 3, 2]
+    # no weather data for the last two laps
+    assert wd.iloc[4:].isna().all().all()
+
+    wd = laps.iloc[:4].get_weather_data()
+    assert (wd.dtypes == weather_data.dtypes).all()
+
+
 def test_lap_get_car_data(reference_laps_data):
     session, laps = reference_laps_data
     drv_laps = laps.pick_fastest()
@@ -0,0 +1,93 @@
+import numpy as np
+
+from fastf1.legacy import _closest_driver_ahead
+
+
+def _closest_driver_ahead_t_matrix(reference_s, total_s, dmap, pit_mask,
+                                   drivers_list):
+    # original implementation, which uses a matrix of the relative distances
+    # between all points of the reference lap
+    ssize = len(reference_s)
+    t_matrix = np.empty((ssize, ssize))
+    for index in range(ssize):
+        rref = reference_s - reference_s[index]
+        rref[rref <= 0] = total_s + rref[rref <= 0]
+        t_matrix[index, :] = rref
+
+    distance = np.empty(dmap.shape)
+    driver = np.empty(dmap.shape, dtype=object)
+    stream_axis = np.arange(len(dmap))
+    for my_di in range(len(drivers_list)):
+        rel_distance = np.empty(np.shape(dmap))
+        for his_di in range(len(drivers_list)):
+            rel_distance[:, his_di] = t_matrix[dmap[:, my_di],
+                                               dmap[:, his_di]]
+
+        his_in_pit = ~pit_mask.copy()
+        his_in_pit[:, my_di] = False
+        my_in_pit = ~pit_mask[:, my_di]
+        rel_distance[his_in_pit] = np.nan
+
+        closest_index = np.nanargmin(rel_distance, axis=1)
+        closest_distance = rel_distance[stream_axis, closest_index]
+        closest_driver = drivers_list[closest_index].astype(object)
+        closest_distance[my_in_pit] = np.nan
+        closest_driver[my_in_pit] = None
+        distance[:, my_di] = closest_distance
+        driver[:, my_di] = closest_driver
+
+    return distance, driver
+
+
+def test_closest_driver_ahead():
+    reference_s = np.arange(100.0)
+    total_s = 100.0
+    drivers_list = np.array(["1", "16", "44", "55"])
+    dmap = np.array([[10, 20, 95, 50]] * 5)
+    pit_mask = np.array([
+        [True, True, True, True],
+        [True, False, True, True],  # '16' is in the pits
+        [False, True, True, True],  # '1' is in the pits
+        [False, False, True, False],  # only '44' is on track
+        [False, False, False, False],  # all cars are in the pits
+    ])
+
+    distance, driver = _closest_driver_ahead(reference_s, total_s, dmap,
+                                             pit_mask, drivers_list)
+
+    nan = np.nan
+    np.testing.assert_array_equal(distance, [
+        [10, 30, 15, 45],  # '44' is ahead of '55' across the finish line
+        [40, nan, 15, 45],
+        [nan, 30, 25, 45],
+        [nan, nan, 100, nan],  # a single car is one lap behind itself
+        [nan, nan, nan, nan],
+    ])
+    np.testing.assert_array_equal(driver, [
+        ["16", "55", "1", "44"],
+        ["55", None, "1", "44"],
+        [None, "55", "16", "44"],
+        [None, None, "44", None],
+        [None, None, None, None],
+    ])
+
+
+def test_closest_driver_ahead_same_as_t_matrix():
+    rng = np.random.default_rng(0)
+    reference_s = np.arange(0, 5000, 0.667)
+    total_s = 5000.2
+    drivers_list = np.array(["1", "4", "16", "44", "55", "63"])
+    dmap = rng.integers(0, len(reference_s), (50, len(drivers_list)))
+    dmap[:5, :2] = 0  # cars at the same position
+    pit_mask = rng.random(dmap.shape) < 0.8
+
+    expected = _closest_driver_ahead_t_matrix(reference_s, total_s, dmap,
+                                              pit_mask, drivers_list)
+    # uneven, exact and single chunk
+    for chunk_size in (7, 50, 2000):
+        distance, driver = _closest_driver_ahead(
+            reference_s, total_s, dmap, pit_mask, drivers_list,
+            chunk_size=chunk_size
+        )
+        np.testing.assert_array_equal(distance, expected[0])
+        np.testing.assert_array_equal(driver, expected[1])
@@ -1,3 +1,5 @@
+import types
+
 import numpy
 import pandas
 import pandas as pd
@@ -97,6 +99,20 @@ def test_dtypes_from_api(reference_laps_data):
         ensure_data_type(POS_DATA_DTYPES, session.pos_data[drv])
 
 
+def test_telemetry_created_on_first_access(reference_laps_data):
+    session, laps = reference_laps_data
+    drv = list(session.pos_data.keys())[0]
+    # position data is not used while loading; nothing is processed yet
+    assert all(tel is None for tel in session.pos_data._data.values())
+
+    pos = session.pos_data[drv]
+    assert isinstance(pos, fastf1.core.Telemetry)
+    assert session.pos_data[drv] is pos  # processed only once
+    assert sum(tel is not None for tel in session.pos_data._data.values()) \
+        == 1
+    ensure_data_type(POS_DATA_DTYPES, pos)
+
+
 def test_slice_by_time(reference_laps_data):
     session, laps = reference_laps_data
     drv = list(session.car_data.keys())[1]  # some driver
@@ -136,6 +152,40 @@ def test_slice_by_mask(reference_laps_data):
     assert slice2['SessionTime'].iloc[0] == test_data['SessionTime'].iloc[198]
 
 
+def test_slice_by_time_sorted_and_unsorted():
+    times = pandas.to_timedelta([0, 1, 2, 2, 3, 4, 5], unit='s')
+    tel = fastf1.core.Telemetry({'SessionTime': times,
+                                 'Speed': [0, 1, 2, 3, 4, 5, 6]})
+    t0 = pandas.Timedelta(2, 's')
+    t1 = pandas.Timedelta(3.5, 's')
+
+    assert tel.slice_by_time(t0, t1)['Speed'].to_list() == [2, 3, 4]
+    assert tel.slice_by_time(t0, t1, pad=2, pad_side='before')[
+        'Speed'].to_list() == [0, 1, 2, 3, 4]
+    assert tel.slice_by_time(t0, t1, pad=5, pad_side='after')[
+        'Speed'].to_list() == [2, 3, 4, 5, 6]
+    assert tel.slice_by_time(t0, pandas.NaT).empty
+
+    # modified time values are taken into account
+    tel['SessionTime'] = times + pandas.Timedelta(1, 's')
+    assert tel.slice_by_time(t0, t1)['Speed'].to_list() == [1, 2, 3]
+
+    # unsorted data
+    tel['SessionTime'] = times[::-1]
+    assert tel.slice_by_time(t0, t1)['Speed'].to_list() == [2, 3, 4]
+
+    # data that is modified in place
+    tel['SessionTime'] = times
+    assert tel.slice_by_time(t0, t1)['Speed'].to_list() == [2, 3, 4]
+    tel.loc[6, 'SessionTime'] = pandas.Timedelta(2.5, 's')
+    assert tel.slice_by_time(t0, t1)['Speed'].to_list() == [2, 3, 4, 6]
+    tel.loc[6, 'SessionTime'] = times[6]
+    tel.loc[0, 'SessionTime'] = pandas.NaT
+    assert tel.slice_by_time(t0, t1)['Speed'].to_list() == [2, 3, 4]
+    assert tel.slice_by_time(pandas.Timedelta(0), t1)[
+        'Speed'].to_list() == [1, 2, 3, 4]
+
+
 def test_slice_by_lap(reference_laps_data):
     session, laps = reference_laps_data
     drv = list(session.car_data.keys())[1]  # some driver
@@ -212,6 +262,35 @@ def test_merging_10_hz(reference_laps_data):
     assert merged['SessionTime'].iloc[0] != pandas.Timedelta(0)
 
 
+def test_compact_dtypes():
+    session = fastf1.get_session(2020, "Italy", "R")
+    session.load(weather=False, messages=False, compact_dtypes=True)
+    lap = session.laps.pick_fastest()
+    car_data = lap.get_car_data()
+    pos_data = lap.get_pos_data()
+
+    compact = fastf1.core.Telemetry._COMPACT_COLUMNS
+    for tel in (car_data, pos_data):
+        for col in tel.columns:
+            if col in compact:
+                assert tel[col].dtype == compact[col]
+
+    for freq in ('original', 10):
+        merged = car_data.merge_channels(pos_data, frequency=freq)
+        for col in merged.columns:
+            if col in compact:
+                assert merged[col].dtype == compact[col]
+        assert not pandas.isnull(merged.to_numpy()).any()
+
+    # filling missing values adds a new category
+    merged = car_data.merge_channels(pos_data, frequency=10)
+    assert 'interpolation' in merged['Source'].cat.categories
+
+    telemetry = lap.get_telemetry()
+    assert telemetry['Speed'].dtype == 'float32'
+    assert telemetry['Source'].dtype == 'category'
+
+
 def test_drop_unknown_channels(caplog):
     fastf1.core.Telemetry.register_new_channel("test_keep", "discrete")
     data = {"Speed": [200, 202, 203],
@@ -299,6 +378,48 @@ def test_add_driver_ahead_resampled(reference_laps_data):
     assert test_data['DistanceToDriverAhead'].isnull().sum() <= 1
 
 
+def test_driver_ahead_same_as_integration(reference_laps_data, monkeypatch):
+    session, laps = reference_laps_data
+    test_laps = [laps.pick_fastest(),
+                 laps.pick_drivers('HAM').pick_laps(20).iloc[0]]
+    results = [lap.get_car_data().calculate_driver_ahead(
+        return_reference=True
+    ) for lap in test_laps]
+
+    # reference result from integrating the distance for each lap
+    monkeypatch.setattr(fastf1.core._DriverDistances, 'get_distances',
+                        lambda self, driver, t_start, t_end: None)
+    expected = [lap.get_car_data().calculate_driver_ahead(
+        return_reference=True
+    ) for lap in test_laps]
+
+    for result, reference in zip(results, expected):
+        drv_ahead, dist, ref_tel = result
+        assert (drv_ahead == reference[0]).all()
+        assert numpy.allclose(dist, reference[1], equal_nan=True)
+        pandas.testing.assert_frame_equal(ref_tel, reference[2])
+
+
+def test_find_driver_ahead():
+    drv_map = numpy.array(['1', '44', '16'], dtype=object)
+    own_dst = numpy.array([0.0, 10.0, 20.0, 30.0, 40.0])
+    other_dst = numpy.array([
+        [5.0, 2.0, numpy.nan],
+        [15.0, 12.0, 50.0],
+        [25.0, 12.0, 60.0],  # '44' does not move
+        [28.0, 35.0, 70.0],  # '1' is behind
+        [29.0, 36.0, numpy.nan],  # nobody ahead
+    ])
+    drv_ahead, dist = fastf1.core.Telemetry._find_driver_ahead(
+        drv_map, own_dst, other_dst
+    )
+    # the first sample is always ignored
+    assert list(drv_ahead) == ['', '44', '1', '44', '']
+    numpy.testing.assert_array_equal(
+        dist, [numpy.nan, 2.0, 5.0, 5.0, numpy.nan]
+    )
+
+
 def test_add_track_status(reference_laps_data):
     session, laps = reference_laps_data
 
@@ -314,6 +435,28 @@ def test_add_track_status(reference_laps_data):
     assert test_data['TrackStatus'].iloc[-1] == statuses.iloc[-1]
 
 
+def test_add_track_status_unsorted():
+    tel = create_sample_car_data()
+    t0 = tel['Date'].iloc[0]
+    tel.session = types.SimpleNamespace(
+        t0_date=t0,
+        track_status=pd.DataFrame({
+            'Time': pd.to_timedelta([1, 20, 40], unit='s'),
+            'Status': ['1', '2', '1']
+        })
+    )
+    tel = tel.sample(frac=1, random_state=0)
+
+    tel = tel.add_track_status()
+    session_time = (tel['Date'] - t0).dt.total_seconds()
+    expected = numpy.select(
+        [session_time < 1, session_time < 20, session_time < 40],
+        [None, '1', '2'],
+        default='1'
+    )
+    assert (tel['TrackStatus'].to_numpy() == expected).all()
+
+
 def create_sample_car_data():
     # create sample telemetry for testing the .add_* methods
     # which work with distance, only time and speed really needs
@@ -385,3 +528,187 @@ def test_add_relative_distance():
            car_data['RelativeDistance'].iloc[-1]
     assert car_data['RelativeDistance'].max() == 1.0
     assert car_data['RelativeDistance'].min() == 0.0
+
+
+def create_sample_pos_data():
+    # create sample position data with a time base that is offset from the
+    # sample car data
+    t0 = pandas.Timestamp(year=2020, month=5, day=7, hour=14)
+    dates = pandas.date_range(t0 + pandas.Timedelta(milliseconds=105),
+                              t0 + pandas.Timedelta(minutes=1),
+                              freq='233 ms')
+    angle = numpy.linspace(0, 2 * numpy.pi, len(dates))
+
+    tel = fastf1.core.Telemetry({
+        'Time': dates - t0, 'SessionTime': dates - t0, 'Date': dates,
+        'Source': 'pos', 'X': 5000 * numpy.cos(angle),
+        'Y': 3000 * numpy.sin(angle), 'Z': 100.0,
+        'Status': 'OnTrack'
+    })
+    return tel
+
+
+def create_merge_sample_data(compact):
+    t0 = pandas.Timestamp(year=2020, month=5, day=7, hour=14)
+    session = types.SimpleNamespace(t0_date=t0)
+    car_data = create_sample_car_data()
+    pos_data = create_sample_pos_data()
+    if compact:
+        compact_dtypes = fastf1.core.Telemetry._COMPACT_COLUMNS
+        car_data = car_data.astype(
+            {col: compact_dtypes[col] for col in ('Speed', 'nGear', 'Source')}
+        )
+        pos_data = pos_data.astype(
+            {col: compact_dtypes[col] for col in ('X', 'Status', 'Source')}
+        )
+    car_data.session = pos_data.session = session
+    car_data.driver = pos_data.driver = '1'
+    return car_data, pos_data
+
+
+@pytest.mark.parametrize("frequency", ['original', 3, 10])
+@pytest.mark.parametrize("compact", [False, True])
+def test_merge_channels_same_as_pandas(monkeypatch, compact, frequency):
+    car_data, pos_data = create_merge_sample_data(compact)
+
+    assert car_data._merge_channels_arrays(pos_data, frequency) is not None
+    merged = [pos_data.merge_channels(car_data, frequency=frequency),
+              car_data.merge_channels(pos_data, frequency=frequency)]
+
+    # reference result from the general implementation based on pandas
+    monkeypatch.setattr(fastf1.core.Telemetry, '_merge_channels_arrays',
+                        lambda self, other, frequency: None)
+    expected = [pos_data.merge_channels(car_data, frequency=frequency),
+                car_data.merge_channels(pos_data, frequency=frequency)]
+
+    for result, reference in zip(merged, expected):
+        assert isinstance(result, fastf1.core.Telemetry)
+        assert result.session is car_data.session
+        pandas.testing.assert_frame_equal(result, reference)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_resample_channels_same_as_merge(monkeypatch, compact):
+    car_data, pos_data = create_merge_sample_data(compact)
+    new_dates = pandas.Series(pandas.date_range(
+        car_data['Date'].iloc[0] - pandas.Timedelta(seconds=1),
+        car_data['Date'].iloc[-1] + pandas.Timedelta(seconds=1),
+        freq='77 ms'
+    ))
+    # some of the new dates exist in the data already
+    new_dates = pandas.concat([new_dates, car_data['Date'].iloc[::10]]) \
+        .drop_duplicates()
+
+    assert car_data._resample_channels_arrays(new_dates) is not None
+    resampled = [car_data.resample_channels(rule='100ms'),
+                 pos_data.resample_channels(rule='1s'),
+                 car_data.resample_channels(new_date_ref=new_dates)]
+
+    # reference result from merging with the new dates
+    monkeypatch.setattr(fastf1.core.Telemetry, '_resample_channels_arrays',
+                        lambda self, new_date_ref: None)
+    expected = [car_data.resample_channels(rule='100ms'),
+                pos_data.resample_channels(rule='1s'),
+                car_data.resample_channels(new_date_ref=new_dates)]
+
+    for result, reference in zip(resampled, expected):
+        assert isinstance(result, fastf1.core.Telemetry)
+        assert result.session is car_data.session
+        pandas.testing.assert_frame_equal(result, reference)
+
+
+def test_driver_distances_for_windows():
+    # the distances for multiple windows at once are the same as for each
+    # window individually
+    session = fastf1.core.Session.__new__(fastf1.core.Session)
+    drivers = ['1', '16', '44']
+    session._results = fastf1.core.SessionResults({'DriverNumber': drivers})
+    times = pandas.to_timedelta(numpy.arange(0, 60, 0.5), unit='s')
+    session._car_data = {}
+    laps = {'DriverNumber': [], 'LapNumber': [], 'LapStartTime': [],
+            'Time': []}
+    for i, drv in enumerate(drivers):
+        speed = 180 + 20 * i + 30 * numpy.sin(numpy.arange(len(times)) / 5)
+        tel = fastf1.core.Telemetry({'SessionTime': times, 'Speed': speed},
+                                    session=session, driver=drv)
+        if drv == '16':
+            tel.loc[40, 'Speed'] = numpy.nan  # unknown speed
+        if drv == '44':
+            tel = tel.drop(index=range(50, 55))  # missing samples
+        session._car_data[drv] = tel
+        for n in range(4):
+            laps['DriverNumber'].append(drv)
+            laps['LapNumber'].append(float(n + 1))
+            # the other drivers are slightly ahead on track
+            laps['LapStartTime'].append(pandas.Timedelta(seconds=15*n+2-i))
+            laps['Time'].append(pandas.Timedelta(seconds=15*(n+1)+2-i))
+    session._laps = fastf1.core.Laps(laps, session=session,
+                                     _force_default_cols=True)
+
+    distances = fastf1.core._DriverDistances(session)
+    # the first two windows share a sample, the last one starts separately
+    t_starts = pandas.to_timedelta([2, 17, 32.5], unit='s')
+    t_ends = pandas.to_timedelta([17, 32, 47], unit='s')
+    drv_map, rows, own_dst, other_dst, other_prev_dst = \
+        distances.get_window_distances('1', t_starts, t_ends)
+    drv_ahead, dist = fastf1.core.Telemetry._find_driver_ahead(
+        drv_map, own_dst, other_dst, other_prev_dst
+    )
+
+    expected = []
+    for t_start, t_end in zip(t_starts, t_ends):
+        window_map, window_own_dst, window_other_dst, (window_rows, _) = \
+            distances.get_distances('1', t_start, t_end)
+        assert list(window_map) == list(drv_map)
+        expected.append(pandas.DataFrame({
+            'row': numpy.arange(len(times))[window_rows],
+            'own': window_own_dst,
+            **dict(zip(drv_map, window_other_dst.T)),
+            **dict(zip(['drv_ahead', 'dist'], fastf1.core.Telemetry
+                       ._find_driver_ahead(window_map, window_own_dst,
+                                           window_other_dst)))
+        }))
+    expected = pandas.concat(expected).drop_duplicates(subset='row')
+
+    numpy.testing.assert_array_equal(rows, expected['row'])
+    numpy.testing.assert_array_equal(own_dst, expected['own'])
+    numpy.testing.assert_array_equal(other_dst, expected[list(drv_map)])
+    numpy.testing.assert_array_equal(drv_ahead, expected['drv_ahead'])
+    numpy.testing.assert_array_equal(dist, expected['dist'])
+
+
+def test_driver_distances_reset_on_car_data_change():
+    # the distances of all drivers are calculated again if the car data of
+    # a driver is replaced
+    session = fastf1.core.Session.__new__(fastf1.core.Session)
+    drivers = ['1', '44']
+    session._results = fastf1.core.SessionResults({'DriverNumber': drivers})
+    session._t0_date = pandas.Timestamp('2020-08-08T09:00')
+    times = pandas.to_timedelta(numpy.arange(0, 60, 0.5), unit='s')
+    raw_data = {
+        drv: pandas.DataFrame({'Time': times,
+                               'Date': session._t0_date + times,
+                               'Speed': speed})
+        for drv, speed in (('1', 200.0), ('44', 210.0))
+    }
+    session._car_data = fastf1.core._TelemetryMapping(session, raw_data)
+    session._laps = fastf1.core.Laps({
+        'DriverNumber': drivers,
+        'LapNumber': [1.0, 1.0],
+        'LapStartTime': pandas.to_timedelta([0, 0], unit='s'),
+        'Time': pandas.to_timedelta([60, 60], unit='s'),
+    }, session=session, _force_default_cols=True)
+
+    # '44' is faster and therefore ahead
+    tel = session.car_data['1'].add_driver_ahead()
+    assert (tel['DriverAhead'].iloc[1:] == '44').all()
+
+    # '44' is slower now and therefore behind
+    slower = session.car_data['44'].copy()
+    slower['Speed'] = 190.0
+    session.car_data['44'] = slower
+    tel = session.car_data['1'].add_driver_ahead()
+    assert (tel['DriverAhead'] == '').all()
+
+    del session.car_data['44']
+    assert session._driver_distances is None
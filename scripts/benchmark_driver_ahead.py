@@ -0,0 +1,89 @@
+"""Benchmark the cost of calculating the driver ahead per lap.
+
+By default, only the final stage of ``Telemetry.calculate_driver_ahead`` is
+benchmarked. It determines the driver ahead from the distance of all
+drivers and runs on synthetic data of the size of a typical lap, so no data
+needs to be loaded.
+
+Optionally, the complete calculation can be benchmarked for the laps of a
+real session, which is loaded using the cache directory that is configured
+for FastF1::
+
+    python scripts/benchmark_driver_ahead.py
+    python scripts/benchmark_driver_ahead.py --session 2023 Monza R
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+import fastf1
+from fastf1.core import Telemetry
+
+
+def benchmark_kernel(n_samples: int, n_drivers: int, repeat: int):
+    rng = np.random.default_rng(0)
+    # distance of all drivers on a common timeline, with a few missing
+    # samples as they occur when the timelines of the drivers differ
+    speed = rng.uniform(20, 90, (n_samples, n_drivers))
+    distance = np.cumsum(speed * 0.27, axis=0) \
+        + rng.uniform(-2000, 2000, n_drivers)
+    distance[rng.random(distance.shape) < 0.02] = np.nan
+    drv_map = np.array([str(drv) for drv in range(1, n_drivers)],
+                       dtype=object)
+
+    def run():
+        Telemetry._find_driver_ahead(drv_map, distance[:, 0],
+                                     distance[:, 1:].copy())
+
+    seconds = min(timeit.repeat(run, number=20, repeat=repeat)) / 20
+    print(f"driver ahead from distance ({n_samples} samples, "
+          f"{n_drivers} drivers): {seconds * 1000:.3f} ms per lap")
+
+
+def benchmark_session(year: int, event: str, identifier: str,
+                      n_laps: int, repeat: int):
+    session = fastf1.get_session(year, event, identifier)
+    session.load(weather=False, messages=False)
+    laps = session.laps.pick_wo_box().iloc[:n_laps]
+    car_data = [lap.get_car_data() for _, lap in laps.iterlaps()]
+
+    # the first call includes the integration of the distance of all
+    # drivers, which is done once per session
+    first = timeit.timeit(lambda: car_data[0].calculate_driver_ahead(),
+                          number=1)
+    print(f"first call (including integration): {first * 1000:.3f} ms")
+
+    def run():
+        for tel in car_data:
+            tel.calculate_driver_ahead()
+
+    seconds = min(timeit.repeat(run, number=1, repeat=repeat)) \
+        / len(car_data)
+    print(f"calculate_driver_ahead ({len(car_data)} laps): "
+          f"{seconds * 1000:.3f} ms per lap")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=400,
+                        help="samples per lap for the synthetic data")
+    parser.add_argument("--drivers", type=int, default=20,
+                        help="number of drivers for the synthetic data")
+    parser.add_argument("--session", nargs=3,
+                        metavar=("YEAR", "EVENT", "SESSION"),
+                        help="additionally benchmark a real session")
+    parser.add_argument("--laps", type=int, default=50,
+                        help="number of laps of the real session")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    benchmark_kernel(args.samples, args.drivers, args.repeat)
+    if args.session:
+        year, event, identifier = args.session
+        benchmark_session(int(year), event, identifier, args.laps,
+                          args.repeat)
+
+
+if __name__ == "__main__":
+    main()